@@ -468,8 +468,8 @@ def main() -> int:
     arguments: Tuple[str, ...] = tuple(sys.argv[1:])
     if "--unit-test" in arguments:
         # For now hand provide the list of files to generte documentation for.:
-        arguments = ("Doc.py", "FabBOM.py", "FabGeometries.py", "FabJoins.py", "FabNodes.py",
-                     "FabProjects.py", "FabShops.py", "FabSolids.py", "FabTools.py",
+        arguments = ("Doc.py", "FabBOM.py", "FabGCodes.py", "FabGeometries.py", "FabJoins.py",
+                     "FabNodes.py", "FabProjects.py", "FabShops.py", "FabSolids.py", "FabTools.py",
                      "FabUtilities.py", "TarSync.py", "Test.py", "__init__.py")
 
     try:
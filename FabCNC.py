@@ -16,6 +16,46 @@ FLAGS="c" JSON="/tmp/TestProject.json" ./freecad19 -c ./CQtoFC.py
 Where `FLAGS="..."` sets the `FLAGS` environment variable and `JSON="..."` sets the `JSON`
 environment variable for just one execution of the freecad19 python interpreter in -c
 (console mode).  The `CQtoFC.py` file is this program.
+
+The FreeCAD documents in a project are independent of one another.  When the `JOBS`
+environment variable is greater than 1 (console mode only), the project JSON file is split
+into one JSON file per Document and a separate FreeCAD worker process (selected by the
+`FREECAD` environment variable) is run for each one, with up to `JOBS` workers at a time.
+Each worker writes a small manifest of the `.FCStd` and `.ngc` files that it produced and
+these are merged into one report when all of the workers are done.
+
+When `FLAGS` contains "i" (incremental), each saved `Document.FCStd` file gets a companion
+`Document.FCStd.json` file that records a hash of each Solid JSON subtree (which covers the
+STEP file hashes and all operation properties), the FreeCAD objects created for it, and its
+`.ngc` files.  On the next run the previous document is reopened, unchanged Solids are skipped
+(their `.ngc` files are copied into the current output directory), and only the objects (STEP
+import, link, jobs and operations) of changed or deleted Solids are recreated.
+
+Output files go into the directory selected by the `OUTPUT` environment variable (default:
+the directory that contains the JSON file) and shared caches go under the `CACHE` environment
+variable (default: `/tmp`).  A FabProject run with a FabWorkspace provides both (see
+FabWorkspace.getEnvironment()), so concurrent runs on one build host use separate output
+directories while still sharing the G-code cache.
+
+The post-processed G-code of each job is cached in `CACHE/ngc_cache` under a hash of the
+job's Mount JSON (which contains all of its operations), the STEP file contents, the tool
+controllers, and the post-processor arguments.  An unchanged job copies the cached `.ngc`
+file rather than running the post-processor again.
+
+Tracing is off by default.  The `TRACE` environment variable selects a trace level
+(1=document summary, 2=full call tracing) and `TRACE_FILE` selects the trace file
+(default `cnc.trace` in `OUTPUT`, or `/tmp` when `OUTPUT` is not set).  Trace lines are
+buffered and written when the buffer fills up, at exit, or when an error occurs.  Parallel
+workers each write to `TRACE_FILE.<Document>`.
+
+The temporary `Tools/Bit/Bit###_*.fctb` files are kept between runs.  A content hash index
+(`Tools/Bit/.fab_bit_cache.json`) records each bit file's hash and parsed attributes, so a
+bit file is only rewritten when its JSON changes and is never re-read and re-parsed.
+
+The project JSON file is streamed rather than loaded all at once.  The Project, Document, and
+Assembly nodes are read one at a time, and each Solid is read (with its Mounts and operations)
+as a unit.  Each node is validated once against a precompiled schema as it is read and is then
+processed immediately, so the STEP imports start before the rest of the file has been read.
 """
 
 # <--------------------------------------- 100 characters ---------------------------------------> #
@@ -43,7 +83,8 @@ if sys.executable == SHARP_EXEC_PATH:
         "/home/wayne/.local/lib/python3.8/site-packages",
     ]
 
-from typing import Any, cast, List, Dict, IO, Optional, Set, Tuple, Union
+from typing import Any, Callable, cast, List, Dict, IO, Optional, Set, Tuple
+from typing import Union
 from pathlib import Path as FilePath  # The Path library uses `Path`, hence `FilePath`
 
 # Uncomment these lines to fire up the debugger:
@@ -51,11 +92,20 @@ from pathlib import Path as FilePath  # The Path library uses `Path`, hence `Fil
 # pudb.start()  # Start it right now:
 
 # Standard Python library imports:
+import atexit
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+import hashlib
 import json
 import os
+import shutil
+import subprocess
+import time
 # from pathlib import Path as PathFile
 
+# Fab imports that do not need FreeCAD:
+from FabJsonNodes import Fab_JsonNodeReader
+
 # Generic FreeCAD imports.  Note these imports add a long list of Python packages to `sys.path`.
 import FreeCAD  # type: ignore
 import FreeCADGui  # type: ignore
@@ -98,13 +148,196 @@ else:
     from FreeCAD import Import as FCImport  # type: ignore
 
 
-trace_file: IO[str] = open("/tmp/cnc.trace", "w")
+# Fab_TraceLog:
+@dataclass
+class Fab_TraceLog(object):
+    """Fab_TraceLog: A buffered, level based trace log.
+
+    Trace lines are buffered in memory and written out when the buffer fills up, at exit,
+    or when *flush* is called after an error.  With a *Level* of 0 (the default) nothing
+    is logged and the trace file is never created.
+
+    Attributes:
+    * *Path* (str): The trace file path.
+    * *Level* (int): 0=off, 1=document summary, 2=full call tracing.
+    * *BufferSize* (int): The number of lines buffered before they are written out.
 
+    """
 
-def trace(line: str) -> None:
+    Path: str = "/tmp/cnc.trace"
+    Level: int = 0
+    BufferSize: int = 1000
+    Lines: List[str] = field(init=False, repr=False)
+    File: Optional[IO[str]] = field(init=False, repr=False)
+
+    # Fab_TraceLog.__post_init__():
+    def __post_init__(self) -> None:
+        """Initialize Fab_TraceLog."""
+        self.Lines = []
+        self.File = None
+        atexit.register(self.flush)
+
+    # Fab_TraceLog.log():
+    def log(self, line: Union[str, Callable[[], str]], level: int = 1) -> None:
+        """Buffer a trace line (or a callable that lazily formats one) at a trace level."""
+        if self.Level >= level:
+            self.Lines.append(line() if callable(line) else line)
+            if len(self.Lines) >= self.BufferSize:
+                self.flush()
+
+    # Fab_TraceLog.flush():
+    def flush(self) -> None:
+        """Write out any buffered trace lines."""
+        if self.Lines:
+            if self.File is None:
+                self.File = open(self.Path, "w")
+            self.File.write("\n".join(self.Lines) + "\n")
+            self.File.flush()
+            self.Lines = []
+
+
+trace_log: Fab_TraceLog = Fab_TraceLog(
+    os.environ.get("TRACE_FILE", "") or
+    str(FilePath(os.environ.get("OUTPUT", "") or "/tmp") / "cnc.trace"),
+    int(os.environ.get("TRACE", "0")))
+
+
+def trace(line: Union[str, Callable[[], str]], level: int = 1) -> None:
     """Log a trace line."""
-    trace_file.write(f"{line}\n")
-    trace_file.flush()
+    trace_log.log(line, level)
+
+
+# Fab_BitCache:
+@dataclass
+class Fab_BitCache(object):
+    """Fab_BitCache: A content hashed cache of the temporary tool bit files.
+
+    Rewriting a bit file that has not changed invalidates FreeCAD's own caching, so a bit
+    file is only written when the hash of its JSON text differs from the recorded hash.
+    The parsed bit attributes are recorded along with the hash so that they can be reused
+    without re-reading the bit file.  An entry is only trusted while the modification time
+    of its bit file is unchanged.
+
+    Attributes:
+    * *BitDirectory* (FilePath): The `Tools/Bit` directory.
+    * *Entries* (Dict[str, Dict[str, Any]]): Bit file name => {"Hash", "MTime", "Attrs"}.
+    * *Writes* (int): The number of bit files written.
+    * *Reuses* (int): The number of bit files that did not need to be written.
+
+    Constructor:
+    * Fab_BitCache(BitDirectory)
+
+    """
+
+    BitDirectory: FilePath
+    Entries: Dict[str, Dict[str, Any]] = field(init=False, repr=False)
+    Writes: int = field(init=False, repr=False)
+    Reuses: int = field(init=False, repr=False)
+
+    # Fab_BitCache.__post_init__():
+    def __post_init__(self) -> None:
+        """Initialize Fab_BitCache."""
+        self.Entries = self.load()
+        self.Writes = 0
+        self.Reuses = 0
+
+    # Fab_BitCache.IndexPath:
+    @property
+    def IndexPath(self) -> FilePath:
+        """Return the cache index file path."""
+        return self.BitDirectory / ".fab_bit_cache.json"
+
+    # Fab_BitCache.load():
+    def load(self) -> Dict[str, Dict[str, Any]]:
+        """Return the cache index entries (empty if missing or unreadable)."""
+        entries: Dict[str, Dict[str, Any]] = {}
+        if self.IndexPath.exists():
+            index_file: IO[str]
+            try:
+                with open(self.IndexPath, "r") as index_file:
+                    entries = cast(Dict[str, Dict[str, Any]], json.load(index_file))
+            except (OSError, ValueError):
+                entries = {}  # A damaged index just means the bit files get rewritten.
+        return entries
+
+    # Fab_BitCache.lookup():
+    def lookup(self, file_name: str) -> Optional[Dict[str, Any]]:
+        """Return the entry for a bit file if it is still valid."""
+        entry: Optional[Dict[str, Any]] = self.Entries.get(file_name)
+        bit_path: FilePath = self.BitDirectory / file_name
+        if entry is not None and bit_path.exists() and (
+                bit_path.stat().st_mtime_ns == entry["MTime"]):
+            return entry
+        return None
+
+    # Fab_BitCache.write():
+    def write(self, file_name: str, bit_dict: Dict[str, Any]) -> bool:
+        """Write a bit file if its contents changed and return True if it was written."""
+        bit_json_text: str = json.dumps(bit_dict, sort_keys=True, indent=2)
+        bit_hash: str = hashlib.sha256(bit_json_text.encode("utf-8")).hexdigest()
+        entry: Optional[Dict[str, Any]] = self.lookup(file_name)
+        if entry is not None and entry["Hash"] == bit_hash:
+            self.Reuses += 1
+            return False
+
+        # Parallel workers can write the same bit file, so write it atomically:
+        bit_path: FilePath = self.BitDirectory / file_name
+        temporary_path: FilePath = self.BitDirectory / f".{file_name}.{os.getpid()}"
+        bit_file: IO[str]
+        with open(temporary_path, "w") as bit_file:
+            bit_file.write(bit_json_text)
+        os.replace(temporary_path, bit_path)
+        self.Entries[file_name] = {
+            "Hash": bit_hash, "MTime": bit_path.stat().st_mtime_ns, "Attrs": bit_dict}
+        self.Writes += 1
+        return True
+
+    # Fab_BitCache.read():
+    def read(self, file_name: str) -> Any:
+        """Return the parsed attributes of a bit file."""
+        entry: Optional[Dict[str, Any]] = self.lookup(file_name)
+        if entry is not None:
+            return entry["Attrs"]
+        bit_path: FilePath = self.BitDirectory / file_name
+        if not bit_path.exists():
+            raise RuntimeError(f"{str(bit_path)} file does not exist")
+        bit_file: IO[str]
+        with open(bit_path, "r") as bit_file:
+            return json.loads(bit_file.read())
+
+    # Fab_BitCache.save():
+    def save(self) -> None:
+        """Save the cache index, merging in entries saved by any other worker."""
+        if self.Writes:
+            entries: Dict[str, Dict[str, Any]] = self.load()
+            entries.update(self.Entries)
+            temporary_path: FilePath = self.IndexPath.with_suffix(f".{os.getpid()}")
+            index_file: IO[str]
+            with open(temporary_path, "w") as index_file:
+                json.dump(entries, index_file, sort_keys=True)
+            os.replace(temporary_path, self.IndexPath)
+
+
+# Fab_PropertySetter:
+@dataclass(frozen=True)
+class Fab_PropertySetter(object):
+    """Fab_PropertySetter: One precompiled JSON value to Path operation property transfer.
+
+    Attributes:
+    * *Name* (str): The Path operation property name.
+    * *JsonKey* (str): The JSON key (i.e. *Name* with a preceding "_").
+    * *Type* (type): The type that the JSON value must have.
+    * *Enumerations* (Tuple[str, ...]): The allowed values of an enumeration property (or ().)
+
+    Constructor:
+    * Fab_PropertySetter(Name, JsonKey, Type, Enumerations)
+
+    """
+
+    Name: str
+    JsonKey: str
+    Type: type
+    Enumerations: Tuple[str, ...]
 
 
 # FabCQtoFC:
@@ -115,17 +348,33 @@ class FabCQtoFC(object):
     JsonPath: FilePath
     ToolsPath: Optional[FilePath]
     CNC: bool
+    StepsLabel: str = "Step_Files"  # Parallel workers each need a distinct steps document.
+    Incremental: bool = False  # Reuse unchanged Solids from the previous document.
+    GCodeCachePath: FilePath = FilePath("/tmp/ngc_cache")  # Post-processed `.ngc` files.
+    OutputDirectory: FilePath = FilePath("/tmp")  # Generated .ngc and debug files.
     AllDocuments: List[Any] = field(init=False, repr=False)
+    OutputFiles: List[str] = field(init=False, repr=False)  # Generated .FCStd/.ngc files
     BitsTable: Dict[int, str] = field(init=False, repr=False)  # Bit# => str
+    BitCache: Optional[Fab_BitCache] = field(init=False, repr=False)
     CurrentGroup: Any = field(init=False, repr=False)
     CurrentJob: Any = field(init=False, repr=False)
     CurrentJobName: Any = field(init=False, repr=False)
+    CurrentJobCachePath: Optional[FilePath] = field(init=False, repr=False)  # Cached `.ngc`
     CurrentSolid: Any = field(init=False, repr=False)
     CurrentSolidName: Any = field(init=False, repr=False)
+    CurrentStepHash: str = field(init=False, repr=False)  # sha256 of the Solid STEP file
+    GCodeCacheHits: int = field(init=False, repr=False)
+    GCodeCacheMisses: int = field(init=False, repr=False)
+    # Incremental state per document label:
+    # {"Hashes": {solid: hash}, "Objects": {solid: names}, "GCodes": {solid: ngc_paths}}
+    DocumentStates: Dict[str, Dict[str, Dict[str, Any]]] = field(init=False, repr=False)
+    PreviousStates: Dict[str, Dict[str, Dict[str, Any]]] = field(init=False, repr=False)
     CurrentLink: Any = field(init=False, repr=False)
     CurrentNormal: Any = field(init=False, repr=False)
     PendingLinks: List[Tuple[Any, Any]] = field(init=False, repr=False)
     ProjectDocument: Any = field(init=False, repr=False)
+    # Operation kind (e.g. "Pocket") => precompiled property setters (see verify_properties()):
+    PropertyTables: Dict[str, Tuple[Fab_PropertySetter, ...]] = field(init=False, repr=False)
     StepsDocument: Any = field(init=False, repr=False)
     ToolControllersTable: Dict[int, Any] = field(init=False, repr=False)  # Ctl# => controller
     ToolNumbersTable: Dict[int, Any] = field(init=False, repr=False)  # Tool# => tool
@@ -136,17 +385,25 @@ class FabCQtoFC(object):
         """Initialize FabCQtoFC."""
         assert isinstance(self.JsonPath, FilePath), self.JsonPath
         self.AllDocuments = []
+        self.OutputFiles = []
         self.BitsTable = {}
+        self.BitCache = Fab_BitCache(self.ToolsPath / "Bit") if self.ToolsPath else None
         self.CurrentGroup = None
         self.CurrentJob = None
         self.CurrentJobName = None
+        self.CurrentJobCachePath = None
         self.CurrentLink = None
         self.CurrentNormal = None
         self.CurrentSolid = None
         self.CurrentSolidName = None
+        self.CurrentStepHash = ""
+        self.GCodeCacheHits = 0
+        self.GCodeCacheMisses = 0
+        self.DocumentStates = {}
+        self.PreviousStates = {}
         self.PendingLinks = []
         self.ProjectDocument = None
-        self.ProperitiesVerified = False
+        self.PropertyTables = {}
         self.StepsDocument = None
         self.ToolControllersTable = {}
         self.ToolNumbersTable = {}
@@ -158,18 +415,9 @@ class FabCQtoFC(object):
         bit_name: str = self.BitsTable[bit_index]
         tools_table: Dict[str, Any] = self.ToolsTable
         if bit_name not in tools_table:
-            # Create the *bit_path* file name and verify that it exists:
-            assert isinstance(self.ToolsPath, FilePath), f"{type(self.ToolsPath)=}"
-            bit_directory: FilePath = self.ToolsPath / "Bit"
-            bit_path: FilePath = bit_directory / bit_name
-            if not bit_path.exists():
-                raise RuntimeError(f"{str(bit_path)} file does not exist")
-
-            # Read *bit_path* contents in and convert into *bit_json*:
-            bit_file: IO[str]
-            with open(bit_path, "r") as bit_file:
-                bit_text: str = bit_file.read()
-            bit_json: Any = json.loads(bit_text)
+            # Fetch the parsed *bit_json* from the bit cache (which reads it only if needed):
+            assert isinstance(self.BitCache, Fab_BitCache), f"{type(self.BitCache)=}"
+            bit_json: Any = self.BitCache.read(bit_name)
 
             # Convert *bit_json* into *tool* and save it:
             tool: Any = PathToolBit.Factory.CreateFromAttrs(bit_json, bit_name)
@@ -206,11 +454,9 @@ class FabCQtoFC(object):
             bit_directory: FilePath = tools_path / "Bit"
             assert bit_directory.exists()
             prefix_bit_name: str = f"Bit{bit_index:03d}_{bit_name}.fctb"
-            bit_file_path: FilePath = bit_directory / prefix_bit_name
-            bit_file: IO[str]
-            bit_json_text: str = json.dumps(bit_dict, sort_keys=True, indent=2)
-            with open(bit_file_path, "w") as bit_file:
-                bit_file.write(bit_json_text)
+            assert isinstance(self.BitCache, Fab_BitCache), f"{type(self.BitCache)=}"
+            if self.BitCache.write(prefix_bit_name, bit_dict) and tracing:
+                trace(f"{tracing}Wrote {str(bit_directory / prefix_bit_name)}")
             bits_table[bit_index] = prefix_bit_name
 
         tool_controller_index = cast(
@@ -331,38 +577,137 @@ class FabCQtoFC(object):
                         current_tool_number = tool_controller.ToolNumber
                 post_list.append(operation)
 
-            # Generate the gcode and output it to *gcode_path*:
-            gcode_path = f"/tmp/{job_name}.ngc"
+            # Generate the gcode, output it to *gcode_path* and save a copy in the G-code cache
+            # (process_mount() already reused the cached copy on a cache hit):
+            gcode_path = str(self.OutputDirectory / f"{job_name}.ngc")
             post: Any = PathPostProcessor.PostProcessor.load(job.PostProcessor)
             post.export(post_list, gcode_path, job.PostProcessorArgs)
+            self.GCodeCacheMisses += 1
+            cache_path: Optional[FilePath] = self.CurrentJobCachePath
+            if cache_path is not None:
+                self.GCodeCachePath.mkdir(parents=True, exist_ok=True)
+                temporary_path: FilePath = cache_path.with_suffix(f".{os.getpid()}.tmp")
+                shutil.copyfile(gcode_path, temporary_path)
+                os.replace(temporary_path, cache_path)  # Atomic for parallel workers.
+            self.OutputFiles.append(gcode_path)
 
         self.CurrentJob = None
         self.CurrentJobName = None
+        self.CurrentJobCachePath = None
         if tracing:
             trace(f"{tracing}<=FabCQtoFC.flush_job()")
 
-    # CQtoPy.verify_properties():
-    def verify_properties(self, tracing: str = "") -> None:
-        """Verify that all of the properties match their associated 'info' dictionaries."""
-        # This method must be called after a document has been created.
+    # FabCQtoFC.reuse_gcodes():
+    def reuse_gcodes(self, gcode_paths: List[str], tracing: str = "") -> List[str]:
+        """Copy the `.ngc` files of a skipped Solid into the output directory and list them.
+
+        Arguments:
+        * *gcode_paths* (List[str]): The `.ngc` files from the previous run.
+
+        Returns:
+        * (List[str]): The `.ngc` files in the current output directory.
+
+        """
         if tracing:
-            trace(f"{tracing}=>CQtoPy.verify_properties()")
-
-        def match(label: str, properties: Set[str], infos: Set[str]) -> None:
-            """Match a properties with information set."""
-            if properties != infos:
-                trace(f"CQtoPy.verify_properties.match('{label}') <<<<<<<<<<<<<<<<:")
-                # trace(f"{sorted(properties)=}")
-                # trace(f"{sorted(infos)=}")
-                # print()
-                trace(f"{sorted(properties - infos)=}")
-                trace(f"{sorted(infos - properties)=}")
-                assert False
-
-        def append_documentation(obj: Any, out_file: IO[str], label: str) -> None:
-            """Output object documentation to an opened file."""
-            name: str
-            lines: List[str] = [f"\n## {label}:"]
+            trace(f"{tracing}=>FabCQtoFC.reuse_gcodes({gcode_paths})")
+        reused_paths: List[str] = []
+        gcode_path: str
+        for gcode_path in gcode_paths:
+            previous_path: FilePath = FilePath(gcode_path)
+            output_path: FilePath = self.OutputDirectory / previous_path.name
+            if output_path.resolve() != previous_path.resolve():
+                shutil.copyfile(previous_path, output_path)
+            reused_paths.append(str(output_path))
+            self.OutputFiles.append(str(output_path))
+        if tracing:
+            trace(f"{tracing}<=FabCQtoFC.reuse_gcodes({gcode_paths})=>{reused_paths}")
+        return reused_paths
+
+    # FabCQtoFC.verify_properties():
+    def verify_properties(self, kind: str, obj: Any, json_dict: Dict[str, Any],
+                          tracing: str = "") -> Tuple[Fab_PropertySetter, ...]:
+        """Verify the properties of an operation kind and return its property setters.
+
+        The full verification is only done for the first operation object of each *kind*
+        (e.g. "Extrude", "Pocket", "Drilling").  The resulting property setters have their
+        types (and enumerations) resolved and are reused for all later operations of *kind*.
+
+        Arguments:
+        * *kind* (str): The operation kind.
+        * *obj* (Any):
+          A Path operation object (e.g. contour, pocket, drill, etc.) that has properties
+          to be set.  This object must have a `PropertiesList` attribute.
+        * *json_dict* (Dict[str, Any]): The operation JSON values.
+
+        Returns:
+        * (Tuple[Fab_PropertySetter, ...]): The property setters for *kind*.
+
+        """
+        if kind in self.PropertyTables:
+            return self.PropertyTables[kind]
+        if tracing:
+            trace(f"{tracing}=>FabCQtoFC.verify_properties('{kind}', *, *)")
+
+        # Verify that required methods are present:
+        if not hasattr(obj, "PropertiesList"):
+            raise RuntimeError(
+                "FabCQtoFC.verify_properties(): No getProperties() method present")
+        if not hasattr(obj, "getDocumentationOfProperty"):
+            raise RuntimeError(
+                "FabCQtoFC.verify_properties(): No getDocumentationOfProperty() method present")
+
+        # Each property has an *info* dictionary that specifies additional information:
+        # * "type": (type): When present, the property must match this type.
+        # * "ignore: (None): When present, this property is ignored.
+        infos_getters: Dict[str, Callable[[], Dict[str, Any]]] = {
+            "Drilling": self.get_drilling_infos,
+            "Extrude": self.get_extrude_infos,
+            "Pocket": self.get_pocket_infos,
+        }
+        if kind not in infos_getters:
+            raise RuntimeError(f"FabCQtoFC.verify_properties(): Unknown kind '{kind}'")
+        infos: Dict[str, Dict[str, Any]] = infos_getters[kind]()
+
+        # Extract *ignores* (fields not expected in JSON) from *info*:
+        name: str
+        info: Dict[str, Any]
+        ignores: Set[str] = {  # Set comprehension
+            name for name, info in infos.items() if "ignore" in info}
+        actuals: Set[str] = set(obj.PropertiesList)
+
+        # The incoming JSON entries have a preceding "_" that needs to be stripped off.
+        # FYI, the "_" ensures that required entries like "Label" and "Kind" get sorted first
+        # when the JSON is pretty printed.  Any following "children" list always sorts last.
+        jsons: Set[str] = set([
+            name[1:] for name in json_dict.keys() if name.startswith("_")])
+
+        desired_jsons: Set[str] = jsons
+        desired_actuals: Set[str] = actuals - ignores
+        if desired_jsons != desired_actuals:
+            raise RuntimeError(
+                "FabCQtoFC.verify_properties(): Property mismatch:\n"
+                f"{sorted(desired_jsons - desired_actuals)=}\n"
+                f"{sorted(desired_actuals - desired_jsons)=}\n"
+            )
+
+        # Resolve the type (and enumerations) of each property that is transferred:
+        setters: List[Fab_PropertySetter] = []
+        for name, info in infos.items():
+            if "ignore" not in info:
+                target_type: type = info["type"] if "type" in info else type(getattr(obj, name))
+                enumerations: Optional[List[str]] = None
+                if target_type is str:
+                    enumerations = obj.getEnumerationsOfProperty(name)
+                setters.append(Fab_PropertySetter(
+                    name, f"_{name}", target_type, tuple(enumerations) if enumerations else ()))
+                if tracing:
+                    trace(f"{tracing}{setters[-1]}")
+        property_setters: Tuple[Fab_PropertySetter, ...] = tuple(setters)
+        self.PropertyTables[kind] = property_setters
+
+        # Append the property documentation when tracing verbosely:
+        if trace_log.Level >= 3:
+            lines: List[str] = [f"\n## {kind}:"]
             for name in sorted(obj.PropertiesList):
                 value: Any = getattr(obj, name)
                 documentation = cast(str, obj.getDocumentationOfProperty(name))
@@ -377,7 +722,6 @@ class FabCQtoFC(object):
                     type_name = "Vector"
 
                 # Convert *enumerations* into a more readable *enumerations_text*:
-                enumerations: Optional[List[str]] = None
                 enumerations_text: str = ""
                 enumerations = obj.getEnumerationsOfProperty(name)
                 if enumerations:
@@ -386,47 +730,13 @@ class FabCQtoFC(object):
                     enumerations_text = f" {{ {', '.join(sorted(enumerations))} }}"
                 lines.append(f"* {name} ({type_name}): {documentation}{enumerations_text}")
             lines.append("")
-            out_file.write("\n".join(lines))
-
-        self.ProperitiesVerified = True
-        if not self.ProperitiesVerified:
-            self.ProperitiesVerified = True
-
-            # Create a temporary operation object to extract properties from:
-            profile: Any = PathProfile.Create("IgnoreThisProfile")
-            profiles: Set[str] = set(profile.PropertiesList)
-            pocket: Any = PathPocket.Create("IgnoreThisPocket")  # => "Path::FeaturePython".
-            pockets: Set[str] = set(pocket.PropertiesList)
-            drilling: Any = PathDrilling.Create("IgnoreThisDrilling", findAllHoles=False)
-            drillings: Set[str] = set(drilling.PropertiesList)
-            commons: Set[str] = profiles & pockets & drillings
-
-            # Write out property documentation:
             out_file: IO[str]
-            with open("/tmp/objects.md", "w") as out_file:
-                out_file.write("# Object Docuementation\n")
-                append_documentation(profile, out_file, "Profile")
-                append_documentation(pocket, out_file, "Pocket")
-                append_documentation(drilling, out_file, "Drilling")
-
-            # Remove the temporary operation objects:
-            project_document: Any = self.ProjectDocument
-            project_document.removeObject("IgnoreThisProfile")
-            project_document.removeObject("IgnoreThisPocket")
-            project_document.removeObject("IgnoreThisDrilling")
-
-            # Extract the information dictionary keys as sets:
-            common_infos: Set[str] = set(self.merge_common_infos({}))
-            extrude_infos: Set[str] = set(self.get_extrude_infos().keys())
-            pocket_infos: Set[str] = set(self.get_pocket_infos().keys())
-            drilling_infos: Set[str] = set(self.get_drilling_infos().keys())
-
-            match("common", commons, common_infos)
-            match("pocket", pockets, pocket_infos)
-            match("profile", profiles, extrude_infos)
-            match("drilling", drillings, drilling_infos)
+            with open(self.OutputDirectory / "objects.md", "a") as out_file:
+                out_file.write("\n".join(lines))
+
         if tracing:
-            trace(f"{tracing}<=CQtoPy.verify_properties()")
+            trace(f"{tracing}<=FabCQtoFC.verify_properties('{kind}', *, *)")
+        return property_setters
 
     # FabCQtoFC.process():
     def process(self, indent: str = "", tracing: str = "") -> None:
@@ -437,28 +747,34 @@ class FabCQtoFC(object):
 
         # Create the *steps_document*:
         json_directory: FilePath = self.JsonPath.parent
-        steps_document: Any = App.newDocument("Step_Files")  # type: ignore
+        steps_document: Any = App.newDocument(self.StepsLabel)  # type: ignore
         self.StepsDocument = steps_document
         self.AllDocuments.append(steps_document)
 
-        # Read in *json_path*:
-        json_file: IO[str]
-        json_text: str = ""
-        if self.JsonPath.suffix != ".json":
-            raise RuntimeError(f"JSON file must have `.json` suffix: '{str(self.JsonPath)}'")
-        if tracing:
-            trace(f"{tracing}Loading {str(self.JsonPath)}")
-        with open(self.JsonPath, "r") as json_file:
-            json_text = json_file.read()
+        # Stream the nodes in from *json_path* and process each one as soon as it is read:
         if tracing:
-            trace(f"{tracing}Parsing {str(self.JsonPath)}")
-        json_root = cast(Dict[str, Any], json.loads(json_text))
-        assert isinstance(json_root, dict), json_root
+            trace(f"{tracing}Streaming {str(self.JsonPath)}")
+        reader: Fab_JsonNodeReader = Fab_JsonNodeReader(self.JsonPath)
+        tree_path: Tuple[str, ...]
+        json_dict: Dict[str, Any]
+        for tree_path, json_dict in reader.nodes():
+            node_indent: str = indent + "  " * (len(tree_path) - 1) if indent else ""
+            self.node_process(tree_path, json_dict, indent=node_indent, tracing=next_tracing)
 
-        # Recursively walk the tree starting at *json_root*:
-        if tracing:
-            trace(f"{tracing}Processing {str(self.JsonPath)}")
-        self.node_process(("Root",), json_root, indent=indent, tracing=next_tracing)
+        self.flush_job()
+        if self.BitCache:
+            self.BitCache.save()
+
+        # Remove the objects of any previous Solid's that are no longer present:
+        document_label: str
+        previous_state: Dict[str, Dict[str, Any]]
+        for document_label, previous_state in self.PreviousStates.items():
+            current_objects: Dict[str, Any] = self.DocumentStates[document_label]["Objects"]
+            solid_label: str
+            for solid_label in previous_state["Objects"]:
+                if solid_label not in current_objects:
+                    self.remove_objects(document_label, previous_state["Objects"][solid_label],
+                                        tracing=next_tracing)
 
         # Save *all_documents*:
         document: Any
@@ -468,7 +784,15 @@ class FabCQtoFC(object):
                 save_path.unlink()
             document.recompute()
             document.saveAs(str(save_path))
-        self.flush_job()
+            self.OutputFiles.append(str(save_path))
+            if document.Label in self.DocumentStates:
+                state_file: IO[str]
+                with open(f"{save_path}.json", "w") as state_file:
+                    json.dump(self.DocumentStates[document.Label], state_file,
+                              indent=2, sort_keys=True)
+        if self.GCodeCacheHits or self.GCodeCacheMisses:
+            print(f"G-code cache: {self.GCodeCacheHits} reused, "
+                  f"{self.GCodeCacheMisses} generated")
 
         # Install all of the *pending_links*:
         pending_link: Tuple[Any, Any]
@@ -538,10 +862,8 @@ class FabCQtoFC(object):
         return step_label
 
     # FabCQtoFC.process_json():
-    def process_json(
-            self, json_dict: Dict[str, Any], obj: Any,
-            infos: Dict[str, Dict[str, Any]], tracing: str = ""
-    ) -> None:
+    def process_json(self, json_dict: Dict[str, Any], obj: Any, kind: str,
+                     tracing: str = "") -> None:
         """Transfer JSON values into Path operation object.
 
         Arguments:
@@ -549,105 +871,80 @@ class FabCQtoFC(object):
           A dictionary from a JSON file that contains the object values:
         * *obj* (Any):
           A Path operation object (e.g. contour, pocket, drill, etc.) that has properties
-          to be set.  This object must have a `PropertiesList` attribute.
-        * *infos* (Dict[str, Dict[str, Any]]):
-          This a dictionary of dictionaries.  The top level dictionary keys must be 1-to-1
-          with the keys returned by the `PropertiesList` attribute.  The sub-dictionary for
-          each property specifies additional information:
-          * "type": (type): When present, the property must match this type.
-          * "ignore: (None): When present, this property is ignored.
+          to be set.
+        * *kind* (str):
+          The operation kind (e.g. "Extrude", "Pocket", "Drilling") whose property setters
+          are used (see `verify_properties()`.)
         """
         if tracing:
-            trace(f"{tracing}=>FabCQtoFC.process_json(*, *, *)")
-
-        # Verify that required methods are present:  # TODO: Move to verify_properties:
-        if not hasattr(obj, "PropertiesList"):
-            raise RuntimeError(
-                "FabCQtoFC.process_json(): No getProperties() method present")
-        if not hasattr(obj, "getDocumentationOfProperty"):
-            raise RuntimeError(
-                "FabCQtoFC.process_json(): No getDocumentationOfProperty() method present")
-
-        # Extract *ignores* (fields not expected in JSON) from *info*:
-        name: str
-        info: Dict[str, Any]
-        ignores: Set[str] = {  # Set comprehension
-            name for name, info in infos.items() if "ignore" in info}
-        actuals: Set[str] = set(obj.PropertiesList)
-
-        # The incoming JSON entries have a preceding "_" that needs to be stripped off.
-        # FYI, the "_" ensures that required entries like "Label" and "Kind" get sorted first
-        # when the JSON is pretty printed.  Any following "children" list always sorts last.
-        jsons: Set[str] = set([
-            name[1:] for name in json_dict.keys() if name.startswith("_")])
-
-        desired_jsons: Set[str] = jsons
-        desired_actuals: Set[str] = actuals - ignores
-        if desired_jsons != desired_actuals:
-            raise RuntimeError(
-                "FabCQtoFC.process_json(): Property mismatch:\n"
-                f"{sorted(desired_jsons - desired_actuals)=}\n"
-                f"{sorted(desired_actuals - desired_jsons)=}\n"
-            )
-
-        # Sweep through *properties*:
-        if tracing:
-            trace(f"{tracing}{jsons=}")
-        for name, info in infos.items():
-            info_key: str
-            info_value: Any
-            if "ignore" not in info:
-                target_value: Any = getattr(obj, name)
-                target_type: type = type(target_value)
-                json_value: Any = json_dict[f"_{name}"]  # JSON keys have "_" key prefix.
-                json_type: type = type(json_value)
-                if "type" in info:
-                    target_type = info["type"]
-                # TODO: Should not assume that all strings are enumerations:
-                if isinstance(json_type, str):
-                    enumerations: List[str] = obj.getEnumererationsOfProperty(name)
-                    if json_value not in enumerations:
-                        raise RuntimeError(
-                            f"FabCQtoFC.process_json(): {name=} has "
-                            f"{target_value=} which is not one of {sorted(enumerations)}")
-                if target_type != json_type:
-                    raise RuntimeError(
-                        "FabCQtoFC.process_json(): "
-                        f"{name=}: {target_type=} != {json_type=}")
-                setattr(obj, name, json_value)
+            trace(f"{tracing}=>FabCQtoFC.process_json(*, *, '{kind}')")
+
+        property_setters: Tuple[Fab_PropertySetter, ...] = self.verify_properties(
+            kind, obj, json_dict, tracing=tracing + " " if tracing else "")
+        setter: Fab_PropertySetter
+        for setter in property_setters:
+            json_value: Any = json_dict[setter.JsonKey]
+            if type(json_value) is not setter.Type:
+                raise RuntimeError(
+                    "FabCQtoFC.process_json(): "
+                    f"{setter.Name}: {setter.Type} != {type(json_value)}")
+            if setter.Enumerations and json_value not in setter.Enumerations:
+                raise RuntimeError(
+                    f"FabCQtoFC.process_json(): {setter.Name} has "
+                    f"'{json_value}' which is not one of {sorted(setter.Enumerations)}")
+            setattr(obj, setter.Name, json_value)
 
         if tracing:
-            trace(f"{tracing}<=FabCQtoFC.process_json(*, *, *)")
+            trace(f"{tracing}<=FabCQtoFC.process_json(*, *, '{kind}')")
 
     # FabCQtoFC.node_process():
     def node_process(self, tree_path: Tuple[str, ...], json_dict: Dict[str, Any],
                      indent: str = "", tracing: str = "") -> None:
-        """Process one 'node' of JSON content."""
+        """Process one 'node' of JSON content (already validated by Fab_JsonNodeReader)."""
 
         # Set up *tracing* and pretty print *indent*:
         next_tracing: str = tracing + "  " if tracing else ""
         next_indent = indent + "  " if indent else ""
         if tracing:
             trace(f"{tracing}=>FabCQtoFC.child_process(*, {tree_path}, '{indent}')")
-            trace(f"{tracing}{json_dict=}")
+            trace(lambda: f"{tracing}{json_dict=}", 2)
 
-        # Do some sanity checking:
-        error_message: str
-        self.type_verify(json_dict, dict, tree_path, "json_dict")
-        kind = cast(str, self.key_verify("Kind", json_dict, str, tree_path, "Kind"))
-        label = cast(str, self.key_verify("Label", json_dict, str, tree_path, "Label"))
+        kind: str = json_dict["Kind"]
+        label: str = json_dict["Label"]
         if indent:
             trace(f"{indent}{label}:")
             trace(f"{indent} Kind: {kind}")
 
-        # Verify that that *kind* is one of the *allowed_kinds*:
-        allowed_kinds: Tuple[str, ...] = (
-            "Project", "Document", "Assembly", "Solid", "Mount",  # No operations
-            "Extrude", "Pocket", "Drilling")  # Operations
-        if kind not in allowed_kinds:
-            error_message = f"{tree_path}: Node kind '{kind}' not one of {allowed_kinds}"
-            print(error_message)
-            assert False, error_message
+        # In incremental mode, skip unchanged Solid's and replace changed ones.  An unchanged
+        # Solid is only skipped when all of its previous `.ngc` files are still present:
+        before_names: Set[str] = set()
+        output_count: int = 0
+        if kind == "Solid" and self.ProjectDocument is not None:
+            document_label: str = self.ProjectDocument.Label
+            solid_hash: str = hashlib.sha256(
+                json.dumps(json_dict, sort_keys=True).encode("utf-8")).hexdigest()
+            state: Dict[str, Dict[str, Any]] = self.DocumentStates[document_label]
+            state["Hashes"][label] = solid_hash
+            previous: Dict[str, Dict[str, Any]] = self.PreviousStates.get(
+                document_label, {"Hashes": {}, "Objects": {}, "GCodes": {}})
+            previous_gcodes: Optional[List[str]] = previous.get("GCodes", {}).get(label)
+            gcode: str
+            if (previous["Hashes"].get(label) == solid_hash and previous_gcodes is not None and
+                    all([FilePath(gcode).exists() for gcode in previous_gcodes])):
+                self.flush_job(tracing=next_tracing)
+                state["Objects"][label] = previous["Objects"].get(label, [])
+                state["GCodes"][label] = self.reuse_gcodes(previous_gcodes, tracing=next_tracing)
+                self.CurrentSolid = None
+                if tracing:
+                    trace(f"{tracing}Solid '{label}' is unchanged")
+                    trace(f"{tracing}<=FabCQtoFC.child_process({tree_path}, '{indent}')")
+                return
+            if label in previous["Objects"]:
+                self.flush_job(tracing=next_tracing)
+                self.remove_objects(document_label, previous["Objects"][label],
+                                    tracing=next_tracing)
+            before_names = set([obj.Name for obj in self.ProjectDocument.Objects])
+            output_count = len(self.OutputFiles)
 
         # Dispatch on *kind*:
         if kind == "Project":
@@ -666,26 +963,34 @@ class FabCQtoFC(object):
             self.process_pocket(json_dict, label, indent, tree_path, tracing=next_tracing)
         elif kind == "Drilling":
             self.process_drilling(json_dict, label, indent, tree_path, tracing=next_tracing)
-        else:
-            message = f"'{kind}' not one of {allowed_kinds}"
-            print(message)
-            assert False, message
 
-        # Recursively process any *children* JSON nodes:
-        if "children" in json_dict:
-            children = cast(List[Dict[str, Any]],
-                            self.key_verify("children", json_dict, list, tree_path, "Children"))
+        # Recursively process any *children* JSON nodes (only present below streamed nodes).
+        # The operations of a Mount with native or cached G-code have no job to go into:
+        if "children" in json_dict and not (kind == "Mount" and self.CurrentJob is None):
+            children: List[Dict[str, Any]] = json_dict["children"]
             if indent:
                 trace(f"{indent} children ({len(children)}):")
 
             child_dict: Dict[str, Any]
             for child_dict in children:
-                self.type_verify(child_dict, dict, tree_path, "Child")
-                child_name = cast(str,
-                                  self.key_verify("Label", child_dict, str, tree_path, "Label"))
-                child_tree_path: Tuple[str, ...] = tree_path + (child_name,)
+                child_tree_path: Tuple[str, ...] = tree_path + (child_dict["Label"],)
                 self.node_process(child_tree_path, child_dict,
                                   indent=next_indent, tracing=next_tracing)
+
+        # Remember the FreeCAD objects (including its jobs/operations) and the `.ngc` files
+        # created for a Solid:
+        if kind == "Solid" and self.ProjectDocument is not None:
+            self.flush_job(tracing=next_tracing)
+            after_names: List[str] = [obj.Name for obj in self.ProjectDocument.Objects]
+            name: str
+            solid_state: Dict[str, Dict[str, Any]] = self.DocumentStates[
+                self.ProjectDocument.Label]
+            solid_state["Objects"][label] = [
+                name for name in after_names if name not in before_names]
+            output_file: str
+            solid_state["GCodes"][label] = [output_file
+                                            for output_file in self.OutputFiles[output_count:]
+                                            if output_file.endswith(".ngc")]
         if tracing:
             trace(f"{tracing}<=FabCQtoFC.child_process({tree_path}, '{indent}')")
 
@@ -694,7 +999,20 @@ class FabCQtoFC(object):
                          indent: str, tree_path: Tuple[str, ...], tracing: str = "") -> None:
         if tracing:
             trace(f"{tracing}=>FabCQtoFC.process_assembly(*, '{label}', {tree_path})")
-        if self.CurrentGroup:
+
+        # A reopened incremental document group must have the same label and parent group:
+        def parent_name(group: Any) -> Optional[str]:
+            """Return the name of the parent group of a group (or None for the top level.)"""
+            parent: Any = group.getParentGroup() if group else None
+            return parent.Name if parent else None
+
+        current_name: Optional[str] = self.CurrentGroup.Name if self.CurrentGroup else None
+        existing_groups: List[Any] = [
+            group for group in self.ProjectDocument.getObjectsByLabel(label)
+            if group.TypeId == "App::DocumentObjectGroup" and parent_name(group) == current_name]
+        if existing_groups:
+            self.CurrentGroup = existing_groups[0]  # Reopened incremental document.
+        elif self.CurrentGroup:
             self.CurrentGroup = self.CurrentGroup.newObject("App::DocumentObjectGroup", label)
         else:
             self.CurrentGroup = self.ProjectDocument.addObject("App::DocumentObjectGroup", label)
@@ -710,12 +1028,25 @@ class FabCQtoFC(object):
             trace(f"{tracing}=>FabCQtoFC.process_document(*, '{label}', {tree_path})")
         file_path: str = cast(str, self.key_verify(
             "_FilePath", json_dict, str, tree_path, "Document._File_Path"))
-        project_document = App.newDocument(label)  # type: ignore
+        project_document: Any = None
+        save_path: FilePath = self.JsonPath.parent / f"{label}.FCStd"
+        state_path: FilePath = FilePath(f"{save_path}.json")
+        if self.Incremental and save_path.exists() and state_path.exists():
+            state_file: IO[str]
+            with open(state_path, "r") as state_file:
+                self.PreviousStates[label] = cast(Dict[str, Dict[str, Any]],
+                                                  json.load(state_file))
+            project_document = App.openDocument(str(save_path))  # type: ignore
+            if tracing:
+                trace(f"{tracing}Reopened {str(save_path)}")
+        else:
+            project_document = App.newDocument(label)  # type: ignore
         project_document.Label = label
+        self.DocumentStates[label] = {"Hashes": {}, "Objects": {}, "GCodes": {}}
         if indent:
             trace(f"{indent} _FilePath: {file_path}")
-            self.ProjectDocument = project_document
-            self.AllDocuments.append(project_document)
+        self.ProjectDocument = project_document
+        self.AllDocuments.append(project_document)
         if tracing:
             trace(f"{tracing}<=FabCQtoFC.process_document(*, '{label}', {tree_path})")
 
@@ -746,7 +1077,6 @@ class FabCQtoFC(object):
             tool, tool_controller = self.get_tool_and_controller(
                 json_dict, label, indent, tree_path, tracing=next_tracing)
 
-            self.verify_properties(tracing=next_tracing)
             profile_solid: Any = extrude_solid
             profile_name: str = f"{job.Label}_profile"
             aligned_face_names: Tuple[str, ...] = self.get_aligned_face_names(
@@ -767,8 +1097,7 @@ class FabCQtoFC(object):
                 if tracing:
                     trace(f"{tracing}profile created")
                 profile.Base = (profile_solid, aligned_face_names[0])
-                profile_infos: Dict[str, Any] = self.get_extrude_infos()
-                self.process_json(json_dict, profile, profile_infos, tracing=next_tracing)
+                self.process_json(json_dict, profile, "Extrude", tracing=next_tracing)
 
                 profile.processHoles = False
                 profile.processPerimeter = True
@@ -895,7 +1224,6 @@ class FabCQtoFC(object):
             trace(f"{tracing}=>FabCQtoFC.process_pocket(*, '{label}', {tree_path})")
 
         # Grab *pocket_bottom* from STEP file and insert into *project_document*:
-        self.verify_properties(tracing=next_tracing)
         project_document: Any = self.ProjectDocument
         if tracing:
             trace(f"{tracing}{project_document=} {project_document.Label=}")
@@ -933,8 +1261,7 @@ class FabCQtoFC(object):
             #   (https://forum.freecad.org/viewtopic.php?f=22&p=579798)
 
             pocket.Base = (pocket_solid, aligned_face_names[0])
-            pocket_infos: Dict[str, Any] = self.get_pocket_infos()
-            self.process_json(json_dict, pocket, pocket_infos, tracing=next_tracing)
+            self.process_json(json_dict, pocket, "Pocket", tracing=next_tracing)
             pocket.recompute()
 
         if tracing:
@@ -949,7 +1276,6 @@ class FabCQtoFC(object):
             trace(f"{tracing}=>FabCQtoFC.process_drilling(*, '{label}', {tree_path})")
 
         # Grab *drill_solid* from STEP file and insert into *project_document*:
-        self.verify_properties(tracing=next_tracing)
         project_document: Any = self.ProjectDocument
         if tracing:
             trace(f"{tracing}{project_document=} {project_document.Label=}")
@@ -1008,8 +1334,7 @@ class FabCQtoFC(object):
         #     trace(f"{tracing}Drilling: {aligned_face_names=}")
 
         drilling.Base = (drilling_solid, hole_face_names)
-        drilling_infos: Dict[str, Any] = self.get_drilling_infos()
-        self.process_json(json_dict, drilling, drilling_infos, tracing=next_tracing)
+        self.process_json(json_dict, drilling, "Drilling", tracing=next_tracing)
         drilling.recompute()
 
         if tracing:
@@ -1042,6 +1367,36 @@ class FabCQtoFC(object):
 
         self.flush_job(tracing=next_tracing)  # Force previous job to be done.
 
+        # FabProject.run() already wrote the `.ngc` file of a natively handled mount:
+        job_name: str = f"{self.CurrentSolid.Label}_{label}"
+        if json_dict.get("_NativeGCode", False):
+            self.CurrentNormal = normal
+            if tracing:
+                trace(f"{tracing}Mount '{job_name}' has native G-code")
+                trace(f"{tracing}<=FabCQtotFC.process_mount(*, {label}, {tree_path})")
+            return
+
+        # The G-code cache key is the STEP file contents, the *json_dict* of the mount (which
+        # contains all of its operations, bits and tool controllers) and the post-processor
+        # arguments.  On a cache hit, the cached `.ngc` file is reused and no job is built:
+        gcode_path: str = str(self.OutputDirectory / f"{job_name}.ngc")
+        post_processor: str = "linuxcnc"
+        post_processor_args: str = "--no-show-editor"
+        job_hash: Any = hashlib.sha256()
+        job_hash.update(self.CurrentStepHash.encode("utf-8"))
+        job_hash.update(json.dumps(json_dict, sort_keys=True).encode("utf-8"))
+        job_hash.update(f"{post_processor}|{post_processor_args}".encode("utf-8"))
+        cache_path: FilePath = self.GCodeCachePath / f"{job_hash.hexdigest()}.ngc"
+        if cache_path.exists():
+            shutil.copyfile(cache_path, gcode_path)
+            self.GCodeCacheHits += 1
+            self.OutputFiles.append(gcode_path)
+            self.CurrentNormal = normal
+            if tracing:
+                trace(f"{tracing}Reused {str(cache_path)} for {gcode_path}")
+                trace(f"{tracing}<=FabCQtotFC.process_mount(*, {label}, {tree_path})")
+            return
+
         # # Delete any previous jobs:
         # if tracing:
         #     trace(f"{tracing}>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>")
@@ -1052,7 +1407,6 @@ class FabCQtoFC(object):
         #     self.ProjectDocument.removeObject(job.Label)
 
         # Create the new job:
-        job_name: str = f"{self.CurrentSolid.Label}_{label}"
         # if tracing:
         #     trace(f"{tracing}Middle: {PathJob.Instances()=}")
         #     trace(f"{tracing}Creating job {job_name}...")
@@ -1073,7 +1427,6 @@ class FabCQtoFC(object):
         # TODO: Create a setup sheet and install it into the job.
         # setup_sheet: PathSetupSheet.SetupSheet = PathSetupSheet.Create()
         # job.SetupSheet = setup_sheet
-        gcode_path: str = f"/tmp/{job_name}.ngc"
         # From [FreeCAD Path Forum: Path Scriptabilty an example]
         # (https://forum.freecadweb.org/viewtopic.php?f=15&t=64624)
         setup_sheet: Any = job.SetupSheet
@@ -1093,7 +1446,7 @@ class FabCQtoFC(object):
         setup_sheet.VertRapid = "10 mm/s"
 
         doc_file: IO[str]
-        with open("/tmp/cnc.doc", "w") as doc_file:
+        with open(self.OutputDirectory / "cnc.doc", "w") as doc_file:
             doc_file.write("dir(job):\n")
             doc_file.write("\n".join(dir(job)))
             doc_file.write("\n\n\n")
@@ -1102,11 +1455,12 @@ class FabCQtoFC(object):
             doc_file.write("\n\n\n")
 
         job.PostProcessorOutputFile = gcode_path
-        job.PostProcessor = 'linuxcnc'
-        job.PostProcessorArgs = '--no-show-editor'
+        job.PostProcessor = post_processor
+        job.PostProcessorArgs = post_processor_args
         job.Label = job_name
         self.CurrentJob = job
         self.CurrentJobName = job_name
+        self.CurrentJobCachePath = cache_path
         self.CurrentNormal = normal
 
         if App.GuiUp:  # type: ignore
@@ -1145,6 +1499,11 @@ class FabCQtoFC(object):
         document: Any = self.ProjectDocument if use_project_document else self.StepsDocument
         before_size: int = len(document.RootObjects)
         self.import_step(step_file, True, tracing=next_tracing)
+
+        # Hash the STEP file once for the G-code cache keys of all of the Solid mounts:
+        step_hash_file: IO[bytes]
+        with open(step_file, "rb") as step_hash_file:
+            step_hash: str = hashlib.sha256(step_hash_file.read()).hexdigest()
         after_size: int = len(document.RootObjects)
         assert before_size + 1 == after_size, (before_size, after_size)
         solid: Any = document.getObject(label)
@@ -1165,6 +1524,7 @@ class FabCQtoFC(object):
 
         self.CurrentSolid = solid
         self.CurrentSolidName = label
+        self.CurrentStepHash = step_hash
         self.CurrentLink = link
         self.CurrentJob = None
         self.CurrentNormal = None
@@ -1188,7 +1548,7 @@ class FabCQtoFC(object):
         face_index: int
         aligned_area_names: List[Tuple[float, str]] = []
         face_file: IO[str]
-        with open(f"/tmp/{obj.Label}_faces.txt", "w") as face_file:
+        with open(self.OutputDirectory / f"{obj.Label}_faces.txt", "w") as face_file:
             for face_index in range(len(shape.Faces)):
                 face_name: str = f"Face{face_index+1}"
                 face: Any = shape.getElement(face_name)
@@ -1213,18 +1573,157 @@ class FabCQtoFC(object):
             trace(f"{tracing}<=get_aligned_faces_name({obj}, {normal})=>{sorted_face_names}")
         return sorted_face_names
 
+    # CQtoFC.remove_objects():
+    def remove_objects(self, document_label: str, names: List[str], tracing: str = "") -> None:
+        """Remove previously generated FreeCAD objects from a reopened document."""
+        if tracing:
+            trace(f"{tracing}=>CQtoFC.remove_objects('{document_label}', {names})")
+        document: Any = App.getDocument(document_label)  # type: ignore
+        name: str
+        for name in reversed(names):  # Remove children before their parents.
+            if document.getObject(name) is not None:
+                document.removeObject(name)
+        if tracing:
+            trace(f"{tracing}<=CQtoFC.remove_objects('{document_label}', *)")
+
     # CQtoFC.flush_temporary_bits():
     def flush_temporary_bits(self, tools_directory: FilePath, tracing: str = "") -> None:
-        """Flush out any temporary bits."""
+        """Flush out any temporary bits (and the bit cache index that describes them)."""
         if tracing:
             trace(f"=>{tracing}CQtoFC.flush_temporary_bits()")
         bit_directory: FilePath = tools_directory / "Bit"
         for bit_path in bit_directory.glob("Bit[0-9][0-9][0-9]_*"):
             bit_path.unlink()
+        index_path: FilePath = bit_directory / ".fab_bit_cache.json"
+        if index_path.exists():
+            index_path.unlink()
+        if self.BitCache:
+            self.BitCache.Entries = {}
         if tracing:
             trace(f"<={tracing}CQtoFC.flush_temporary_bits()")
 
 
+# FabParallelCNC:
+@dataclass
+class FabParallelCNC(object):
+    """FabParallelCNC: Run one FreeCAD worker process per FabProject Document.
+
+    Attributes:
+    * *JsonPath* (FilePath): The project JSON file.
+    * *Flags* (str): The FLAGS to pass to each worker (e.g. "c").
+    * *Jobs* (int): The maximum number of workers to run at the same time.
+    * *FreeCAD* (str): The FreeCAD executable to run each worker with.
+
+    Constructor:
+    * FabParallelCNC(JsonPath, Flags, Jobs, FreeCAD)
+
+    """
+
+    JsonPath: FilePath
+    Flags: str
+    Jobs: int
+    FreeCAD: str
+
+    # FabParallelCNC.split():
+    def split(self, tracing: str = "") -> List[FilePath]:
+        """Split the project JSON into one JSON file per Document node.
+
+        Each split file has the same Project root with exactly one Document child and is
+        written next to the project JSON file as `Project__Document.json`.
+        """
+        if tracing:
+            trace(f"{tracing}=>FabParallelCNC.split({str(self.JsonPath)})")
+        json_file: IO[str]
+        with open(self.JsonPath, "r") as json_file:
+            json_root = cast(Dict[str, Any], json.load(json_file))
+        if not isinstance(json_root, dict) or json_root.get("Kind") != "Project":
+            raise RuntimeError(f"{str(self.JsonPath)}: Root node is not a Project")
+        children: List[Dict[str, Any]] = json_root.get("children", [])
+        key: str
+        value: Any
+        project_json: Dict[str, Any] = {
+            key: value for key, value in json_root.items() if key != "children"}
+
+        split_paths: List[FilePath] = []
+        child: Dict[str, Any]
+        for child in children:
+            if child.get("Kind") != "Document":
+                raise RuntimeError(
+                    f"{str(self.JsonPath)}: Project child '{child.get('Label')}' "
+                    "is not a Document")
+            split_path: FilePath = self.JsonPath.with_name(
+                f"{self.JsonPath.stem}__{child['Label']}.json")
+            split_json: Dict[str, Any] = dict(project_json)
+            split_json["children"] = [child]
+            with open(split_path, "w") as json_file:
+                json.dump(split_json, json_file, sort_keys=True)
+            split_paths.append(split_path)
+        if tracing:
+            trace(f"{tracing}<=FabParallelCNC.split()=>{len(split_paths)} documents")
+        return split_paths
+
+    # FabParallelCNC.run_worker():
+    def run_worker(self, split_path: FilePath) -> Dict[str, Any]:
+        """Run one FreeCAD worker on a split JSON file and return its report."""
+        script_path: FilePath = FilePath(__file__).resolve()
+        manifest_path: FilePath = split_path.with_suffix(".outputs.json")
+        if manifest_path.exists():
+            manifest_path.unlink()
+        environ: Dict[str, str] = dict(os.environ)
+        environ["JSON"] = str(split_path)
+        environ["FLAGS"] = self.Flags.replace("v", "")  # Workers are always console mode.
+        environ["JOBS"] = "1"
+        environ["WORKER"] = "1"
+        environ["MANIFEST"] = str(manifest_path)
+        environ["TRACE_FILE"] = f"{trace_log.Path}.{split_path.stem.split('__')[-1]}"
+        command: List[str] = [
+            self.FreeCAD, "-M", str(script_path.parent), "-c", str(script_path.with_suffix(".py"))]
+        start_time: float = time.time()
+        completed: Any = subprocess.run(
+            command, env=environ, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+        output_files: List[str] = []
+        manifest_file: IO[str]
+        if manifest_path.exists():
+            with open(manifest_path, "r") as manifest_file:
+                output_files = cast(List[str], json.load(manifest_file))
+        return {
+            "Document": split_path.stem.split("__")[-1],
+            "ReturnCode": completed.returncode,
+            "Seconds": round(time.time() - start_time, 1),
+            "OutputFiles": output_files,
+            "Output": completed.stdout,
+        }
+
+    # FabParallelCNC.run():
+    def run(self, tracing: str = "") -> List[Dict[str, Any]]:
+        """Run all of the workers and merge their reports."""
+        if tracing:
+            trace(f"{tracing}=>FabParallelCNC.run({str(self.JsonPath)}, {self.Jobs})")
+        split_paths: List[FilePath] = self.split(tracing=tracing + " " if tracing else "")
+        reports: List[Dict[str, Any]]
+        with ThreadPoolExecutor(max_workers=max(1, self.Jobs)) as executor:
+            reports = list(executor.map(self.run_worker, split_paths))
+
+        # Report the merged results:
+        report: Dict[str, Any]
+        for report in reports:
+            status: str = "ok" if report["ReturnCode"] == 0 else f"failed ({report['ReturnCode']})"
+            print(f"{report['Document']}: {status} in {report['Seconds']}s")
+            output_file: str
+            for output_file in report["OutputFiles"]:
+                print(f"  {output_file}")
+            if report["ReturnCode"] != 0:
+                print(report["Output"])
+        report_path: FilePath = self.JsonPath.with_suffix(".outputs.json")
+        report_file: IO[str]
+        with open(report_path, "w") as report_file:
+            json.dump([{key: value for key, value in report.items() if key != "Output"}
+                       for report in reports], report_file, indent=2, sort_keys=True)
+        if tracing:
+            trace(f"{tracing}<=FabParallelCNC.run()=>{len(reports)} reports")
+        return reports
+
+
 # main():
 def main(tracing: str = "") -> None:
     """The main program."""
@@ -1232,16 +1731,47 @@ def main(tracing: str = "") -> None:
     if tracing:
         trace(f"{tracing}=>main()")
     environ = cast(Dict[str, str], os.environ)
-    json_file_name: str = environ["JSON"] if "JSON" in environ else "/tmp/TestProject.json"
+    output_directory: FilePath = FilePath(environ.get("OUTPUT", "") or "/tmp")
+    json_file_name: str = (
+        environ["JSON"] if "JSON" in environ else str(output_directory / "TestProject.json"))
+    if "OUTPUT" not in environ:
+        output_directory = FilePath(json_file_name).parent
+    output_directory.mkdir(parents=True, exist_ok=True)
+    cache_directory: FilePath = FilePath(environ.get("CACHE", "") or "/tmp")
     flags: str = environ["FLAGS"] if "FLAGS" in environ else ""
     cnc: bool = "c" in flags
     visual: bool = "v" in flags
+    incremental: bool = "i" in flags
+    jobs: int = int(environ["JOBS"]) if "JOBS" in environ else 1
+    worker: bool = "WORKER" in environ
     tools_directory: FilePath = FilePath(__file__).parent / "Tools"
     if tracing:
-        trace(f"{tracing}{json_file_name=} {tools_directory=} {flags=} {cnc=} {visual=}")
-    json_processor: FabCQtoFC = FabCQtoFC(FilePath(json_file_name), tools_directory, cnc)
-    json_processor.flush_temporary_bits(tools_directory, tracing=next_tracing)
-    json_processor.process(indent="  ", tracing=next_tracing)
+        trace(f"{tracing}{json_file_name=} {tools_directory=} {flags=} {cnc=} {visual=} {jobs=}")
+    steps_label: str = "Step_Files"
+    if worker:
+        steps_label = f"Step_Files__{FilePath(json_file_name).stem}"
+    json_processor: FabCQtoFC = FabCQtoFC(
+        FilePath(json_file_name), tools_directory, cnc, steps_label, incremental,
+        GCodeCachePath=cache_directory / "ngc_cache", OutputDirectory=output_directory)
+    # The temporary bits are no longer flushed on each run; the bit cache only rewrites
+    # the bit files that change.  `flush_temporary_bits()` is still available for cleanup.
+    if jobs > 1 and not worker and not App.GuiUp:  # type: ignore
+        freecad: str = environ.get("FREECAD", "") or "freecad"
+        parallel: FabParallelCNC = FabParallelCNC(
+            FilePath(json_file_name), flags, jobs, freecad)
+        reports: List[Dict[str, Any]] = parallel.run(tracing=next_tracing)
+        report: Dict[str, Any]
+        sys.exit(0 if all([report["ReturnCode"] == 0 for report in reports]) else 1)
+    try:
+        json_processor.process(
+            indent="  " if trace_log.Level >= 1 else "", tracing=next_tracing)
+    except BaseException:
+        trace_log.flush()  # Make sure that the trace leading up to the error is available.
+        raise
+    if "MANIFEST" in environ:
+        manifest_file: IO[str]
+        with open(environ["MANIFEST"], "w") as manifest_file:
+            json.dump(json_processor.OutputFiles, manifest_file)
     # json_processor.flush_temporary_bits(tools_directory, tracing=next_tracing)
     if not App.GuiUp:  # type: ignore
         if tracing:
@@ -1249,10 +1779,11 @@ def main(tracing: str = "") -> None:
         sys.exit(0)
     if tracing:
         trace(f"{tracing}<=main()")
+    trace_log.flush()  # FreeCAD keeps running in visual mode, so do not wait for exit.
 
 
 if __name__ == "__main__":
-    main(tracing=" ")
+    main(tracing=" " if trace_log.Level >= 2 else "")
 
 # Miscellaneous links:
 # [Add: New waterline algorithm](https://forum.freecad.org/viewtopic.php?f=15&t=65718)
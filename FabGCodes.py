@@ -0,0 +1,969 @@
+#!/usr/bin/env python3
+"""FabGCodes: Native G-code generation for simple operations.
+
+Generating G-code with the FreeCAD Path workbench requires a full FreeCAD document, a Path Job,
+and a setup sheet for each FabMount.  For the most common sheet work, namely drilling and
+contouring the outside of a circle or a convex polygon (e.g. a rectangle with rounded corners),
+the tool path is simple enough to generate directly from the project JSON.  FabGCodeEmitter does
+exactly that and produces G-code in the same format as the FreeCAD LinuxCNC post processor.
+
+Operations that need real tool path computation (e.g. pockets with adaptive clearing) are not
+supported, and a FabMount that contains any of them is left to FreeCAD (see FabCNC.)
+
+The G-code files (from either FabGCodeEmitter or FreeCAD via FabCNC) can be analyzed for
+cutting/rapid distances, plunges, tool changes and estimated runtime per tool, and the results
+written to a JSON benchmark report.  Comparing the reports from two versions catches tool path
+regressions and quantifies the effects of scheduler and feed changes.  From the command line:
+```
+python3 FabGCodes.py [--rapids H,V[,TOOL_CHANGE]] [--report REPORT.json]
+    [--previous PREVIOUS.json] FILE.ngc ...
+```
+
+The classes are:
+* FabGCodeEmitter: Generate G-code for a FabMount JSON dictionary.
+* FabGCodeAnalyzer: Analyze G-code files and write a JSON benchmark report.
+* FabGCodeAnalysis: The results of analyzing one G-code file.
+
+"""
+
+# <--------------------------------------- 100 characters ---------------------------------------> #
+
+from dataclasses import dataclass, field
+import json
+import math
+import re
+from pathlib import Path as PathFile
+import sys
+import tempfile
+from typing import Any, cast, Dict, IO, List, Optional, Set, Tuple
+
+from FabShops import FabCNCMill
+
+
+# FabGCodeEmitter:
+@dataclass
+class FabGCodeEmitter(object):
+    """FabGCodeEmitter: Generate G-code for a FabMount JSON dictionary.
+
+    The JSON only contains the full "Bit" and "ToolController" dictionaries the first time
+    that an operation uses them, so a FabGCodeEmitter keeps track of them by index across
+    all of the FabMount's in a FabProject, in the same way as FabCNC does.
+
+    Attributes:
+    * *Precision* (int): The number of digits after the decimal point. (Default: 3)
+    * *Bits* (Dict[int, Dict[str, Any]]): The "Bit" dictionaries by "BitIndex".
+    * *ToolControllers* (Dict[int, Dict[str, Any]]):
+      The "ToolController" dictionaries by "ToolControllerIndex".
+
+    Constructor:
+    * FabGCodeEmitter(Precision)
+
+    """
+
+    Precision: int = 3
+    Bits: Dict[int, Dict[str, Any]] = field(init=False, repr=False)
+    ToolControllers: Dict[int, Dict[str, Any]] = field(init=False, repr=False)
+
+    # FabGCodeEmitter.__post_init__():
+    def __post_init__(self) -> None:
+        """Initialize FabGCodeEmitter."""
+        if self.Precision < 0:
+            raise RuntimeError(
+                f"FabGCodeEmitter.__post_init__(): Precision {self.Precision} is negative.")
+        self.Bits = {}
+        self.ToolControllers = {}
+
+    # FabGCodeEmitter.parseLength():
+    @staticmethod
+    def parseLength(length: Any) -> float:
+        """Return a length in millimeters from a float or a FreeCAD string (e.g. "5.0 mm")."""
+        if isinstance(length, (int, float)):
+            return float(length)
+        words: List[str] = str(length).split()
+        scales: Dict[str, float] = {"mm": 1.0, "cm": 10.0, "in": 25.4, "\"": 25.4}
+        if len(words) == 1 or (len(words) == 2 and words[1] in scales):
+            try:
+                return float(words[0]) * (scales[words[1]] if len(words) == 2 else 1.0)
+            except ValueError:
+                pass
+        raise RuntimeError(f"FabGCodeEmitter.parseLength(): Can not parse '{length}'.")
+
+    # FabGCodeEmitter.contourMoves():
+    @staticmethod
+    def contourMoves(contour: Dict[str, Any], tool_radius: float, clockwise: bool
+                     ) -> Optional[Tuple[Tuple[float, float], List[Tuple[Any, ...]]]]:
+        """Return the start point and moves for an outside contour (None if not supported).
+
+        Arguments:
+        * *contour* (Dict[str, Any]): A "CNCContour" dictionary from a Fab_Extrude JSON node.
+        * *tool_radius* (float): The tool radius to offset the contour by.
+        * *clockwise* (bool): True to go around clockwise; otherwise counter-clockwise.
+
+        Returns:
+        * (Optional[Tuple[Tuple[float, float], List[Tuple[Any, ...]]]]): None when the contour
+          is not supported.  Otherwise, the start point followed by a list of moves that end
+          back at the start point, where each move is either ("G1", X, Y) or
+          ("G2"/"G3", X, Y, I, J) with I/J relative to the start of the move.
+
+        """
+        kind: str = contour.get("Kind", "")
+        moves: List[Tuple[Any, ...]] = []
+        start: Tuple[float, float]
+        if kind == "Circle":
+            center_x, center_y = contour["Center"]
+            radius: float = contour["Diameter"] / 2.0 + tool_radius
+            start = (center_x + radius, center_y)
+            moves.append(("G2" if clockwise else "G3", start[0], start[1], -radius, 0.0))
+            return start, moves
+        if kind != "Polygon" or len(contour["Corners"]) < 3:
+            return None
+
+        # Put the *corners* into counter-clockwise order and reject concave polygons:
+        corners: List[Tuple[float, float, float]] = [
+            (float(x), float(y), float(radius)) for x, y, radius in contour["Corners"]]
+        size: int = len(corners)
+        area: float = sum([corners[index][0] * corners[(index + 1) % size][1] -
+                           corners[(index + 1) % size][0] * corners[index][1]
+                           for index in range(size)]) / 2.0
+        if abs(area) < 1.0e-9:
+            return None
+        if area < 0.0:
+            corners.reverse()
+        index: int
+        for index in range(size):
+            x0, y0, _ = corners[index - 1]
+            x1, y1, _ = corners[index]
+            x2, y2, _ = corners[(index + 1) % size]
+            if (x1 - x0) * (y2 - y1) - (y1 - y0) * (x2 - x1) <= 1.0e-9:
+                return None  # Concave (or colinear) corner.
+
+        # Compute the outward *normals* of each edge from corner[i] to corner[i + 1]:
+        normals: List[Tuple[float, float]] = []
+        for index in range(size):
+            x1, y1, _ = corners[index]
+            x2, y2, _ = corners[(index + 1) % size]
+            length: float = math.hypot(x2 - x1, y2 - y1)
+            normals.append(((y2 - y1) / length, -(x2 - x1) / length))
+
+        # Compute the fillet *centers*, which are *radius* away from both adjacent edges:
+        centers: List[Tuple[float, float]] = []
+        for index in range(size):
+            x, y, radius = corners[index]
+            nx0, ny0 = normals[index - 1]
+            nx1, ny1 = normals[index]
+            scale: float = radius / (1.0 + nx0 * nx1 + ny0 * ny1)
+            centers.append((x - scale * (nx0 + nx1), y - scale * (ny0 + ny1)))
+
+        # Walk the edges counter-clockwise, with a G3 arc around each corner:
+        def offset(corner_index: int, normal_index: int) -> Tuple[float, float]:
+            """Return a fillet center offset by the tool radius along an edge normal."""
+            distance: float = corners[corner_index][2] + tool_radius
+            return (centers[corner_index][0] + distance * normals[normal_index][0],
+                    centers[corner_index][1] + distance * normals[normal_index][1])
+
+        start = offset(0, 0)
+        for index in range(size):
+            next_index: int = (index + 1) % size
+            line_end: Tuple[float, float] = offset(next_index, index)
+            arc_end: Tuple[float, float] = offset(next_index, next_index)
+            moves.append(("G1", line_end[0], line_end[1]))
+            moves.append(("G3", arc_end[0], arc_end[1],
+                          centers[next_index][0] - line_end[0],
+                          centers[next_index][1] - line_end[1]))
+
+        # Reverse the moves to go around clockwise:
+        if clockwise:
+            points: List[Tuple[float, float]] = [start] + [
+                (move[1], move[2]) for move in moves]
+            reversed_moves: List[Tuple[Any, ...]] = []
+            for index in range(len(moves) - 1, -1, -1):
+                move: Tuple[Any, ...] = moves[index]
+                end_x, end_y = points[index]
+                if move[0] == "G1":
+                    reversed_moves.append(("G1", end_x, end_y))
+                else:
+                    # Same arc center, but measured from the other end of the arc:
+                    center_x, center_y = (points[index][0] + move[3], points[index][1] + move[4])
+                    reversed_moves.append(("G2", end_x, end_y,
+                                           center_x - move[1], center_y - move[2]))
+            moves = reversed_moves
+        return start, moves
+
+    # FabGCodeEmitter.isSupported():
+    def isSupported(self, operation: Dict[str, Any]) -> bool:
+        """Return True if an operation JSON dictionary can be emitted natively."""
+        if not operation.get("_Active", True):
+            return True  # Inactive operations are simply skipped.
+        kind: str = operation.get("Kind", "")
+        supported: bool = False
+        if kind == "Drilling":
+            supported = "CNCCenters" in operation
+        elif kind == "Extrude" and "CNCContour" in operation:
+            supported = operation.get("_Side", "Outside") == "Outside" and (
+                FabGCodeEmitter.contourMoves(operation["CNCContour"], 1.0, False) is not None)
+        return supported
+
+    # FabGCodeEmitter.emitMount():
+    def emitMount(self, job_name: str, mount: Dict[str, Any]) -> Optional[str]:
+        """Return the G-code for a FabMount JSON dictionary (None if it needs FreeCAD)."""
+        # Always record the bits and tool controllers so later mounts can refer to them:
+        operations: List[Dict[str, Any]] = cast(List[Dict[str, Any]], mount.get("children", []))
+        operation: Dict[str, Any]
+        for operation in operations:
+            if "Bit" in operation and "BitIndex" in operation:
+                self.Bits[operation["BitIndex"]] = operation["Bit"]
+            if "ToolController" in operation and "ToolControllerIndex" in operation:
+                self.ToolControllers[operation["ToolControllerIndex"]] = (
+                    operation["ToolController"])
+        if not all([self.isSupported(operation) for operation in operations]):
+            return None
+
+        lines: List[str] = [
+            f"(Exported by FabGCodes: {job_name})",
+            "(Post Processor: linuxcnc)",
+            "(begin preamble)",
+            "G17 G54 G40 G49 G80 G90",
+            "G21",
+        ]
+        current_tool: int = -1
+        for operation in operations:
+            if not operation.get("_Active", True):
+                continue
+            controller: Dict[str, Any] = operation.get("ToolController") or (
+                self.ToolControllers[operation["ToolControllerIndex"]])
+            tool_number: int = controller["ToolNumber"]
+            if tool_number != current_tool:
+                lines.extend(self.emitToolChange(controller))
+                current_tool = tool_number
+            lines.append(f"(begin operation: {operation['Label']})")
+            if operation["Kind"] == "Drilling":
+                lines.extend(self.emitDrilling(operation, controller))
+            else:
+                bit: Dict[str, Any] = operation.get("Bit") or self.Bits[operation["BitIndex"]]
+                tool_diameter: float = FabGCodeEmitter.parseLength(
+                    bit["parameter"]["Diameter"])
+                lines.extend(self.emitContour(operation, controller, tool_diameter / 2.0))
+            lines.append(f"(finish operation: {operation['Label']})")
+        lines.extend([
+            "(begin postamble)",
+            "M05",
+            "M09",
+            "G17 G54 G90 G80 G40",
+            "M2",
+        ])
+        return "\n".join(lines) + "\n"
+
+    # FabGCodeEmitter.emitToolChange():
+    def emitToolChange(self, controller: Dict[str, Any]) -> List[str]:
+        """Return the tool change G-code lines for a ToolController JSON dictionary."""
+        tool_number: int = controller["ToolNumber"]
+        spindle: str = "M3" if controller["SpindleDirection"] else "M4"
+        lines: List[str] = [
+            f"(begin toolchange: {controller['BitName']})",
+            f"M6 T{tool_number}",
+            f"G43 H{tool_number}",
+            f"{spindle} S{controller['SpindleSpeed']}",
+        ]
+        cooling: Dict[str, str] = {"Flood": "M8", "Mist": "M7"}
+        if controller["Cooling"] in cooling:
+            lines.append(cooling[controller["Cooling"]])
+        return lines
+
+    # FabGCodeEmitter.emitDrilling():
+    def emitDrilling(self, operation: Dict[str, Any], controller: Dict[str, Any]) -> List[str]:
+        """Return the G81/G83 canned cycle G-code lines for a Drilling JSON dictionary."""
+        number: Any = self.number
+        clearance: float = operation["_ClearanceHeight"]
+        retract: float = operation["_StartDepth"] + operation["_SafeHeight"]
+        final_depth: float = operation["_FinalDepth"]
+        feed: float = 60.0 * controller["VerticalFeed"]  # mm/sec => mm/min
+        cycle: str = "G81"
+        peck: str = ""
+        if operation.get("_PeckEnabled", False):
+            cycle = "G83"
+            peck = f" Q{number(operation['_PeckDepth'])}"
+        lines: List[str] = [f"G0 Z{number(clearance)}", "G90", "G98"]
+        x: float
+        y: float
+        for x, y in operation["CNCCenters"]:
+            lines.append(f"{cycle} X{number(x)} Y{number(y)} Z{number(final_depth)} "
+                         f"R{number(retract)}{peck} F{number(feed)}")
+        lines.extend(["G80", f"G0 Z{number(clearance)}"])
+        return lines
+
+    # FabGCodeEmitter.emitContour():
+    def emitContour(self, operation: Dict[str, Any], controller: Dict[str, Any],
+                    tool_radius: float) -> List[str]:
+        """Return the profile pass G-code lines for an Extrude JSON dictionary."""
+        number: Any = self.number
+        clearance: float = operation["_ClearanceHeight"]
+        start_depth: float = operation["_StartDepth"]
+        safe_height: float = start_depth + operation["_SafeHeight"]
+        final_depth: float = operation["_FinalDepth"]
+        step_down: float = operation["_StepDown"]
+        horizontal_feed: float = 60.0 * controller["HorizontalFeed"]  # mm/sec => mm/min
+        vertical_feed: float = 60.0 * controller["VerticalFeed"]
+        clockwise: bool = operation.get("_Direction", "CCW") == "CW"
+        contour: Optional[Tuple[Tuple[float, float], List[Tuple[Any, ...]]]] = (
+            FabGCodeEmitter.contourMoves(operation["CNCContour"], tool_radius, clockwise))
+        assert contour is not None, "FabGCodeEmitter.emitContour(): Unsupported contour"
+        start, moves = contour
+
+        # Compute the pass *depths* from *start_depth* down to *final_depth*:
+        depths: List[float] = []
+        depth: float = start_depth
+        while depth - final_depth > 1.0e-9:
+            depth = max(final_depth, depth - step_down) if step_down > 0.0 else final_depth
+            depths.append(depth)
+
+        lines: List[str] = [
+            f"G0 Z{number(clearance)}",
+            f"G0 X{number(start[0])} Y{number(start[1])}",
+            f"G0 Z{number(safe_height)}",
+        ]
+        for depth in depths:
+            lines.append(f"G1 Z{number(depth)} F{number(vertical_feed)}")
+            move: Tuple[Any, ...]
+            for move in moves:
+                line: str = f"{move[0]} X{number(move[1])} Y{number(move[2])}"
+                if move[0] != "G1":
+                    line += f" I{number(move[3])} J{number(move[4])}"
+                lines.append(f"{line} F{number(horizontal_feed)}")
+        lines.append(f"G0 Z{number(clearance)}")
+        return lines
+
+    # FabGCodeEmitter.number():
+    def number(self, value: float) -> str:
+        """Return a number formatted to the G-code precision."""
+        text: str = f"{value:.{self.Precision}f}"
+        return "0" + text[2:] if text.startswith("-0") and float(text) == 0.0 else text
+
+    # FabGCodeEmitter._unit_tests():
+    @staticmethod
+    def _unit_tests(tracing: str = "") -> None:
+        """Run FabGCodeEmitter unit tests."""
+        if tracing:
+            print(f"{tracing}=>FabGCodeEmitter._unit_tests()")
+
+        # parseLength():
+        assert FabGCodeEmitter.parseLength(5) == 5.0
+        assert FabGCodeEmitter.parseLength("5.000 mm") == 5.0
+        assert abs(FabGCodeEmitter.parseLength("0.125 in") - 3.175) < 1.0e-9
+        try:
+            FabGCodeEmitter.parseLength("5 furlongs")
+            assert False, "parseLength() did not fail"
+        except RuntimeError as runtime_error:
+            assert str(runtime_error) == (
+                "FabGCodeEmitter.parseLength(): Can not parse '5 furlongs'."), runtime_error
+
+        # contourMoves() for a circle:
+        circle: Dict[str, Any] = {"Kind": "Circle", "Center": [10.0, 20.0], "Diameter": 8.0}
+        result: Any = FabGCodeEmitter.contourMoves(circle, 1.0, False)
+        assert result == ((15.0, 20.0), [("G3", 15.0, 20.0, -5.0, 0.0)]), result
+
+        # contourMoves() for a clockwise 20x10 rectangle with one 2mm fillet and a 1mm tool:
+        rectangle: Dict[str, Any] = {"Kind": "Polygon", "Corners": [
+            [0.0, 0.0, 0.0], [0.0, 10.0, 0.0], [20.0, 10.0, 2.0], [20.0, 0.0, 0.0]]}
+        start: Tuple[float, float]
+        moves: List[Tuple[Any, ...]]
+        result = FabGCodeEmitter.contourMoves(rectangle, 1.0, False)
+        assert result is not None
+        start, moves = result
+        assert start == (21.0, 0.0), start  # Reversed to counter-clockwise order
+        assert len(moves) == 8, moves
+        assert moves[0] == ("G1", 21.0, 8.0), moves[0]
+        assert moves[1] == ("G3", 18.0, 11.0, -3.0, 0.0), moves[1]  # 2mm + 1mm fillet arc
+        assert moves[3] == ("G3", -1.0, 10.0, 0.0, -1.0), moves[3]
+        assert moves[-1] == ("G3", 21.0, 0.0, 0.0, 1.0), moves[-1]
+        move: Tuple[Any, ...]
+        for move in moves:
+            assert -1.0 <= move[1] <= 21.0 and -1.0 <= move[2] <= 11.0 or move[0] != "G1", move
+
+        # Clockwise visits the same points in reverse with the same arc centers:
+        result = FabGCodeEmitter.contourMoves(rectangle, 1.0, True)
+        assert result is not None
+        cw_start, cw_moves = result
+        assert cw_start == start
+        assert [(move[1], move[2]) for move in cw_moves] == (
+            [(move[1], move[2]) for move in reversed(moves[:-1])] + [start]), cw_moves
+        assert cw_moves[0] == ("G2", 20.0, -1.0, -1.0, 0.0), cw_moves[0]  # Center (20, 0)
+        assert cw_moves[-1] == ("G1", 21.0, 0.0)
+
+        # Concave polygons are not supported:
+        concave: Dict[str, Any] = {"Kind": "Polygon", "Corners": [
+            [0.0, 0.0, 0.0], [10.0, 0.0, 0.0], [5.0, 2.0, 0.0], [10.0, 10.0, 0.0],
+            [0.0, 10.0, 0.0]]}
+        assert FabGCodeEmitter.contourMoves(concave, 1.0, False) is None
+
+        # emitMount() with a drilling and a contour operation:
+        controller: Dict[str, Any] = {
+            "BitName": "Bit1", "Cooling": "Flood", "HorizontalFeed": 10.0,
+            "HorizontalRapid": 100.0, "SpindleDirection": True, "SpindleSpeed": 12000,
+            "ToolNumber": 1, "VerticalFeed": 5.0, "VerticalRapid": 50.0}
+        drilling: Dict[str, Any] = {
+            "Kind": "Drilling", "Label": "Holes", "_Active": True, "ToolControllerIndex": 0,
+            "ToolController": controller, "CNCCenters": [[1.0, 2.0], [3.0, 4.0]],
+            "_ClearanceHeight": 10.0, "_FinalDepth": -6.0, "_PeckDepth": 2.0,
+            "_PeckEnabled": False, "_SafeHeight": 5.0, "_StartDepth": 0.0}
+        extrude: Dict[str, Any] = {
+            "Kind": "Extrude", "Label": "Outline", "_Active": True, "BitIndex": 1,
+            "Bit": {"parameter": {"Diameter": "2.000 mm"}}, "ToolControllerIndex": 1,
+            "ToolController": dict(controller, BitName="Bit2", ToolNumber=2),
+            "CNCContour": circle, "_ClearanceHeight": 10.0, "_Direction": "CCW",
+            "_FinalDepth": -5.0, "_SafeHeight": 5.0, "_Side": "Outside",
+            "_StartDepth": 0.0, "_StepDown": 3.0}
+        emitter: FabGCodeEmitter = FabGCodeEmitter()
+        gcode: Optional[str] = emitter.emitMount("Part_Top", {
+            "Kind": "Mount", "Label": "Top", "children": [drilling, extrude]})
+        assert isinstance(gcode, str)
+        lines: List[str] = gcode.split("\n")
+        assert "G81 X1.000 Y2.000 Z-6.000 R5.000 F300.000" in lines, lines
+        assert "G81 X3.000 Y4.000 Z-6.000 R5.000 F300.000" in lines, lines
+        assert lines.count("M6 T1") == 1 and lines.count("M6 T2") == 1, lines
+        assert "M3 S12000" in lines and "M8" in lines, lines
+        assert "G1 Z-3.000 F300.000" in lines and "G1 Z-5.000 F300.000" in lines, lines
+        assert lines.count("G3 X15.000 Y20.000 I-5.000 J0.000 F600.000") == 2, lines
+        assert lines[-2] == "M2", lines
+
+        # Peck drilling uses G83 and the tool controllers are remembered by index:
+        peck_drilling: Dict[str, Any] = dict(drilling, _PeckEnabled=True, Label="Pecks")
+        del peck_drilling["ToolController"]
+        gcode = emitter.emitMount("Part_Bottom", {"children": [peck_drilling]})
+        assert isinstance(gcode, str)
+        assert "G83 X1.000 Y2.000 Z-6.000 R5.000 Q2.000 F300.000" in gcode.split("\n"), gcode
+
+        # Pockets and inside contours need FreeCAD:
+        pocket: Dict[str, Any] = {"Kind": "Pocket", "Label": "Pocket", "_Active": True}
+        assert emitter.emitMount("Part_Pocket", {"children": [drilling, pocket]}) is None
+        inside: Dict[str, Any] = dict(extrude, _Side="Inside")
+        assert emitter.emitMount("Part_Inside", {"children": [inside]}) is None
+        assert emitter.number(-0.0001) == "0.000"
+
+        if tracing:
+            print(f"{tracing}<=FabGCodeEmitter._unit_tests()")
+
+
+# Fab_GCodeToolStatistics:
+@dataclass
+class Fab_GCodeToolStatistics(object):
+    """Fab_GCodeToolStatistics: The G-code statistics for one tool.
+
+    Attributes:
+    * *Tool* (int): The tool number (0 before the first tool change.)
+    * *CuttingDistance* (float): The G1/G2/G3 and canned cycle feed distance in millimeters.
+    * *RapidDistance* (float): The G0 (and canned cycle retract) distance in millimeters.
+    * *Plunges* (int): The number of straight down feed moves (including each drilled hole.)
+    * *CuttingTime* (float): The estimated cutting time in seconds.
+    * *RapidTime* (float): The estimated rapid time in seconds.
+
+    Constructor:
+    * Fab_GCodeToolStatistics(Tool)
+
+    """
+
+    Tool: int
+    CuttingDistance: float = 0.0
+    RapidDistance: float = 0.0
+    Plunges: int = 0
+    CuttingTime: float = 0.0
+    RapidTime: float = 0.0
+
+    # Fab_GCodeToolStatistics.to_json():
+    def to_json(self) -> Dict[str, Any]:
+        """Return the Fab_GCodeToolStatistics as a JSON dictionary."""
+        return {
+            "CuttingDistance": round(self.CuttingDistance, 3),
+            "CuttingTime": round(self.CuttingTime, 3),
+            "Plunges": self.Plunges,
+            "RapidDistance": round(self.RapidDistance, 3),
+            "RapidTime": round(self.RapidTime, 3),
+            "Tool": self.Tool,
+        }
+
+
+# FabGCodeAnalysis:
+@dataclass
+class FabGCodeAnalysis(object):
+    """FabGCodeAnalysis: The results of analyzing one G-code file.
+
+    Attributes:
+    * *Name* (str): The G-code file name.
+    * *Tools* (Dict[int, Fab_GCodeToolStatistics]): The statistics for each tool number.
+    * *ToolChanges* (int): The number of M6 tool changes.
+    * *ToolChangeTime* (float): The seconds needed for each tool change.
+
+    Computed Attributes:
+    * *CuttingDistance* (float): The total cutting distance in millimeters.
+    * *RapidDistance* (float): The total rapid distance in millimeters.
+    * *Plunges* (int): The total number of plunges.
+    * *Runtime* (float): The estimated runtime in seconds (including tool changes.)
+
+    Constructor:
+    * FabGCodeAnalysis(Name, Tools, ToolChanges, ToolChangeTime)
+
+    """
+
+    Name: str
+    Tools: Dict[int, Fab_GCodeToolStatistics]
+    ToolChanges: int
+    ToolChangeTime: float
+
+    # FabGCodeAnalysis.CuttingDistance():
+    @property
+    def CuttingDistance(self) -> float:
+        """Return the total cutting distance in millimeters."""
+        return sum([tool.CuttingDistance for tool in self.Tools.values()])
+
+    # FabGCodeAnalysis.RapidDistance():
+    @property
+    def RapidDistance(self) -> float:
+        """Return the total rapid distance in millimeters."""
+        return sum([tool.RapidDistance for tool in self.Tools.values()])
+
+    # FabGCodeAnalysis.Plunges():
+    @property
+    def Plunges(self) -> int:
+        """Return the total number of plunges."""
+        return sum([tool.Plunges for tool in self.Tools.values()])
+
+    # FabGCodeAnalysis.Runtime():
+    @property
+    def Runtime(self) -> float:
+        """Return the estimated runtime in seconds."""
+        return (sum([tool.CuttingTime + tool.RapidTime for tool in self.Tools.values()]) +
+                self.ToolChanges * self.ToolChangeTime)
+
+    # FabGCodeAnalysis.to_json():
+    def to_json(self) -> Dict[str, Any]:
+        """Return the FabGCodeAnalysis as a JSON dictionary."""
+        return {
+            "CuttingDistance": round(self.CuttingDistance, 3),
+            "Name": self.Name,
+            "Plunges": self.Plunges,
+            "RapidDistance": round(self.RapidDistance, 3),
+            "Runtime": round(self.Runtime, 3),
+            "ToolChanges": self.ToolChanges,
+            "Tools": [self.Tools[tool].to_json() for tool in sorted(self.Tools.keys())],
+        }
+
+
+# FabGCodeAnalyzer:
+@dataclass
+class FabGCodeAnalyzer(object):
+    """FabGCodeAnalyzer: Analyze G-code files and write a JSON benchmark report.
+
+    The feeds come from the G-code "F" words and the rapid feeds come from the CNC machine.
+    Rapid moves are timed with the X/Y and Z axes moving at the same time.  Arcs (G2/G3 in the
+    X/Y plane), inch/metric units (G20/G21), absolute/incremental moves (G90/G91), and the
+    G73/G81/G82/G83 canned drilling cycles (with G98/G99 retracts) are supported.
+
+    Attributes:
+    * *HorizontalRapid* (float): The X/Y rapid feed in mm/sec.
+    * *VerticalRapid* (float): The Z rapid feed in mm/sec.
+    * *ToolChangeTime* (float): The seconds needed to change a tool.  (Default: 30.0)
+
+    Constructor:
+    * FabGCodeAnalyzer(HorizontalRapid, VerticalRapid, ToolChangeTime)
+
+    """
+
+    HorizontalRapid: float
+    VerticalRapid: float
+    ToolChangeTime: float = 30.0
+
+    # FabGCodeAnalyzer.__post_init__():
+    def __post_init__(self) -> None:
+        """Initialize FabGCodeAnalyzer."""
+        if self.HorizontalRapid <= 0.0 or self.VerticalRapid <= 0.0:
+            raise RuntimeError(
+                "FabGCodeAnalyzer.__post_init__(): Rapid feeds "
+                f"({self.HorizontalRapid}, {self.VerticalRapid}) must be positive.")
+
+    # FabGCodeAnalyzer.fromMachine():
+    @staticmethod
+    def fromMachine(machine: Any) -> "FabGCodeAnalyzer":
+        """Return a FabGCodeAnalyzer that uses the rapids of a FabCNC machine (see FabShops.)"""
+        return FabGCodeAnalyzer(machine.getHorizontalRapidFeed(),
+                                machine.getVerticalRapidFeed(), machine.ToolChangeTime)
+
+    # FabGCodeAnalyzer.analyze():
+    def analyze(self, name: str, gcode: str) -> FabGCodeAnalysis:
+        """Return the FabGCodeAnalysis of some G-code text."""
+        tools: Dict[int, Fab_GCodeToolStatistics] = {0: Fab_GCodeToolStatistics(0)}
+        statistics: Fab_GCodeToolStatistics = tools[0]
+        position: List[float] = [0.0, 0.0, 0.0]
+        scale: float = 1.0  # G21 (mm)
+        absolute: bool = True  # G90
+        motion: str = ""
+        feed: float = 0.0  # mm/min
+        next_tool: int = 0
+        tool_changes: int = 0
+        retract_to_initial: bool = True  # G98
+        cycle_initial_z: float = 0.0
+        cycle_values: Dict[str, float] = {}
+
+        def rapid(target: List[float]) -> None:
+            """Perform a rapid move to *target*."""
+            horizontal: float = math.hypot(target[0] - position[0], target[1] - position[1])
+            vertical: float = abs(target[2] - position[2])
+            statistics.RapidDistance += math.hypot(horizontal, vertical)
+            statistics.RapidTime += max(horizontal / self.HorizontalRapid,
+                                        vertical / self.VerticalRapid)
+            position[:] = target
+
+        def cut(target: List[float], distance: float) -> None:
+            """Perform a feed move to *target* that is *distance* long."""
+            statistics.CuttingDistance += distance
+            if feed > 0.0:
+                statistics.CuttingTime += 60.0 * distance / feed
+            position[:] = target
+
+        line: str
+        for line in gcode.split("\n"):
+            # Strip comments and split the line into (letter, value) *words*:
+            line = re.sub(r"\([^)]*\)?", "", line.split(";")[0].upper())
+            words: List[Tuple[str, float]] = []
+            text: str = line.replace(" ", "").replace("\t", "")
+            index: int = 0
+            while index < len(text):
+                letter: str = text[index]
+                end: int = index + 1
+                while end < len(text) and (text[end].isdigit() or text[end] in "+-."):
+                    end += 1
+                if letter.isalpha() and end > index + 1:
+                    words.append((letter, float(text[index + 1:end])))
+                index = end
+
+            # Process the modal codes ("T" first so that "M6 T3" and "T3 M6" both work):
+            values: Dict[str, float] = {}
+            letter_value: Tuple[str, float]
+            for letter_value in words:
+                if letter_value[0] == "T":
+                    next_tool = int(letter_value[1])
+            for letter_value in words:
+                letter, value = letter_value
+                if letter == "G":
+                    code: str = f"G{value:g}"
+                    if code in ("G0", "G1", "G2", "G3", "G73", "G81", "G82", "G83"):
+                        if code in ("G73", "G81", "G82", "G83") and motion not in (
+                                "G73", "G81", "G82", "G83"):
+                            cycle_initial_z = position[2]
+                        motion = code
+                    elif code == "G80":
+                        motion = ""
+                    elif code in ("G20", "G21"):
+                        scale = 25.4 if code == "G20" else 1.0
+                    elif code in ("G90", "G91"):
+                        absolute = code == "G90"
+                    elif code in ("G98", "G99"):
+                        retract_to_initial = code == "G98"
+                elif letter == "M" and value == 6.0:
+                    tool_changes += 1
+                    if next_tool not in tools:
+                        tools[next_tool] = Fab_GCodeToolStatistics(next_tool)
+                    statistics = tools[next_tool]
+                elif letter == "T":
+                    pass
+                elif letter == "F":
+                    feed = value * scale
+                else:
+                    values[letter] = value * scale
+
+            # Compute the *target* position:
+            if not any([axis in values for axis in "XYZ"]) or not motion:
+                continue
+            target: List[float] = list(position)
+            axis_index: int
+            for axis_index, axis in enumerate("XYZ"):
+                if axis in values:
+                    target[axis_index] = (
+                        values[axis] if absolute else position[axis_index] + values[axis])
+
+            # Perform the move:
+            if motion == "G0":
+                rapid(target)
+            elif motion == "G1":
+                horizontal = math.hypot(target[0] - position[0], target[1] - position[1])
+                if target[2] < position[2] - 1.0e-9 and horizontal < 1.0e-9:
+                    statistics.Plunges += 1
+                cut(target, math.dist(position, target))
+            elif motion in ("G2", "G3"):
+                start_x, start_y = position[0], position[1]
+                dx: float = target[0] - start_x
+                dy: float = target[1] - start_y
+                sweep: float
+                radius: float
+                if "R" in values:
+                    radius = abs(values["R"])
+                    chord: float = math.hypot(dx, dy)
+                    sweep = 2.0 * math.asin(min(1.0, chord / (2.0 * radius)))
+                    if values["R"] < 0.0:
+                        sweep = 2.0 * math.pi - sweep
+                else:
+                    center_x: float = start_x + values.get("I", 0.0)
+                    center_y: float = start_y + values.get("J", 0.0)
+                    radius = math.hypot(start_x - center_x, start_y - center_y)
+                    start_angle: float = math.atan2(start_y - center_y, start_x - center_x)
+                    end_angle: float = math.atan2(target[1] - center_y, target[0] - center_x)
+                    sweep = (end_angle - start_angle if motion == "G3"
+                             else start_angle - end_angle) % (2.0 * math.pi)
+                    if sweep < 1.0e-9:
+                        sweep = 2.0 * math.pi  # Full circle
+                cut(target, math.hypot(radius * sweep, target[2] - position[2]))
+            else:
+                # Canned drilling cycle:
+                cycle_values.update(values)
+                retract: float = cycle_values.get("R", position[2])
+                bottom: float = target[2] if "Z" in values else cycle_values.get(
+                    "Z", position[2])
+                clearance: float = max(cycle_initial_z, retract) if retract_to_initial else retract
+                rapid([target[0], target[1], position[2]])
+                rapid([target[0], target[1], retract])
+                peck: float = cycle_values.get("Q", 0.0) if motion in ("G73", "G83") else 0.0
+                depth: float = retract
+                while peck > 0.0 and depth - peck > bottom + 1.0e-9:
+                    # Feed down one peck, then rapid out and back down (G73 barely retracts):
+                    depth -= peck
+                    cut([target[0], target[1], depth], peck)
+                    retract_distance: float = (retract - depth) if motion == "G83" else 0.0
+                    statistics.RapidDistance += 2.0 * retract_distance
+                    statistics.RapidTime += 2.0 * retract_distance / self.VerticalRapid
+                cut([target[0], target[1], bottom], depth - bottom)
+                statistics.Plunges += 1
+                rapid([target[0], target[1], clearance])
+
+        # Drop the tool 0 entry when the G-code always has a tool loaded:
+        if tools[0].CuttingDistance == 0.0 and tools[0].RapidDistance == 0.0 and len(tools) > 1:
+            del tools[0]
+        return FabGCodeAnalysis(name, tools, tool_changes, self.ToolChangeTime)
+
+    # FabGCodeAnalyzer.benchmark():
+    def benchmark(self, gcode_paths: List[str], report_path: str) -> Dict[str, Any]:
+        """Analyze some G-code files and write a JSON benchmark report."""
+        analyses: List[FabGCodeAnalysis] = []
+        gcode_path: str
+        for gcode_path in gcode_paths:
+            gcode_file: IO[str]
+            with open(gcode_path, "r") as gcode_file:
+                analyses.append(self.analyze(gcode_path, gcode_file.read()))
+        analysis: FabGCodeAnalysis
+        report: Dict[str, Any] = {
+            "Files": [analysis.to_json() for analysis in analyses],
+            "Machine": {
+                "HorizontalRapid": self.HorizontalRapid,
+                "ToolChangeTime": self.ToolChangeTime,
+                "VerticalRapid": self.VerticalRapid,
+            },
+            "Totals": {
+                "CuttingDistance": round(sum([analysis.CuttingDistance
+                                              for analysis in analyses]), 3),
+                "Plunges": sum([analysis.Plunges for analysis in analyses]),
+                "RapidDistance": round(sum([analysis.RapidDistance for analysis in analyses]), 3),
+                "Runtime": round(sum([analysis.Runtime for analysis in analyses]), 3),
+                "ToolChanges": sum([analysis.ToolChanges for analysis in analyses]),
+            },
+        }
+        report_file: IO[str]
+        with open(report_path, "w") as report_file:
+            report_file.write(json.dumps(report, indent=2, sort_keys=True))
+        return report
+
+    # FabGCodeAnalyzer.compareReports():
+    @staticmethod
+    def compareReports(previous: Dict[str, Any], current: Dict[str, Any],
+                       tolerance: float = 0.01) -> List[str]:
+        """Return the differences between two benchmark reports (e.g. from two versions.)
+
+        Arguments:
+        * *previous* (Dict[str, Any]): The previous benchmark report.
+        * *current* (Dict[str, Any]): The current benchmark report.
+        * *tolerance* (float): The relative change that is ignored.  (Default: 0.01)
+
+        Returns:
+        * (List[str]): One line for each file metric that changed by more than *tolerance*.
+
+        """
+        previous_files: Dict[str, Dict[str, Any]] = {
+            file_json["Name"]: file_json for file_json in previous["Files"]}
+        differences: List[str] = []
+        file_json: Dict[str, Any]
+        for file_json in current["Files"]:
+            name: str = file_json["Name"]
+            if name not in previous_files:
+                differences.append(f"{name}: new file")
+                continue
+            metric: str
+            for metric in ("CuttingDistance", "RapidDistance", "Plunges",
+                           "ToolChanges", "Runtime"):
+                before: float = previous_files[name][metric]
+                after: float = file_json[metric]
+                if abs(after - before) > tolerance * max(abs(before), 1.0e-9):
+                    differences.append(f"{name}: {metric} {before} => {after}")
+        current_names: Set[str] = set([file_json["Name"] for file_json in current["Files"]])
+        for name in sorted(previous_files.keys()):
+            if name not in current_names:
+                differences.append(f"{name}: missing file")
+        return differences
+
+    # FabGCodeAnalyzer._unit_tests():
+    @staticmethod
+    def _unit_tests(tracing: str = "") -> None:
+        """Run FabGCodeAnalyzer unit tests."""
+        if tracing:
+            print(f"{tracing}=>FabGCodeAnalyzer._unit_tests()")
+
+        try:
+            FabGCodeAnalyzer(0.0, 10.0)
+            assert False, "FabGCodeAnalyzer() did not fail"
+        except RuntimeError as runtime_error:
+            assert str(runtime_error) == ("FabGCodeAnalyzer.__post_init__(): "
+                                          "Rapid feeds (0.0, 10.0) must be positive."), (
+                                              runtime_error)
+
+        # Lines, arcs, rapids, plunges, comments, and a tool change:
+        analyzer: FabGCodeAnalyzer = FabGCodeAnalyzer(100.0, 10.0, 20.0)
+        analysis: FabGCodeAnalysis = analyzer.analyze("test.ngc", "\n".join([
+            "(Header comment)",
+            "G17 G54 G40 G49 G80 G90",
+            "G21",
+            "M6 T3 (Tool 3)",
+            "G0 X30 Y40 Z10",  # Rapid 50mm X/Y (0.5 sec) and 10mm Z (1.0 sec)
+            "G1 Z0 F600",  # Plunge 10mm at 10mm/sec
+            "G1 X60 ; Cut 30mm",
+            "G3 X60 Y40 I-10 J0",  # Full 10mm radius circle
+            "G2 X80 Y40 R10",  # 180 degree arc
+            "G0 Z10",
+        ]))
+        assert analysis.ToolChanges == 1 and list(analysis.Tools.keys()) == [3], analysis
+        tool: Fab_GCodeToolStatistics = analysis.Tools[3]
+        assert tool.Plunges == 1, tool
+        circle: float = 2.0 * math.pi * 10.0
+        half_circle: float = math.pi * 10.0
+        assert abs(tool.CuttingDistance - (10.0 + 30.0 + circle + half_circle)) < 1.0e-9, tool
+        assert abs(tool.CuttingTime - tool.CuttingDistance / 10.0) < 1.0e-9, tool
+        assert abs(tool.RapidDistance - (math.hypot(50.0, 10.0) + 10.0)) < 1.0e-9, tool
+        assert abs(tool.RapidTime - 2.0) < 1.0e-9, tool
+        assert abs(analysis.Runtime - (tool.CuttingTime + 2.0 + 20.0)) < 1.0e-9, analysis
+
+        # Inches, incremental moves, and canned drilling cycles:
+        analysis = analyzer.analyze("drill.ngc", "\n".join([
+            "G20 G91",
+            "G1 X1 F10",  # 25.4mm at 254mm/min
+            "G90 G21 M6 T1",
+            "G0 Z10",
+            "G98 G81 X0 Y0 Z-5 R2 F60",  # Rapid Z10=>2, feed 2=>-5, rapid -5=>10
+            "X10",  # Repeat at X10 (10mm rapid over)
+            "G80",
+            "G99 G83 X20 Z-6 R2 Q3 F60",  # Pecks at -1 and -4, then -6, retract to R
+        ]))
+        assert analysis.ToolChanges == 1 and sorted(analysis.Tools.keys()) == [0, 1], analysis
+        assert abs(analysis.Tools[0].CuttingDistance - 25.4) < 1.0e-9, analysis.Tools[0]
+        drill: Fab_GCodeToolStatistics = analysis.Tools[1]
+        assert drill.Plunges == 3, drill
+        assert abs(drill.CuttingDistance - (7.0 + 7.0 + 8.0)) < 1.0e-9, drill
+        want_rapid: float = (
+            10.0 + 25.4 + 8.0 + 15.0 +  # Up to Z10, over to X0, first hole
+            10.0 + 8.0 + 15.0 +  # Second hole
+            10.0 + 8.0 + 2.0 * 3.0 + 2.0 * 6.0 + 8.0)  # Peck hole (with peck retracts)
+        assert abs(drill.RapidDistance - want_rapid) < 1.0e-9, (drill.RapidDistance, want_rapid)
+
+        # FabGCodeEmitter output analyzes cleanly:
+        emitter: FabGCodeEmitter = FabGCodeEmitter()
+        controller: Dict[str, Any] = {
+            "BitName": "Bit1", "Cooling": "None", "HorizontalFeed": 10.0,
+            "HorizontalRapid": 100.0, "SpindleDirection": True, "SpindleSpeed": 12000,
+            "ToolNumber": 7, "VerticalFeed": 5.0, "VerticalRapid": 50.0}
+        gcode: Optional[str] = emitter.emitMount("Part_Top", {"children": [{
+            "Kind": "Extrude", "Label": "Outline", "_Active": True, "BitIndex": 1,
+            "Bit": {"parameter": {"Diameter": "2.000 mm"}}, "ToolControllerIndex": 1,
+            "ToolController": controller,
+            "CNCContour": {"Kind": "Polygon", "Corners": [
+                [0.0, 0.0, 0.0], [20.0, 0.0, 0.0], [20.0, 10.0, 0.0], [0.0, 10.0, 0.0]]},
+            "_ClearanceHeight": 10.0, "_Direction": "CCW", "_FinalDepth": -6.0,
+            "_SafeHeight": 5.0, "_Side": "Outside", "_StartDepth": 0.0, "_StepDown": 3.0}]})
+        assert isinstance(gcode, str)
+        analysis = analyzer.analyze("Part_Top.ngc", gcode)
+        perimeter: float = 2.0 * (20.0 + 10.0) + 2.0 * math.pi * 1.0
+        plunge: float = 5.0 + 3.0 + 3.0  # From the safe height down to -3 and then -6
+        assert abs(analysis.Tools[7].CuttingDistance - (2.0 * perimeter + plunge)) < 1.0e-9, (
+            analysis.Tools[7])
+        assert analysis.Tools[7].Plunges == 2, analysis.Tools[7]
+
+        # benchmark() and compareReports():
+        temporary_directory: str
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            gcode_path: str = str(PathFile(temporary_directory) / "FabGCodes_unit_test.ngc")
+            gcode_file: IO[str]
+            with open(gcode_path, "w") as gcode_file:
+                gcode_file.write(gcode)
+            report: Dict[str, Any] = analyzer.benchmark(
+                [gcode_path], str(PathFile(temporary_directory) / "FabGCodes_unit_test.json"))
+        assert report["Totals"]["ToolChanges"] == 1, report
+        assert report["Files"][0]["Tools"][0]["Tool"] == 7, report
+        assert FabGCodeAnalyzer.compareReports(report, report) == []
+        slower: Dict[str, Any] = json.loads(json.dumps(report))
+        slower["Files"][0]["Runtime"] *= 1.5
+        slower["Files"].append(dict(slower["Files"][0], Name="extra.ngc"))
+        differences: List[str] = FabGCodeAnalyzer.compareReports(report, slower)
+        assert len(differences) == 2, differences
+        assert differences[0].startswith(f"{gcode_path}: Runtime "), differences
+        assert differences[1] == "extra.ngc: new file", differences
+        assert FabGCodeAnalyzer.compareReports(slower, report)[-1] == "extra.ngc: missing file"
+
+        if tracing:
+            print(f"{tracing}<=FabGCodeAnalyzer._unit_tests()")
+
+
+# Main program:
+def main(tracing: str) -> None:
+    """Main program that benchmarks .ngc files or executes unit tests."""
+    next_tracing: str = tracing + " " if tracing else ""
+    if tracing:
+        print(f"{tracing}=>main()")
+    arguments: List[str] = sys.argv[1:]
+    gcode_paths: List[str] = [argument for argument in arguments if argument.endswith(".ngc")]
+    if gcode_paths:  # pragma: no unit cover
+        report_path: str = "/tmp/gcode_benchmark.json"
+        previous_path: str = ""
+        if "--report" in arguments:
+            report_path = arguments[arguments.index("--report") + 1]
+        if "--previous" in arguments:
+            previous_path = arguments[arguments.index("--previous") + 1]
+        previous: Optional[Dict[str, Any]] = None
+        if previous_path and PathFile(previous_path).exists():
+            previous_file: IO[str]
+            with open(previous_path, "r") as previous_file:
+                previous = cast(Dict[str, Any], json.load(previous_file))
+        # `--rapids HORIZONTAL,VERTICAL[,TOOL_CHANGE]` overrides the example FabCNCMill rapids
+        # (in mm/sec, see FabShops.FabCNC.getHorizontalRapidFeed()) and tool change seconds:
+        analyzer: FabGCodeAnalyzer
+        if "--rapids" in arguments:
+            rapids: List[float] = [
+                float(rapid) for rapid in arguments[arguments.index("--rapids") + 1].split(",")]
+            if len(rapids) not in (2, 3):
+                raise RuntimeError(
+                    f"main(): --rapids needs 2 or 3 comma separated values, not {len(rapids)}")
+            analyzer = FabGCodeAnalyzer(*rapids)
+        else:
+            analyzer = FabGCodeAnalyzer.fromMachine(FabCNCMill.getExample())
+        report: Dict[str, Any] = analyzer.benchmark(gcode_paths, report_path)
+        file_json: Dict[str, Any]
+        for file_json in report["Files"]:
+            print(f"{file_json['Name']}: {file_json['Runtime']:.1f}s "
+                  f"cut={file_json['CuttingDistance']:.1f}mm "
+                  f"rapid={file_json['RapidDistance']:.1f}mm "
+                  f"plunges={file_json['Plunges']} tool_changes={file_json['ToolChanges']}")
+        print(f"Wrote {report_path}")
+        if previous is not None:
+            difference: str
+            for difference in FabGCodeAnalyzer.compareReports(previous, report):
+                print(f"  {difference}")
+    else:
+        FabGCodeEmitter._unit_tests(tracing=next_tracing)
+        FabGCodeAnalyzer._unit_tests(tracing=next_tracing)
+    if tracing:
+        print(f"{tracing}<=main()")
+
+
+if __name__ == "__main__":
+    main(tracing=" ")
@@ -1594,6 +1594,11 @@ class FabPolygon(FabGeometry):
     * *Box* (FabBox): The box that closes the FabPolygon.
     * *GeometryInfo* (FabGeometryInfo): The geometry information (e.g. area, perimeter, etc.)
 
+    The corner radii and colinearity checks are always performed when a FabPolygon is created.
+    The fillet arcs, lines and GeometryInfo are computed lazily the first time *GeometryInfo*,
+    `getGeometries()`, or `produce()` is used, since many FabPolygon's are only used for their
+    *Box*.
+
     Constructor:
     * FabPolygon(Plane, Corners):
 
@@ -1611,7 +1616,7 @@ class FabPolygon(FabGeometry):
 
     _Corners: Tuple[Union[Vector, Tuple[Vector, Union[int, float]]], ...] = field(
         compare=False)
-    _GeometryInfo: FabGeometryInfo = field(init=False, repr=False, compare=False)
+    _GeometryInfo: Optional[FabGeometryInfo] = field(init=False, repr=False, compare=False)
 
     # Computed attributes:
     _CopiedCorners: Tuple[Union[Vector, Tuple[Vector, Union[int, float]]], ...] = field(
@@ -1693,15 +1698,23 @@ class FabPolygon(FabGeometry):
         if colinear_error:
             raise ValueError(colinear_error)  # pragma: no unit cover
 
-        # Compute *geometry_info*:
-        self._computeArcs()
-        self._computeLines()
-        geometry_info: FabGeometryInfo = self._computeGeometryInfo()
-        object.__setattr__(self, "_GeometryInfo", geometry_info)
+        # The arcs, lines, and *geometry_info* are computed on demand by _lazyCompute():
+        object.__setattr__(self, "_GeometryInfo", None)
 
         if tracing:
             print(f"{tracing}<=FabPolygon.__post_init__()")
 
+    # FabPolygon._lazyCompute():
+    def _lazyCompute(self) -> FabGeometryInfo:
+        """Compute the arcs, lines and FabGeometryInfo the first time they are needed."""
+        geometry_info: Optional[FabGeometryInfo] = self._GeometryInfo
+        if geometry_info is None:
+            self._computeArcs()
+            self._computeLines()
+            geometry_info = self._computeGeometryInfo()
+            object.__setattr__(self, "_GeometryInfo", geometry_info)
+        return geometry_info
+
     # FabPolygon.Corners:
     @property
     def Corners(self) -> Tuple[Union[Vector, Tuple[Vector, Union[int, float]]], ...]:
@@ -1714,11 +1727,11 @@ class FabPolygon(FabGeometry):
 
     # FabPolygon.ProjectedCorners():
     @property
-    def ProjectedCorners(self) -> Tuple[Union[Vector, Tuple[Vector, Union[int, float]]], ...]:
+    def ProjectedCorners(self) -> Tuple[Tuple[Vector, float], ...]:
         """Return corners after they have been projected onto the FabPolygon plane."""
         copy: Vector = Vector()
         corner: Tuple[Vector, float]
-        projected_corners_copy: List[Union[Vector, float]] = [
+        projected_corners_copy: List[Tuple[Vector, float]] = [
             (corner[0] + copy, corner[1]) for corner in self._ProjectedCorners]
         return tuple(projected_corners_copy)
 
@@ -1732,7 +1745,7 @@ class FabPolygon(FabGeometry):
     @property
     def GeometryInfo(self) -> FabGeometryInfo:
         """Return FabGeometryInfo for FabPolygon."""
-        return self._GeometryInfo
+        return self._lazyCompute()
 
     # FabPolygon._computePolgyonArea():
     @staticmethod
@@ -1998,6 +2011,7 @@ class FabPolygon(FabGeometry):
     # FabPolygon.getGeometries():
     def getGeometries(self) -> Tuple[Fab_Geometry, ...]:
         """Return the FabPolygon lines and arcs."""
+        self._lazyCompute()
         geometries: List[Fab_Geometry] = []
         fillet: Fab_Fillet
         for fillet in self._Fillets:
@@ -2064,6 +2078,9 @@ class FabPolygon(FabGeometry):
         assert isinstance(geometry_context, Fab_GeometryContext), geometry_context
         plane: FabPlane = geometry_context.Plane
 
+        # Compute *GeometryInfo* before the fillets are modified by the 2D projection:
+        self._lazyCompute()
+
         # Use *contact*/*normal* for 2D projection:
         self._plane_2d_project(plane)
 
@@ -2189,6 +2206,24 @@ class FabPolygon(FabGeometry):
         assert box.BSW == Vector(-10.0, -10.0, 0.0), box.BSW
         assert box.TNE == Vector(10.0, 10.0, 0.0), box.TNE
 
+        # Verify that the arcs, lines and GeometryInfo are computed lazily and only once:
+        assert polygon1._GeometryInfo is None, "GeometryInfo computed too early"
+        assert all(fillet.Arc is None and fillet.Line is None for fillet in polygon1._Fillets)
+        geometry_info: FabGeometryInfo = polygon1.GeometryInfo
+        assert polygon1._GeometryInfo is geometry_info
+        assert polygon1.GeometryInfo is geometry_info
+        assert len(polygon1.getGeometries()) == 6, polygon1.getGeometries()
+        lazy_polygon: FabPolygon = FabPolygon(xy_plane, copied_corners)
+        assert len(lazy_polygon.getGeometries()) == 6
+        assert lazy_polygon.GeometryInfo == geometry_info
+
+        # Validation errors are still detected when a FabPolygon is created:
+        try:
+            FabPolygon(xy_plane, (Vector(0, 0, 0), Vector(1, 0, 0), Vector(2, 0, 0)))
+            assert False, "Colinear points not detected"  # pragma: no unit cover
+        except ValueError as value_error:
+            assert str(value_error).endswith("are colinear"), str(value_error)
+
         # The area compute method is pretty involved and requires extensive unit tests.
 
         # Create 16 corners using the following naming [NS][EW][IONEWS], where
@@ -2646,16 +2681,25 @@ class Fab_Query(object):
     This class creates CadQuery Workplane provides a consistent head of the Workplane chain..
     CadQuery Operations are added as needed.
 
+    When *Recording* is enabled, the 2D drawing operations (`move_to`, `line_to`,
+    `threePointArc`, `circle`, and `close`) are accumulated in a compact command list rather
+    than appending one Workplane link per operation.  The recorded commands are emitted as
+    CadQuery wires in a single Workplane build the next time the Workplane is needed
+    (i.e. `extrude`, `hole`, `subtract`, `copy_workplane`, or the *WorkPlane* property.)
+
     Attributes:
     * *Plane* (FabPlane): The plane to use for CadQuery initialization.
+    * *Recording* (bool): If True, 2D drawing commands are recorded and emitted in batch.
     * *WorkPlane: (cadquery.Workplane): The resulting CadQuery Workplane object.
 
     Constructor:
-    Fab_Query(Plane, Workplane)
+    Fab_Query(Plane, Recording=True)
 
     """
     _Plane: FabPlane
+    _Recording: bool = True
     _Query: Any = field(init=False, repr=False, default=None)
+    _Commands: List[Tuple[Any, ...]] = field(init=False, repr=False)
 
     # Fab_Query.__post_init__():
     def __post_init__(self) -> None:
@@ -2664,8 +2708,10 @@ class Fab_Query(object):
             raise RuntimeError(
                 f"Fab_Query.__post_init__(): Got {type(self._Plane)}, "
                 "not FabPlane")  # pragma: no unit cover
+        check_type("Fab_Query.Recording", self._Recording, bool)
         plane = cast(cq.Plane, self._Plane._Plane)
         self._Query = cq.Workplane(plane)
+        self._Commands = []
 
     # Fab_Query.Plane():
     # @property
@@ -2674,10 +2720,17 @@ class Fab_Query(object):
     #     assert isinstance(self._Plane, FabPlane), self._Plane
     #     return self._Plane
 
+    # Fab_Query.Recording():
+    @property
+    def Recording(self) -> bool:
+        """Return True if 2D drawing commands are being recorded."""
+        return self._Recording
+
     # Fab_Query.WorkPlane():
     @property
     def WorkPlane(self) -> Any:
         """Return the Workplane associated from a Fab_Query."""
+        self.flush()
         return self._Query
 
     # Fab_Query.circle():
@@ -2687,6 +2740,10 @@ class Fab_Query(object):
         if tracing:
             print(f"{tracing}<=>Fab_Query.circle({center}, {radius}, {for_construction})")
         rotated_center: Vector = self._Plane.rotatePointToZAxis(center)
+        if self._Recording and not for_construction:
+            self._Commands.append(("circle", rotated_center.x, rotated_center.y, radius))
+            return
+        self.flush()
         self._Query = (
             cast(cq.Workplane, self._Query)
             .moveTo(rotated_center.x, rotated_center.y)
@@ -2698,6 +2755,9 @@ class Fab_Query(object):
         """Close a sequence of arcs and lines."""
         if tracing:
             print(f"{tracing}<=>Fab_Query.close()")
+        if self._Recording:
+            self._Commands.append(("close",))
+            return
         self._Query = (
             cast(cq.Workplane, self._Query)
             .close()
@@ -2714,6 +2774,7 @@ class Fab_Query(object):
                 "not FabPlane")  # pragma: no unit cover
         if tracing:
             print(f"{tracing}{plane=}")
+        self.flush()
         self._Query = (
             cast(cq.Workplane, self._Query)
             .copyWorkplane(cq.Workplane(plane.CQ_Plane))
@@ -2726,16 +2787,89 @@ class Fab_Query(object):
         """Extrude current 2D object to a known depth."""
         if tracing:
             print(f"{tracing}<=>Fab_Query.extrude({depth})")
+        self.flush()
         self._Query = (
             cast(cq.Workplane, self._Query)
             .extrude(-depth)
         )
 
+    # Fab_Query.flush():
+    def flush(self, tracing: str = "") -> None:
+        """Emit any recorded 2D commands into the CadQuery Workplane in a single build.
+
+        Each closed sequence of lines and arcs is assembled into one wire and each circle becomes
+        its own wire.  All of the wires are pushed onto the CadQuery pending wires list at once.
+        Any trailing `move_to` point is left on the Workplane stack so that a following `hole`
+        works exactly as it does when not recording.
+        """
+        commands: List[Tuple[Any, ...]] = self._Commands
+        if not commands:
+            return
+        if tracing:
+            print(f"{tracing}=>Fab_Query.flush(): {len(commands)} commands")
+        query: cq.Workplane = cast(cq.Workplane, self._Query)
+        plane: cq.Plane = query.plane
+        normal: cq.Vector = plane.zDir
+
+        def world(x: float, y: float) -> cq.Vector:
+            """Return a workplane point converted into world coordinates."""
+            return plane.toWorldCoords((x, y))
+
+        # Sweep through *commands* building up *wires* and *edges*:
+        wires: List[Any] = []
+        edges: List[Any] = []
+        current: Optional[cq.Vector] = None  # The current pen location (world coordinates.)
+        first: Optional[cq.Vector] = None  # The start of first edge in the current wire.
+        moved: bool = False  # True if the last command was a move_to.
+        command: Tuple[Any, ...]
+        for command in commands:
+            kind: str = command[0]
+            if kind == "move":
+                current = world(command[1], command[2])
+                moved = True
+                continue
+            moved = False
+            start: cq.Vector = current if current is not None else world(0.0, 0.0)
+            if kind == "line":
+                current = world(command[1], command[2])
+                edges.append(cq.Edge.makeLine(start, current))
+                first = start if first is None else first
+            elif kind == "arc":
+                current = world(command[3], command[4])
+                edges.append(cq.Edge.makeThreePointArc(
+                    start, world(command[1], command[2]), current))
+                first = start if first is None else first
+            elif kind == "close":
+                if first is None:
+                    raise RuntimeError(
+                        "Fab_Query.flush(): No start point specified - cannot close")
+                if (start - first).Length > 1.0e-6:
+                    edges.append(cq.Edge.makeLine(start, first))
+                wires.append(cq.Wire.assembleEdges(edges))
+                edges = []
+                first = None
+            elif kind == "circle":
+                wires.append(cq.Wire.makeCircle(command[3], world(command[1], command[2]), normal))
+            else:
+                raise RuntimeError(
+                    f"Fab_Query.flush(): Unknown command {command}")  # pragma: no unit cover
+
+        # Emit everything with one Workplane link (plus one more for a trailing point):
+        if wires or edges:
+            query = query.newObject(wires + edges).toPending()
+        if moved and current is not None:
+            query = query.newObject([current])
+        self._Query = query
+        self._Commands = []
+        if tracing:
+            print(f"{tracing}<=Fab_Query.flush(): {len(wires)} wires, {len(edges)} edges")
+
     # Fab_Query.hole():
     def hole(self, diameter: float, depth: float, tracing: str = "") -> None:
         """Drill a hole."""
         if tracing:
             print(f"{tracing}=>Fab_Query.hole({diameter}, {depth})")
+        self.flush()
         self._Query = (
             cast(cq.Workplane, self._Query)
             .hole(diameter=diameter, depth=depth)
@@ -2749,10 +2883,13 @@ class Fab_Query(object):
         if tracing:
             print(f"{tracing}=>Fab_Query.line_to({end}, {for_construction})")
         end_tuple: Tuple[float, float] = (end.x, end.y)
-        self._Query = (
-            cast(cq.Workplane, self._Query)
-            .lineTo(end.x, end.y)
-        )
+        if self._Recording:
+            self._Commands.append(("line", end.x, end.y))
+        else:
+            self._Query = (
+                cast(cq.Workplane, self._Query)
+                .lineTo(end.x, end.y)
+            )
         if tracing:
             print(f"{tracing}{end_tuple=}")
             print(f"{tracing}<=Fab_Query.line_to({end}, {for_construction})")
@@ -2764,10 +2901,13 @@ class Fab_Query(object):
             print(f"{tracing}=>Fab_Query.move_to({point})")
             print(f"{tracing}{self._Query.plane=}")
         assert isinstance(point, Vector), point
-        self._Query = (
-            cast(cq.Workplane, self._Query)
-            .moveTo(point.x, point.y)
-        )
+        if self._Recording:
+            self._Commands.append(("move", point.x, point.y))
+        else:
+            self._Query = (
+                cast(cq.Workplane, self._Query)
+                .moveTo(point.x, point.y)
+            )
         if tracing:
             print(f"{tracing}<=Fab_Query.move_to({point})")
 
@@ -2818,6 +2958,7 @@ class Fab_Query(object):
          cq.Workplane.__str__) = new_functions
 
         # Now print the the contents:
+        self.flush()
         if tracing:
             print(f"{tracing}Label: {label}")
             print(f"{tracing}{self._Query}")
@@ -2831,11 +2972,31 @@ class Fab_Query(object):
         """Subtract one solid form a Fab_Query."""
         if tracing:
             print(f"{tracing}<=>Fab_Query.subtract()")
+        self.flush()
         self._Query = (
             cast(cq.Workplane, self._Query) -
             remove_solid.WorkPlane
         )
 
+    # Fab_Query.subtract_batch():
+    def subtract_batch(self, remove_solids: Sequence["Fab_Query"], tracing: str = "") -> None:
+        """Subtract several solids from a Fab_Query using a single boolean operation.
+
+        All of the solids in *remove_solids* are passed to OCCT as the tool arguments of one
+        cut, rather than performing one cut per solid against an ever more complex solid.
+        The tool solids are allowed to overlap one another.
+        """
+        if tracing:
+            print(f"{tracing}<=>Fab_Query.subtract_batch(|{len(remove_solids)}|)")
+        if remove_solids:
+            self.flush()
+            tools: List[Any] = []
+            remove_solid: Fab_Query
+            for remove_solid in remove_solids:
+                tools.extend(cast(cq.Workplane, remove_solid.WorkPlane).vals())
+            tools_query: cq.Workplane = cq.Workplane(self._Plane._Plane).newObject(tools)
+            self._Query = cast(cq.Workplane, self._Query).cut(tools_query)
+
     # Fab_Query.threePointArc():
     def threePointArc(self, middle: Vector, end: Vector,
                       for_construction: bool = False, tracing: str = "") -> None:
@@ -2844,14 +3005,126 @@ class Fab_Query(object):
             print(f"{tracing}=>Fab_Query.threePointArc({middle}), {end})")
         middle_tuple: Tuple[float, float] = (middle.x, middle.y)
         end_tuple: Tuple[float, float] = (end.x, end.y)
-        self._Query = (
-            cast(cq.Workplane, self._Query)
-            .threePointArc(middle_tuple, end_tuple)
-        )
+        if self._Recording:
+            self._Commands.append(("arc", middle.x, middle.y, end.x, end.y))
+        else:
+            self._Query = (
+                cast(cq.Workplane, self._Query)
+                .threePointArc(middle_tuple, end_tuple)
+            )
         if tracing:
             print(f"{tracing}{middle_tuple=} {end_tuple=}")
             print(f"{tracing}<=Fab_Query.threePointArc({middle}), {end})")
 
+    # Fab_Query._unitTests():
+    @staticmethod
+    def _unitTests(tracing: str = "") -> None:
+        """Run Fab_Query unit tests."""
+        next_tracing: str = tracing + " " if tracing else ""
+        if tracing:
+            print(f"{tracing}=>Fab_Query._unitTests()")
+
+        def build(plane: FabPlane, dx: Vector, dy: Vector, recording: bool) -> Fab_Query:
+            """Build a pocketed and drilled block using either recording mode."""
+            query: Fab_Query = Fab_Query(plane, recording)
+            context: Fab_GeometryContext = Fab_GeometryContext(plane, query)
+            contact: Vector = plane.Contact
+            polygon: FabPolygon = FabPolygon(plane, (
+                (contact - dx * 20.0 - dy * 10.0, 2.0),
+                (contact + dx * 20.0 - dy * 10.0, 3.0),
+                (contact + dx * 20.0 + dy * 10.0, 4.0),
+                (contact - dx * 20.0 + dy * 10.0, 0.0),
+            ))
+            polygon.produce(context, "Block", 0, tracing=next_tracing)
+            assert query.Recording == recording
+            assert bool(query._Commands) == recording
+            query.extrude(5.0)
+
+            # Pocket out a circle:
+            pocket_query: Fab_Query = Fab_Query(plane, recording)
+            pocket_context: Fab_GeometryContext = Fab_GeometryContext(plane, pocket_query)
+            circle: FabCircle = FabCircle(plane, contact - dx * 10.0, 6.0)
+            circle.produce(pocket_context, "Pocket", 0, tracing=next_tracing)
+            pocket_query.extrude(2.0)
+            query.subtract(pocket_query)
+
+            # Drill a hole:
+            query.move_to(plane.rotatePointToZAxis(contact + dx * 10.0))
+            query.hole(3.0, 5.0)
+            assert not query._Commands
+            return query
+
+        def volume(query: Fab_Query) -> float:
+            """Return the volume of the solid in a Fab_Query."""
+            return cast(float, query.WorkPlane.val().Volume())
+
+        x_axis: Vector = Vector(1.0, 0.0, 0.0)
+        y_axis: Vector = Vector(0.0, 1.0, 0.0)
+        z_axis: Vector = Vector(0.0, 0.0, 1.0)
+        plane: FabPlane
+        dx: Vector
+        dy: Vector
+        for plane, dx, dy in (
+                (FabPlane(Vector(0.0, 0.0, 0.0), z_axis), x_axis, y_axis),
+                (FabPlane(Vector(0.0, 0.0, 7.0), z_axis), x_axis, y_axis),
+                (FabPlane(Vector(0.0, -3.0, 0.0), -y_axis), x_axis, z_axis),
+        ):
+            immediate_volume: float = volume(build(plane, dx, dy, False))
+            recorded_volume: float = volume(build(plane, dx, dy, True))
+            assert immediate_volume > 0.0, immediate_volume
+            assert abs(immediate_volume - recorded_volume) < 1.0e-6, (
+                plane, immediate_volume, recorded_volume)
+
+        # Batched subtraction must match sequential subtraction:
+        def block(plane: FabPlane) -> Fab_Query:
+            """Return a Fab_Query containing a 40x20x5 block."""
+            block_query: Fab_Query = Fab_Query(plane)
+            block_query.move_to(Vector(-20.0, -10.0, 0.0))
+            block_query.line_to(Vector(20.0, -10.0, 0.0))
+            block_query.line_to(Vector(20.0, 10.0, 0.0))
+            block_query.line_to(Vector(-20.0, 10.0, 0.0))
+            block_query.close()
+            block_query.extrude(5.0)
+            return block_query
+
+        def pockets(plane: FabPlane) -> List[Fab_Query]:
+            """Return a list of overlapping circular pocket tool bodies."""
+            pocket_queries: List[Fab_Query] = []
+            x: float
+            for x in (-12.0, -8.0, 0.0, 12.0):
+                pocket_query: Fab_Query = Fab_Query(plane)
+                pocket_query.circle(Vector(x, 0.0, 0.0), 3.0)
+                pocket_query.extrude(2.0)
+                pocket_queries.append(pocket_query)
+            return pocket_queries
+
+        xy_plane: FabPlane = FabPlane(Vector(0.0, 0.0, 0.0), Vector(0.0, 0.0, 1.0))
+        sequential_query: Fab_Query = block(xy_plane)
+        for pocket_query in pockets(xy_plane):
+            sequential_query.subtract(pocket_query)
+        batch_query: Fab_Query = block(xy_plane)
+        batch_query.subtract_batch(pockets(xy_plane))
+        empty_query: Fab_Query = block(xy_plane)
+        empty_query.subtract_batch([])
+        assert abs(volume(empty_query) - 40.0 * 20.0 * 5.0) < 1.0e-6, volume(empty_query)
+        assert abs(volume(sequential_query) - volume(batch_query)) < 1.0e-6, (
+            volume(sequential_query), volume(batch_query))
+        assert volume(batch_query) < volume(empty_query)
+
+        # Closing without any edges is an error:
+        bad_query: Fab_Query = Fab_Query(xy_plane)
+        bad_query.move_to(Vector(1.0, 1.0, 0.0))
+        bad_query.close()
+        try:
+            bad_query.flush()
+            assert False, "No error raised"  # pragma: no unit cover
+        except RuntimeError as runtime_error:
+            assert str(runtime_error) == (
+                "Fab_Query.flush(): No start point specified - cannot close"), str(runtime_error)
+
+        if tracing:
+            print(f"{tracing}<=Fab_Query._unitTests()")
+
 
 def main(tracing: str = "") -> None:
     """Run main program."""
@@ -2864,6 +3137,7 @@ def main(tracing: str = "") -> None:
     FabPolygon._unitTests(tracing=next_tracing)
     FabGeometryInfo._unitTests(tracing=next_tracing)
     Fab_GeometryInfo._unitTests(tracing)
+    Fab_Query._unitTests(tracing=next_tracing)
     if tracing:
         print(f"{tracing}<=FabGeometries.main()")
 
@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""FabJsonNodes: Stream the nodes of a FabProject JSON file.
+
+A FabProject writes its FabNode tree to a JSON file (see FabNodes.Fab_JsonWriter) that FabCNC
+reads back in inside of FreeCAD.  The JSON file can be quite large, so Fab_JsonNodeReader
+streams it one node at a time and validates each node against a precompiled schema.
+
+This module only uses the Python standard library, so it can be imported by FabCNC (which
+runs in the FreeCAD Python interpreter) and unit tested without FreeCAD (or CadQuery.)
+
+There is one private class:
+* Fab_JsonNodeReader: Stream and validate the nodes of a FabProject JSON file.
+
+"""
+
+# <--------------------------------------- 100 characters ---------------------------------------> #
+
+from dataclasses import dataclass, field
+import json
+from pathlib import Path as PathFile
+import tempfile
+from typing import Any, ClassVar, Dict, IO, Iterator, List, Optional, Tuple
+
+
+# Fab_JsonNodeReader:
+@dataclass
+class Fab_JsonNodeReader(object):
+    """Fab_JsonNodeReader: Stream the nodes of a FabProject JSON file.
+
+    The nodes are returned in depth first order along with their tree path.  The "children"
+    of Project, Document, and Assembly nodes are streamed, so these nodes are returned without
+    a "children" entry.  All other nodes (i.e. Solid's) are returned complete with their Mount
+    and operation children.  This relies on the JSON keys being sorted (as FabProject writes
+    them), so that "Kind" is read before "children".  Each node is validated once against
+    the precompiled schema as it is read.
+
+    Attributes:
+    * *JsonPath* (PathFile): The JSON file to read.
+    * *ChunkSize* (int): The number of characters to read at a time.  (Default: 65536)
+
+    Constructor:
+    * Fab_JsonNodeReader(JsonPath, ChunkSize)
+
+    """
+
+    JsonPath: PathFile
+    ChunkSize: int = 65536
+    _File: Optional[IO[str]] = field(init=False, repr=False)
+    _Buffer: str = field(init=False, repr=False)
+    _Position: int = field(init=False, repr=False)
+    _Decoder: json.JSONDecoder = field(init=False, repr=False)
+
+    STREAMED_KINDS: ClassVar[Tuple[str, ...]] = ("Project", "Document", "Assembly")
+    NUMBER_CHARACTERS: ClassVar[str] = ".eE+-0123456789"  # Characters that can continue a number
+    # The precompiled schema: Kind => ((Key, Type), ...) of the required keys:
+    SCHEMA: ClassVar[Dict[str, Tuple[Tuple[str, Any], ...]]] = {
+        kind: (("Kind", str), ("Label", str)) + keys for kind, keys in {
+            "Project": (),
+            "Document": (("_FilePath", str),),
+            "Assembly": (),
+            "Solid": (("StepFile", str),),
+            "Mount": (("_Contact", list), ("_Normal", list),
+                      ("_OrientEnd", list), ("_OrientStart", list)),
+            "Extrude": (("Debug", bool), ("StepFile", str), ("_Active", bool)),
+            "Pocket": (("Debug", bool), ("StepFile", str)),
+            "Drilling": (("Debug", bool), ("HolesCount", int), ("StepFile", str)),
+        }.items()}
+
+    # Fab_JsonNodeReader.__post_init__():
+    def __post_init__(self) -> None:
+        """Initialize Fab_JsonNodeReader."""
+        if self.JsonPath.suffix != ".json":
+            raise RuntimeError(f"JSON file must have `.json` suffix: '{str(self.JsonPath)}'")
+        self._File = None
+        self._Buffer = ""
+        self._Position = 0
+        self._Decoder = json.JSONDecoder()
+
+    # Fab_JsonNodeReader.nodes():
+    def nodes(self) -> Iterator[Tuple[Tuple[str, ...], Dict[str, Any]]]:
+        """Return each (tree path, node) pair as it is read."""
+        json_file: IO[str]
+        with open(self.JsonPath, "r") as json_file:
+            self._File = json_file
+            self._Buffer = ""
+            self._Position = 0
+
+            # Read the root node:
+            self._expect("{")
+            root: Dict[str, Any] = {}
+            streaming: bool = self._readMembers(("Root",), root)
+            self.validate(("Root",), root)
+            yield ("Root",), root
+
+            # Iteratively read the children of the streamed nodes in *open_nodes*:
+            open_nodes: List[Tuple[Tuple[str, ...], Dict[str, Any]]] = []
+            if streaming:
+                open_nodes.append((("Root",), root))
+            while open_nodes:
+                parent_path: Tuple[str, ...]
+                parent: Dict[str, Any]
+                parent_path, parent = open_nodes[-1]
+                character: str = self._peek()
+                if character == ",":
+                    self._Position += 1
+                elif character == "]":
+                    # Finish up *parent* with any members that follow its "children":
+                    self._Position += 1
+                    self._readMembers(parent_path, parent)
+                    open_nodes.pop()
+                else:
+                    self._expect("{")
+                    child: Dict[str, Any] = {}
+                    streaming = self._readMembers(parent_path, child)
+                    self.validate(parent_path, child)
+                    child_path: Tuple[str, ...] = parent_path + (child["Label"],)
+                    yield child_path, child
+                    if streaming:
+                        open_nodes.append((child_path, child))
+            self._File = None
+
+    # Fab_JsonNodeReader.validate():
+    def validate(self, tree_path: Tuple[str, ...], node: Any) -> None:
+        """Validate a node (and any non-streamed children) against the precompiled schema."""
+        pending: List[Tuple[Tuple[str, ...], Any]] = [(tree_path, node)]
+        while pending:
+            tree_path, node = pending.pop()
+            if not isinstance(node, dict):
+                raise RuntimeError(f"{tree_path}: Got {type(node)}, not {dict}")
+            kind: Any = node.get("Kind")
+            if kind not in Fab_JsonNodeReader.SCHEMA:
+                raise RuntimeError(f"{tree_path}: Node kind '{kind}' not one of "
+                                   f"{tuple(Fab_JsonNodeReader.SCHEMA.keys())}")
+            key: str
+            key_type: Any
+            for key, key_type in Fab_JsonNodeReader.SCHEMA[kind]:
+                if key not in node:
+                    raise RuntimeError(
+                        f"{tree_path}: {kind}: '{key}' is not one of {tuple(node.keys())}")
+                if not isinstance(node[key], key_type):
+                    raise RuntimeError(f"{tree_path}: {kind}.{key}: "
+                                       f"Got {type(node[key])}, not {key_type}")
+            children: Any = node.get("children", [])
+            if not isinstance(children, list):
+                raise RuntimeError(f"{tree_path}: {kind}.children: "
+                                   f"Got {type(children)}, not {list}")
+            label: str = node["Label"]
+            child: Any
+            for child in children:
+                pending.append((tree_path + (label,), child))
+
+    # Fab_JsonNodeReader._readMembers():
+    def _readMembers(self, tree_path: Tuple[str, ...], node: Dict[str, Any]) -> bool:
+        """Read object members into a node and return True when streamed children start."""
+        while True:
+            character: str = self._peek()
+            if character == "}":
+                self._Position += 1
+                return False
+            if character == ",":
+                self._Position += 1
+                continue
+            key: Any = self._decode()
+            if not isinstance(key, str):
+                raise RuntimeError(f"{tree_path}: {str(self.JsonPath)}: Bad key {key}")
+            self._expect(":")
+            if key == "children" and node.get("Kind") in Fab_JsonNodeReader.STREAMED_KINDS:
+                self._expect("[")
+                return True
+            node[key] = self._decode()
+
+    # Fab_JsonNodeReader._fill():
+    def _fill(self) -> bool:
+        """Read the next chunk into the buffer and return False at the end of the file."""
+        assert self._File is not None, "Fab_JsonNodeReader._fill(): File not open"
+        chunk: str = self._File.read(self.ChunkSize)
+        self._Buffer = self._Buffer[self._Position:] + chunk
+        self._Position = 0
+        return chunk != ""
+
+    # Fab_JsonNodeReader._peek():
+    def _peek(self) -> str:
+        """Return the next non-whitespace character (without consuming it.)"""
+        while True:
+            while self._Position < len(self._Buffer) and self._Buffer[self._Position] in " \t\r\n":
+                self._Position += 1
+            if self._Position < len(self._Buffer):
+                return self._Buffer[self._Position]
+            if not self._fill():
+                raise RuntimeError(f"{str(self.JsonPath)}: Unexpected end of file")
+
+    # Fab_JsonNodeReader._expect():
+    def _expect(self, expected: str) -> None:
+        """Consume the next non-whitespace character and verify that it is expected."""
+        character: str = self._peek()
+        if character != expected:
+            raise RuntimeError(
+                f"{str(self.JsonPath)}: Got '{character}' instead of '{expected}'")
+        self._Position += 1
+
+    # Fab_JsonNodeReader._decode():
+    def _decode(self) -> Any:
+        """Decode the next complete JSON value, reading more of the file as needed.
+
+        A number that touches the end of the buffer, or is followed by a character that can
+        continue a number (e.g. `1.|5` split across two chunks), might be incomplete, so more
+        of the file is read before the number is accepted.
+        """
+        self._peek()
+        at_end: bool = False
+        while True:
+            value: Any
+            end: int
+            try:
+                value, end = self._Decoder.raw_decode(self._Buffer, self._Position)
+            except json.JSONDecodeError as decode_error:
+                if not self._fill():
+                    raise RuntimeError(f"{str(self.JsonPath)}: {decode_error}")
+                continue
+            is_number: bool = isinstance(value, (int, float)) and not isinstance(value, bool)
+            if at_end or not is_number or (
+                    end < len(self._Buffer) and
+                    self._Buffer[end] not in Fab_JsonNodeReader.NUMBER_CHARACTERS):
+                self._Position = end
+                return value
+            # The number might continue in the next chunk (decode it again either way):
+            at_end = not self._fill()
+
+    # Fab_JsonNodeReader._unit_tests():
+    @staticmethod
+    def _unit_tests(tracing: str = "") -> None:
+        """Run Fab_JsonNodeReader unit tests."""
+        if tracing:
+            print(f"{tracing}=>Fab_JsonNodeReader._unit_tests()")
+
+        extrude: Dict[str, Any] = {
+            "Kind": "Extrude", "Label": "TestExtrude", "Debug": False, "StepFile": "e.stp",
+            "_Active": True, "_Depth": 12.75, "_StepDown": 3.0e-1, "_ToolNumber": 12345}
+        mount: Dict[str, Any] = {
+            "Kind": "Mount", "Label": "TestMount", "_Contact": [0.0, -1.5, 10.25],
+            "_Normal": [0, 0, 1], "_OrientEnd": [1.0e-12, 0.0, 0.0],
+            "_OrientStart": [-2.5e+3, 0, 0], "children": [extrude]}
+        solid: Dict[str, Any] = {
+            "Kind": "Solid", "Label": "TestSolid", "StepFile": "s.stp", "children": [mount]}
+        assembly: Dict[str, Any] = {
+            "Kind": "Assembly", "Label": "TestAssembly", "children": [solid, solid.copy()]}
+        document: Dict[str, Any] = {
+            "Kind": "Document", "Label": "TestDocument", "_FilePath": "/tmp/Test.fcstd",
+            "children": [assembly, {"Kind": "Solid", "Label": "Solid2", "StepFile": "2.stp"}]}
+        project: Dict[str, Any] = {
+            "Kind": "Project", "Label": "TestProject", "children": [document], "zz": 98.5}
+
+        # The streamed nodes are returned without their "children" in depth first order:
+        expected: List[Tuple[Tuple[str, ...], Dict[str, Any]]] = []
+        pending: List[Tuple[Tuple[str, ...], Dict[str, Any]]] = [(("Root",), project)]
+        while pending:
+            tree_path: Tuple[str, ...]
+            node: Dict[str, Any]
+            tree_path, node = pending.pop()
+            if node["Kind"] in Fab_JsonNodeReader.STREAMED_KINDS:
+                key: str
+                expected.append((tree_path, {
+                    key: value for key, value in node.items() if key != "children"}))
+                child: Dict[str, Any]
+                pending.extend(reversed([(tree_path + (child["Label"],), child)
+                                         for child in node["children"]]))
+            else:
+                expected.append((tree_path, node))
+
+        temporary_directory: str
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            json_path: PathFile = PathFile(temporary_directory) / "Test.json"
+            text: str = json.dumps(project, indent=1, sort_keys=True)
+            json_file: IO[str]
+            with open(json_path, "w") as json_file:
+                json_file.write(text)
+
+            # Every chunk size (including ones that split numbers like `1.|5`) reads the same:
+            chunk_size: int
+            for chunk_size in range(1, len(text) + 1):
+                reader: Fab_JsonNodeReader = Fab_JsonNodeReader(json_path, chunk_size)
+                actual: List[Tuple[Tuple[str, ...], Dict[str, Any]]] = list(reader.nodes())
+                assert actual == expected, (chunk_size, actual, expected)
+
+            # A number at the very end of the file is accepted:
+            with open(json_path, "w") as json_file:
+                json_file.write("{}")
+            reader = Fab_JsonNodeReader(json_path, 1)
+            reader._File = open(json_path, "r")
+            reader._Buffer = "1.5"
+            reader._Position = 0
+            assert reader._decode() == 1.5
+            reader._File.close()
+
+            # Schema errors:
+            del mount["_Normal"]
+            with open(json_path, "w") as json_file:
+                json_file.write(json.dumps(project, sort_keys=True))
+            try:
+                list(Fab_JsonNodeReader(json_path).nodes())
+                assert False, "Missing key not detected"  # pragma: no unit cover
+            except RuntimeError as runtime_error:
+                assert "Mount: '_Normal' is not one of" in str(runtime_error), str(runtime_error)
+            try:
+                Fab_JsonNodeReader(PathFile(temporary_directory) / "Test.txt")
+                assert False, "Bad suffix not detected"  # pragma: no unit cover
+            except RuntimeError as runtime_error:
+                assert "must have `.json` suffix" in str(runtime_error), str(runtime_error)
+
+        if tracing:
+            print(f"{tracing}<=Fab_JsonNodeReader._unit_tests()")
+
+
+# main():
+def main(tracing: str = "") -> None:
+    """Run the FabJsonNodes unit tests."""
+    next_tracing: str = tracing + " " if tracing else ""
+    if tracing:
+        print(f"{tracing}=>FabJsonNodes.main()")
+    Fab_JsonNodeReader._unit_tests(tracing=next_tracing)
+    if tracing:
+        print(f"{tracing}<=FabJsonNodes.main()")
+
+
+if __name__ == "__main__":
+    main(tracing=" ")
@@ -5,7 +5,7 @@ Node: Fab tree management.
 The Node package provides a tree of FabNode's that roughly corresponds to a FreeCAD tree
 as shown in the FreeCAD model view.
 
-There are two public classes defined:
+There are three public classes defined:
 * FabBox:
   This is a generic bounding box class similar to the FreeCAD BoundBox class
   is used to enclose the FabNode contents and its children FabNode's.
@@ -13,7 +13,11 @@ There are two public classes defined:
 * FabNode:
   This is a sub-class of FabBox that has a name, a parent FabNode and other data structures
   required to maintain the tree.
-There are three private classes defined -- Fab_Prefix, Fab_Steps, and Fab_ProduceState.
+* FabWorkspace:
+  The output root, shared cache root, and run identifier that determine where a run
+  writes its files.
+There are four private classes defined -- Fab_Prefix, Fab_Steps, Fab_ProduceState, and
+Fab_JsonWriter.
 
 Other Fab packages (e.g. Project and Solid) further sub-class FabNode to provide finer
 grained distinctions between FabNode's.
@@ -44,11 +48,17 @@ See the FabNode documentation for further attributes.
 from collections import OrderedDict
 from dataclasses import dataclass, field
 import hashlib
+import io
+import json
+import os
 from pathlib import Path as PathFile
-from typing import Any, Dict, IO, List, Sequence, Set, Tuple, Union
+import tempfile
+import time
+from typing import Any, Callable, Dict, IO, List, Optional, Sequence, Set, Tuple, Union
 from typeguard import check_type, check_argument_types
 
 from cadquery import Vector  # type: ignore
+import numpy as np  # type: ignore
 
 from FabUtilities import FabToolController
 from FabShops import FabShops
@@ -428,7 +438,7 @@ class FabBox(object):
 
     # FabBox.intersect():
     def intersect(self, segment_start: Vector, segment_end: Vector,
-                  tracing: str = "") -> Tuple[bool, float, float]:
+                  tracing: str = "") -> Tuple[bool, Vector, Vector]:
         """Compute Line Segment intersection with a FabBox.a
 
         Arguments:
@@ -554,6 +564,150 @@ class FabBox(object):
             print("")
         return intersect, begin_point, finish_point
 
+    # FabBox.intersect_segments():
+    def intersect_segments(self, segment_starts: Any, segment_ends: Any) -> Tuple[Any, Any, Any]:
+        """Compute the intersections of many line segments with a FabBox at once.
+
+        This is a NumPy vectorized version of FabBox.intersect() that uses the same begin/finish
+        ratio algorithm and the same EPSILON tests.  The only difference is that a segment
+        whose begin ratio gets pulled past its finish ratio is simply reported as not
+        intersecting, rather than tripping the "Segment truncation failed" assertion.
+
+        Arguments:
+        * *segment_starts* (Union[numpy.ndarray, Sequence[Vector]]): The N segment start points.
+        * *segment_ends* (Union[numpy.ndarray, Sequence[Vector]]): The N segment end points.
+
+        Returns:
+        * (numpy.ndarray): N booleans that are True where the segment is partially inside FabBox.
+        * (numpy.ndarray): N x 3 possibly truncated segment points near *segment_starts*.
+        * (numpy.ndarray): N x 3 possibly truncated segment points near *segment_ends*.
+
+        """
+        def to_array(points: Any) -> Any:
+            """Convert points into an N x 3 NumPy array."""
+            if not isinstance(points, np.ndarray):
+                points = [(point.x, point.y, point.z) for point in points]
+            return np.array(points, dtype=float).reshape(-1, 3)
+
+        starts: Any = to_array(segment_starts)
+        ends: Any = to_array(segment_ends)
+        if starts.shape != ends.shape:
+            raise RuntimeError(f"FabBox.intersect_segments(): "
+                               f"{starts.shape[0]} starts != {ends.shape[0]} ends")
+
+        EPSILON: float = 1.0e-8
+        count: int = starts.shape[0]
+        intersects: Any = np.ones(count, dtype=bool)
+        active: Any = np.ones(count, dtype=bool)  # Cleared on bounding box issues (i.e. break).
+        begin_ratios: Any = np.zeros(count)
+        finish_ratios: Any = np.ones(count)
+
+        # Visit the each of the X, Y, and Z *axes*:
+        axes: Tuple[Tuple[str, int, float, float], ...] = (
+            ("X", 0, self._XMin, self._XMax),
+            ("Y", 1, self._YMin, self._YMax),
+            ("Z", 2, self._ZMin, self._ZMax),
+        )
+        axis_name: str
+        axis: int
+        minimum: float
+        maximum: float
+        for axis_name, axis, minimum, maximum in axes:
+            # Check for bounding box issues:
+            assert minimum < maximum, f"{axis_name}: FabBox has bad inverted bounds"
+            start: Any = starts[:, axis]
+            end: Any = ends[:, axis]
+            issues: Any = active.copy()
+            if abs(maximum - minimum) >= EPSILON:
+                issues &= (((start > maximum) & (end > maximum)) |
+                           ((start < minimum) & (end < minimum)))
+            intersects &= ~issues
+            active &= ~issues
+
+            # Segments that project down to a point skip the axis check:
+            distance: Any = end - start  # Can be negative
+            updates: Any = active & (np.abs(distance) >= EPSILON)
+            safe_distance: Any = np.where(updates, distance, 1.0)
+            minimum_ratios: Any = (minimum - start) / safe_distance  # Can be negative
+            maximum_ratios: Any = (maximum - start) / safe_distance  # Can be negative
+            increasing: Any = updates & (maximum_ratios > minimum_ratios)
+            decreasing: Any = updates & (maximum_ratios < minimum_ratios)
+
+            # See if *begin_ratios* and *finish_ratios* need to be "pulled in":
+            begin_ratios = np.where(
+                increasing & (minimum_ratios > begin_ratios), minimum_ratios,
+                np.where(decreasing & (maximum_ratios > begin_ratios),
+                         maximum_ratios, begin_ratios))
+            finish_ratios = np.where(
+                increasing & (maximum_ratios < finish_ratios), maximum_ratios,
+                np.where(decreasing & (minimum_ratios < finish_ratios),
+                         minimum_ratios, finish_ratios))
+
+            # Over shortened segments do not intersect:
+            intersects &= ~(updates & (begin_ratios > finish_ratios))
+
+        # Compute *begin_points* and *finish_points* and disallow zero length segments:
+        deltas: Any = ends - starts
+        begin_points: Any = starts + begin_ratios[:, np.newaxis] * deltas
+        finish_points: Any = starts + finish_ratios[:, np.newaxis] * deltas
+        intersects &= np.linalg.norm(begin_points - finish_points, axis=1) >= EPSILON
+        return intersects, begin_points, finish_points
+
+    # FabBox._intersect_segments_unit_tests():
+    @staticmethod
+    def _intersect_segments_unit_tests() -> None:
+        """Verify that FabBox.intersect_segments() matches FabBox.intersect()."""
+        EPSILON: float = 1.0e-8
+        box: FabBox = FabBox()
+        box.enclose((Vector(-1.0, -2.0, -1.0), Vector(1.0, 2.0, 3.0)))
+
+        # Build segments between every pair of points on a coarse grid around *box*:
+        coordinates: Tuple[float, ...] = (-2.5, -1.0, 0.0, 1.0, 3.5)
+        points: List[Vector] = [
+            Vector(x, y, z) for x in coordinates for y in coordinates for z in coordinates]
+        starts: List[Vector] = []
+        ends: List[Vector] = []
+        start: Vector
+        end: Vector
+        for start in points:
+            for end in points[::7]:
+                starts.append(start)
+                ends.append(end)
+
+        intersects: Any
+        begins: Any
+        finishes: Any
+        intersects, begins, finishes = box.intersect_segments(starts, ends)
+        assert intersects.shape == (len(starts),), intersects.shape
+        index: int
+        hits: int = 0
+        for index, (start, end) in enumerate(zip(starts, ends)):
+            want_intersect: bool = False
+            want_begin: Vector = start
+            want_finish: Vector = end
+            try:
+                want_intersect, want_begin, want_finish = box.intersect(start, end)
+            except AssertionError as assertion_error:
+                # FabBox.intersect() asserts instead of returning False for some missed segments:
+                if str(assertion_error) != "Segment truncation failed":
+                    raise  # pragma: no unit cover
+            assert bool(intersects[index]) == want_intersect, (index, start, end)
+            if want_intersect:
+                hits += 1
+                assert (Vector(*begins[index].tolist()) - want_begin).Length < EPSILON
+                assert (Vector(*finishes[index].tolist()) - want_finish).Length < EPSILON
+        assert 0 < hits < len(starts), hits
+
+        # NumPy arrays are accepted directly and mismatched lengths are rejected:
+        array_intersects: Any = box.intersect_segments(
+            np.array([[0.0, 0.0, -5.0]]), np.array([[0.0, 0.0, 5.0]]))[0]
+        assert array_intersects.tolist() == [True], array_intersects
+        try:
+            box.intersect_segments(starts, ends[1:])
+            assert False, "No mismatch error"  # pragma: no unit cover
+        except RuntimeError as runtime_error:
+            assert str(runtime_error).startswith("FabBox.intersect_segments(): "), runtime_error
+
     # FabBox._intersect_unit_tests():
     @staticmethod
     def _intersect_unit_tests() -> None:
@@ -732,6 +886,7 @@ class FabBox(object):
 
         # Do the intersect unit tests:
         FabBox._intersect_unit_tests()
+        FabBox._intersect_segments_unit_tests()
 
 
 # Fab_Prefix:
@@ -850,6 +1005,125 @@ class Fab_Prefix(object):
         assert second_operation.to_string() == "d01s002m02o002"
 
 
+# FabWorkspace:
+@dataclass(frozen=True)
+class FabWorkspace(object):
+    """FabWorkspace: The output and cache directories used by one run.
+
+    A run writes its files (project JSON, STEP files, `.ngc` files, traces, etc.) into its own
+    run directory, so many runs can share one build host without overwriting each other's
+    files.  Content hashed caches (e.g. the post-processed G-code) are kept in a separate
+    cache root that all of the runs share.
+
+    Attributes:
+    * *OutputRoot* (PathFile): The root directory for run outputs.  (Default: `/tmp`)
+    * *CacheRoot* (PathFile): The root directory for shared caches.  (Default: *OutputRoot*)
+    * *RunId* (str):
+      The run identifier (see FabWorkspace.newRunId().)  An empty run identifier writes the
+      run files directly into *OutputRoot*.  (Default: "")
+      The STEP files are written into the run directory and are only reused when a later run
+      has the same run directory.  So a new run identifier for each run turns off STEP file
+      reuse and every STEP file is regenerated.  (A shared STEP directory is not used, since
+      Fab_Steps.flush_inactives() deletes the STEP files that the current run did not use.)
+    * *RunDirectory* (PathFile): The directory for the run files (i.e. *OutputRoot*/*RunId*.)
+
+    Constructor:
+    * FabWorkspace(OutputRoot, CacheRoot, RunId)
+
+    """
+
+    OutputRoot: PathFile = PathFile("/tmp")
+    CacheRoot: Optional[PathFile] = None
+    RunId: str = ""
+
+    # FabWorkspace.__post_init__():
+    def __post_init__(self) -> None:
+        """Finish initializing FabWorkspace."""
+        check_type("FabWorkspace.OutputRoot", self.OutputRoot, PathFile)
+        check_type("FabWorkspace.CacheRoot", self.CacheRoot, Optional[PathFile])
+        check_type("FabWorkspace.RunId", self.RunId, str)
+        if self.RunId in (".", "..") or "/" in self.RunId or "\\" in self.RunId:
+            raise RuntimeError(
+                f"FabWorkspace.__post_init__(): RunId '{self.RunId}' is not a directory name")
+        if self.CacheRoot is None:
+            object.__setattr__(self, "CacheRoot", self.OutputRoot)
+
+    # FabWorkspace.RunDirectory():
+    @property
+    def RunDirectory(self) -> PathFile:
+        """Return the run directory."""
+        return self.OutputRoot / self.RunId if self.RunId else self.OutputRoot
+
+    # FabWorkspace.newRunId():
+    @staticmethod
+    def newRunId() -> str:
+        """Return a new run identifier that is unique on the build host."""
+        return f"{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}"
+
+    # FabWorkspace.getRunPath():
+    def getRunPath(self, file_name: str) -> PathFile:
+        """Return the path to a file in the run directory (creating the directory.)"""
+        run_directory: PathFile = self.RunDirectory
+        run_directory.mkdir(parents=True, exist_ok=True)
+        return run_directory / file_name
+
+    # FabWorkspace.getCacheDirectory():
+    def getCacheDirectory(self, name: str) -> PathFile:
+        """Return a named cache directory in the cache root (creating the directory.)"""
+        assert isinstance(self.CacheRoot, PathFile)
+        cache_directory: PathFile = self.CacheRoot / name
+        cache_directory.mkdir(parents=True, exist_ok=True)
+        return cache_directory
+
+    # FabWorkspace.getEnvironment():
+    def getEnvironment(self) -> Dict[str, str]:
+        """Return the environment variables that pass the workspace on to FabCNC."""
+        return {
+            "CACHE": str(self.CacheRoot),
+            "OUTPUT": str(self.RunDirectory),
+        }
+
+    # FabWorkspace._unit_tests():
+    @staticmethod
+    def _unit_tests(tracing: str = "") -> None:
+        """Run FabWorkspace unit tests."""
+        if tracing:
+            print(f"{tracing}=>FabWorkspace._unit_tests()")
+
+        # The default workspace matches the historical `/tmp` layout:
+        workspace: FabWorkspace = FabWorkspace()
+        assert workspace.RunDirectory == PathFile("/tmp"), workspace.RunDirectory
+        assert workspace.CacheRoot == PathFile("/tmp"), workspace.CacheRoot
+        assert workspace.getRunPath("Test.json") == PathFile("/tmp/Test.json")
+
+        # Two runs with distinct run identifiers share a cache root but not run directories:
+        temporary_directory: str
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            root: PathFile = PathFile(temporary_directory)
+            cache: PathFile = root / "cache"
+            run1: FabWorkspace = FabWorkspace(root, cache, "run1")
+            run2: FabWorkspace = FabWorkspace(root, cache, "run2")
+            assert run1.getRunPath("Test.json") == root / "run1" / "Test.json"
+            assert run2.getRunPath("Test.json") == root / "run2" / "Test.json"
+            assert run1.getCacheDirectory("ngc_cache") == run2.getCacheDirectory("ngc_cache")
+            assert (cache / "ngc_cache").is_dir() and (root / "run1").is_dir()
+            assert run1.getEnvironment() == {
+                "CACHE": str(cache), "OUTPUT": str(root / "run1")}, run1.getEnvironment()
+
+            run_id: str = FabWorkspace.newRunId()
+            assert FabWorkspace(root, None, run_id).RunDirectory == root / run_id
+            try:
+                FabWorkspace(root, cache, "../escape")
+                assert False, "Bad RunId was accepted"  # pragma: no unit cover
+            except RuntimeError as runtime_error:
+                assert str(runtime_error) == (
+                    "FabWorkspace.__post_init__(): RunId '../escape' is not a directory name"), (
+                        str(runtime_error))
+
+        if tracing:
+            print(f"{tracing}<=FabWorkspace._unit_tests()")
+
+
 # Fab_Steps:
 @dataclass
 class Fab_Steps(object):
@@ -1010,9 +1284,12 @@ class Fab_ProduceState(object):
     """Fab_ProduceState: Shared produce state for FabNode's.
 
     Attributes:
-    * *StepsDirectory* (PathFile):
-      The path to the directory to store STEP (`.stp`) files into.
+    * *Workspace* (FabWorkspace): The workspace that the run writes its files into.
     * *Shops* (FabShops): The list of available shops to use.
+    * *StepsDirectory* (PathFile):
+      The path to the directory to store STEP (`.stp`) files into (i.e. the run directory.)
+      STEP files are only reused from a previous run with the same run directory
+      (see FabWorkspace.RunId.)
     * *Steps* (Fab_Steps):
       The step file directory management object.
     * *ObjectsTable* (Dict[str, Any]):
@@ -1027,16 +1304,27 @@ class Fab_ProduceState(object):
       The currently preferred shop index to use for CNC Fab_ShopBit selection.
     * *CurrentMachineIndex* (int):
       The currently preferred machine index to use for CNC Fab_ShopBit selection.
+    * *CurrentToolNumber* (int):
+      The tool number currently loaded into the current machine (-1 for none.)
+    * *Scheduler* (Optional[Fab_OperationScheduler]):
+      The scheduler used to select Fab_ShopBit's and order operations (None for the default.)
+    * *ToolChangesBefore* (int): The tool changes needed without operation scheduling.
+    * *ToolChangesAfter* (int): The tool changes needed with operation scheduling.
+    * *MachineSwitchesBefore* (int): The machine switches needed without operation scheduling.
+    * *MachineSwitchesAfter* (int): The machine switches needed with operation scheduling.
+    * *RapidDistanceBefore* (float): The drilling rapid travel (mm) without point ordering.
+    * *RapidDistanceAfter* (float): The drilling rapid travel (mm) with point ordering.
 
     This class is for internal use only:
 
     Constructor:
-    * Fab_ProduceState(StepsDirectory, Shops)
+    * Fab_ProduceState(Workspace, Shops)
 
     """
 
-    StepsDirectory: PathFile
+    Workspace: FabWorkspace
     Shops: FabShops
+    StepsDirectory: PathFile = field(init=False, repr=False)
     Steps: Fab_Steps = field(init=False, repr=False)
     ObjectsTable: Dict[str, Any] = field(init=False, repr=False)
     BitsTable: Dict[FabBit, int] = field(init=False, repr=False)
@@ -1044,12 +1332,22 @@ class Fab_ProduceState(object):
     OperationIndex: int = field(init=False, repr=False)
     CurrentShopIndex: int = field(init=False, repr=False)
     CurrentMachineIndex: int = field(init=False, repr=False)
+    CurrentToolNumber: int = field(init=False, repr=False)
+    Scheduler: Any = field(init=False, repr=False)
+    ToolChangesBefore: int = field(init=False, repr=False)
+    ToolChangesAfter: int = field(init=False, repr=False)
+    MachineSwitchesBefore: int = field(init=False, repr=False)
+    MachineSwitchesAfter: int = field(init=False, repr=False)
+    RapidDistanceBefore: float = field(init=False, repr=False)
+    RapidDistanceAfter: float = field(init=False, repr=False)
 
     # Fab_ProduceState.__post_init__():
     def __post_init__(self) -> None:
         """Finish initializing _ProduceState."""
-        check_type("Fab_ProduceState.StepsDirectory", self.StepsDirectory, PathFile)
+        check_type("Fab_ProduceState.Workspace", self.Workspace, FabWorkspace)
         check_type("Fab_ProduceState.Shops", self.Shops, FabShops)
+        self.StepsDirectory = self.Workspace.RunDirectory
+        self.StepsDirectory.mkdir(parents=True, exist_ok=True)
         self.ObjectsTable = {}
         self.Steps = Fab_Steps(self.StepsDirectory)
         self.BitsTable = {}
@@ -1057,6 +1355,168 @@ class Fab_ProduceState(object):
         self.OperationsIndex = 0
         self.CurrentShopIndex = 0
         self.CurrentMachineIndex = 0
+        self.CurrentToolNumber = -1
+        self.Scheduler = None
+        self.ToolChangesBefore = 0
+        self.ToolChangesAfter = 0
+        self.MachineSwitchesBefore = 0
+        self.MachineSwitchesAfter = 0
+        self.RapidDistanceBefore = 0.0
+        self.RapidDistanceAfter = 0.0
+
+
+# Fab_JsonWriter:
+@dataclass
+class Fab_JsonWriter(object):
+    """Fab_JsonWriter: Writes a tree of JSON nodes to a file one node at a time.
+
+    Building the JSON for an entire FabNode tree with `to_json()` and then converting it to
+    a string with `json.dumps()` keeps two copies of everything in memory.  Fab_JsonWriter
+    only builds the JSON for one node (without its children) at a time and writes it straight
+    to the file.  Keys are always sorted.  With an *Indent* of 2, the output is identical to
+    `json.dumps(tree, indent=2, sort_keys=True)`; an *Indent* of 0 writes compact JSON.
+
+    Attributes:
+    * *Indent* (int): The number of spaces per nesting level (0 for compact.)  (Default: 2)
+
+    Constructor:
+    * Fab_JsonWriter(Indent)
+
+    """
+
+    Indent: int = 2
+
+    # Fab_JsonWriter.__post_init__():
+    def __post_init__(self) -> None:
+        """Finish initializing Fab_JsonWriter."""
+        check_type("Fab_JsonWriter.Indent", self.Indent, int)
+        if self.Indent < 0:
+            raise RuntimeError(f"Fab_JsonWriter.__post_init__(): Indent ({self.Indent}) < 0")
+
+    # Fab_JsonWriter.writeTree():
+    def writeTree(self, json_file: IO[str], root: Any,
+                  shallow: Callable[[Any], Dict[str, Any]],
+                  children: Callable[[Any], Sequence[Any]]) -> None:
+        """Write a tree of nodes as JSON.
+
+        Arguments:
+        * *json_file* (IO[str]): The file to write to.
+        * *root* (Any): The root node.
+        * *shallow* (Callable[[Any], Dict[str, Any]]):
+          Returns the JSON for a node without its children.  If the JSON already has a
+          "children" key, it is written as is and *children* is not called.
+        * *children* (Callable[[Any], Sequence[Any]]): Returns the child nodes of a node.
+
+        """
+        self._writeNode(json_file, root, shallow, children, 0)
+        if self.Indent == 0:
+            json_file.write("\n")
+
+    # Fab_JsonWriter.writeNode():
+    def writeNode(self, json_file: IO[str], node: "FabNode") -> None:
+        """Write a FabNode tree as JSON (same content as `FabNode.to_json()`.)"""
+        self.writeTree(json_file, node,
+                       lambda node: node.to_json(children=False),
+                       lambda node: tuple(node._Children.values()))
+
+    # Fab_JsonWriter._writeNode():
+    def _writeNode(self, json_file: IO[str], node: Any,
+                   shallow: Callable[[Any], Dict[str, Any]],
+                   children: Callable[[Any], Sequence[Any]], level: int) -> None:
+        """Write one node and recursively its children."""
+        indent: int = self.Indent
+        node_json: Dict[str, Any] = shallow(node)
+        child_nodes: Sequence[Any] = () if "children" in node_json else children(node)
+        keys: List[str] = list(node_json.keys())
+        if child_nodes:
+            keys.append("children")
+        keys.sort()
+        if not keys:
+            json_file.write("{}")
+            return
+
+        # Compute the separators for this nesting *level*:
+        key_separator: str = ": " if indent else ":"
+        pad: str = "\n" + " " * (indent * (level + 1)) if indent else ""
+        child_pad: str = "\n" + " " * (indent * (level + 2)) if indent else ""
+        close_pad: str = "\n" + " " * (indent * level) if indent else ""
+
+        json_file.write("{")
+        index: int
+        key: str
+        for index, key in enumerate(keys):
+            json_file.write(("," if index else "") + pad + json.dumps(key) + key_separator)
+            if key == "children" and child_nodes:
+                json_file.write("[")
+                child_index: int
+                child_node: Any
+                for child_index, child_node in enumerate(child_nodes):
+                    json_file.write(("," if child_index else "") + child_pad)
+                    self._writeNode(json_file, child_node, shallow, children, level + 2)
+                json_file.write(pad + "]")
+            else:
+                value_text: str
+                if indent:
+                    # JSON strings never contain a raw new-line, so re-indenting is safe:
+                    value_text = json.dumps(node_json[key], indent=indent, sort_keys=True)
+                    value_text = value_text.replace("\n", pad)
+                else:
+                    value_text = json.dumps(
+                        node_json[key], separators=(",", ":"), sort_keys=True)
+                json_file.write(value_text)
+        json_file.write(close_pad + "}")
+
+    # Fab_JsonWriter._unit_tests():
+    @staticmethod
+    def _unit_tests(tracing: str = "") -> None:
+        """Run Fab_JsonWriter unit tests."""
+        if tracing:
+            print(f"{tracing}=>Fab_JsonWriter._unit_tests()")
+
+        # The tree nodes are dictionaries where "kids" are the child nodes:
+        leaf1: Dict[str, Any] = {"Label": "Leaf1", "Values": [1, 2.5, {"b": None, "a": "x\ny"}]}
+        leaf2: Dict[str, Any] = {"Label": "Leaf2", "children": [{"Mount": 1}, {}], "Empty": []}
+        middle: Dict[str, Any] = {"Label": "Middle", "kids": [leaf1, leaf2], "Kind": "Group"}
+        root: Dict[str, Any] = {"Label": "Root", "kids": [middle, {"Label": "Lone"}], "Z": {}}
+
+        def shallow(node: Dict[str, Any]) -> Dict[str, Any]:
+            """Return a node without its kids."""
+            key: str
+            value: Any
+            return {key: value for key, value in node.items() if key != "kids"}
+
+        def children(node: Dict[str, Any]) -> Sequence[Any]:
+            """Return the node kids."""
+            return node.get("kids", [])
+
+        def expand(node: Dict[str, Any]) -> Dict[str, Any]:
+            """Return the fully expanded tree (i.e. what to_json() returns.)"""
+            expanded: Dict[str, Any] = shallow(node)
+            kid: Dict[str, Any]
+            if "children" not in expanded and node.get("kids"):
+                expanded["children"] = [expand(kid) for kid in node["kids"]]
+            return expanded
+
+        indent: int
+        for indent in (2, 4, 0):
+            writer: Fab_JsonWriter = Fab_JsonWriter(indent)
+            string_file: io.StringIO = io.StringIO()
+            writer.writeTree(string_file, root, shallow, children)
+            actual: str = string_file.getvalue()
+            desired: str = (json.dumps(expand(root), indent=indent, sort_keys=True)
+                            if indent else
+                            json.dumps(expand(root), separators=(",", ":"), sort_keys=True) + "\n")
+            assert actual == desired, (indent, actual, desired)
+            assert json.loads(actual) == expand(root)
+
+        try:
+            Fab_JsonWriter(-1)
+            assert False  # pragma: no unit cover
+        except RuntimeError as runtime_error:
+            assert str(runtime_error) == "Fab_JsonWriter.__post_init__(): Indent (-1) < 0"
+
+        if tracing:
+            print(f"{tracing}<=Fab_JsonWriter._unit_tests()")
 
 
 # FabNode:
@@ -1250,11 +1710,18 @@ class FabNode(FabBox):
         return False  # FabSolid class returns True.  # pragma: no unit cover
 
     # FabNode.to_json():
-    def to_json(self) -> Dict[str, Any]:
-        """Return a dictionary for JSON output."""
+    def to_json(self, children: bool = True) -> Dict[str, Any]:
+        """Return a dictionary for JSON output.
+
+        Arguments:
+        * *children* (bool):
+          True to recursively include the children FabNode's (see Fab_JsonWriter.)
+          (Default: True)
+
+        """
         children_json: List[Any] = []
         child_node: FabNode
-        for child_node in self._Children.values():
+        for child_node in self._Children.values() if children else ():
             child_json: Dict[str, Any] = child_node.to_json()
             if child_json:
                 children_json.append(child_json)
@@ -1360,5 +1827,7 @@ class FabNode(FabBox):
 if __name__ == "__main__":
     # _unit_tests("")
     Fab_Prefix._unit_tests()
+    FabWorkspace._unit_tests(" ")
     Fab_Steps._unit_tests(" ")
+    Fab_JsonWriter._unit_tests(" ")
     FabBox._unit_tests()
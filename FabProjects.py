@@ -12,16 +12,27 @@ Classes:
 
 from dataclasses import dataclass, field
 import json
+import math
 from pathlib import Path
+import tempfile
 from typing import Any, cast, Dict, IO, List, Optional, Set, Tuple
 from typeguard import check_argument_types, check_type
 
 import cadquery as cq  # type: ignore
 from cadquery import Vector  # type: ignore
 
-from FabNodes import FabNode, Fab_Prefix, Fab_ProduceState
-from FabShops import FabShops
-from FabSolids import FabSolid
+from FabGCodes import FabGCodeEmitter
+from FabGeometries import FabCircle, FabPlane, FabPolygon
+from FabJoins import FabFasten, FabJoin
+from FabNodes import Fab_JsonWriter, FabNode, Fab_Prefix, Fab_ProduceState, FabWorkspace
+from FabShops import FabAxis, FabCNC, FabController, FabLocation, FabShop, Fab_ShopBit
+from FabShops import FabShops, FabSpindle, FabTable
+from FabSolids import Fab_CycleTime, Fab_Extrude, FabFleetSchedule, FabFleetScheduler
+from FabSolids import Fab_FleetJob, Fab_Hole, Fab_HoleKey, FabMount, FabNester
+from FabSolids import Fab_Pocket, FabSheet, FabSolid, Fab_OperationScheduler
+from FabToolBits import FabDrillBit, FabEndMillBit
+from FabTools import FabBit, FabLibrary
+from FabUtilities import FabMaterial, FabToolController
 
 
 # Fab_Group:
@@ -90,9 +101,9 @@ class FabAssembly(Fab_Group):
         return True  # All other FabNode's return False.  # pragma: no unit cover
 
     # FabAssembly.to_json():
-    def to_json(self) -> Dict[str, Any]:
+    def to_json(self, children: bool = True) -> Dict[str, Any]:
         """Return FabProject JSON structure."""
-        json: Dict[str, Any] = super().to_json()
+        json: Dict[str, Any] = super().to_json(children)
         json["Kind"] = "Assembly"
         return json
 
@@ -204,9 +215,9 @@ class FabDocument(FabNode):
                     "not FabAssembly/Fab_Group/FabSolid")  # pragma: no unit cover
 
     # FabDocument.to_json():
-    def to_json(self) -> Dict[str, Any]:
+    def to_json(self, children: bool = True) -> Dict[str, Any]:
         """Return FabProject JSON structure."""
-        json: Dict[str, Any] = super().to_json()
+        json: Dict[str, Any] = super().to_json(children)
         json["Kind"] = "Document"
         json["_FilePath"] = str(self.FilePath)
         return json
@@ -252,6 +263,23 @@ class FabProject(FabNode):
     * *Label* (str): The project name.
     * *Shops* (FabShops):
       The FabShop's available for fabrication.  Set using FabShop.setShops() method.
+    * *Scheduler* (Optional[Fab_OperationScheduler]):
+      The scheduler used to order mount operations.  Set using FabProject.setScheduler().
+      (Default: None, which selects Fab_ToolChangeScheduler.)
+    * *Nester* (Optional[FabNester]):
+      The nester used to lay out FabSolid's onto stock sheets.  Set using FabProject.setNester().
+      (Default: None, which disables nesting.)
+    * *CompactJson* (bool):
+      True to write the project JSON file without indentation.  Set using
+      FabProject.setCompactJson().  (Default: False)
+    * *NativeGCode* (bool):
+      True to write G-code files directly for each FabMount that only drills holes and
+      contours circles or convex polygons, without going through FreeCAD (see FabGCodes.)
+      Set using FabProject.setNativeGCode().  (Default: False)
+    * *Workspace* (FabWorkspace):
+      The output root, cache root, and run identifier that determine where the project JSON,
+      STEP, and G-code files are written.  Set using FabProject.setWorkspace().
+      (Default: FabWorkspace(), which writes everything into `/tmp`.)
 
     Constructor:
     * FabProject.new("Name")
@@ -259,6 +287,11 @@ class FabProject(FabNode):
     """
 
     _Shops: Optional[FabShops] = field(init=False, repr=False)
+    _Scheduler: Optional[Fab_OperationScheduler] = field(init=False, repr=False)
+    _Nester: Optional[FabNester] = field(init=False, repr=False)
+    _CompactJson: bool = field(init=False, repr=False)
+    _NativeGCode: bool = field(init=False, repr=False)
+    _Workspace: FabWorkspace = field(init=False, repr=False)
     _AllNodes: Tuple[FabNode, ...] = field(init=False, repr=False)
     _Errors: List[str] = field(init=False, repr=False)
     LastDocument: Optional[FabDocument] = field(init=False, repr=False)
@@ -268,6 +301,11 @@ class FabProject(FabNode):
         """Process FabRoot."""
         super().__post_init__()
         self._Shops = None
+        self._Scheduler = None
+        self._Nester = None
+        self._CompactJson = False
+        self._NativeGCode = False
+        self._Workspace = FabWorkspace()
         self._AllNodes = ()
         self._Errors = []
         self.LastDocument = None
@@ -290,6 +328,72 @@ class FabProject(FabNode):
                 "FabProject.Shops(): Shops has already been set.")  # pragma: no unit cover
         self._Shops = shops
 
+    # FabProject.Scheduler():
+    @property
+    def Scheduler(self) -> Optional[Fab_OperationScheduler]:
+        """Return the FabProject operation scheduler."""
+        return self._Scheduler  # pragma: no unit cover
+
+    # FabProject.setScheduler():
+    def setScheduler(self, scheduler: Fab_OperationScheduler) -> None:
+        """Set the operation scheduler to use for a FabProject."""
+        assert check_argument_types()
+        self._Scheduler = scheduler  # pragma: no unit cover
+
+    # FabProject.Nester():
+    @property
+    def Nester(self) -> Optional[FabNester]:
+        """Return the FabProject sheet nester."""
+        return self._Nester  # pragma: no unit cover
+
+    # FabProject.setNester():
+    def setNester(self, nester: FabNester) -> None:
+        """Set the sheet nester to use for a FabProject."""
+        assert check_argument_types()
+        self._Nester = nester  # pragma: no unit cover
+
+    # FabProject.CompactJson():
+    @property
+    def CompactJson(self) -> bool:
+        """Return True if the project JSON file is written without indentation."""
+        return self._CompactJson  # pragma: no unit cover
+
+    # FabProject.setCompactJson():
+    def setCompactJson(self, compact_json: bool) -> None:
+        """Set whether the project JSON file is written without indentation."""
+        assert check_argument_types()
+        self._CompactJson = compact_json  # pragma: no unit cover
+
+    # FabProject.NativeGCode():
+    @property
+    def NativeGCode(self) -> bool:
+        """Return True if G-code is generated natively for simple FabMount's."""
+        return self._NativeGCode  # pragma: no unit cover
+
+    # FabProject.setNativeGCode():
+    def setNativeGCode(self, native_gcode: bool) -> None:
+        """Set whether G-code is generated natively for simple FabMount's."""
+        assert check_argument_types()
+        self._NativeGCode = native_gcode  # pragma: no unit cover
+
+    # FabProject.Workspace():
+    @property
+    def Workspace(self) -> FabWorkspace:
+        """Return the FabProject workspace."""
+        return self._Workspace  # pragma: no unit cover
+
+    # FabProject.setWorkspace():
+    def setWorkspace(self, workspace: FabWorkspace) -> None:
+        """Set the workspace that a FabProject writes its files into."""
+        assert check_argument_types()
+        self._Workspace = workspace
+
+    # FabProject.getSolids():
+    def getSolids(self) -> Tuple[FabSolid, ...]:
+        """Return the FabSolid's in a FabProject (e.g. for FabFleetScheduler.scheduleSolids().)"""
+        node: FabNode
+        return tuple([node for node in self._AllNodes if isinstance(node, FabSolid)])
+
     # FabProject.get_errors():
     def get_errors(self) -> List[str]:
         """Return the FabProject errors list."""
@@ -312,18 +416,26 @@ class FabProject(FabNode):
         return project  # pragma: no unit cover
 
     # FabProject.to_json():
-    def to_json(self) -> Dict[str, Any]:
+    def to_json(self, children: bool = True) -> Dict[str, Any]:
         """Return FabProject JSON structure."""
-        json: Dict[str, Any] = super().to_json()
+        json: Dict[str, Any] = super().to_json(children)
         json["Kind"] = "Project"
         return json
 
     # FabProject.run():
-    def run(self, step_directory: Optional[Path] = None) -> None:
+    def run(self, workspace: Optional[FabWorkspace] = None) -> None:
+        """Produce the FabProject files into a workspace (Default: FabProject.Workspace.)
+
+        The STEP files of a previous run are only reused when the workspace has the same run
+        directory, so a workspace with a new RunId regenerates all of the STEP files.
+        """
         # Shared variables:
         tracing: str = self.Tracing
         if tracing:
             print(f"{tracing}=>Project({self.Label}).run()")
+        if workspace is None:
+            workspace = self._Workspace
+        step_directory: Path = workspace.RunDirectory
 
         # Phase 1: Iterate over tree in constraint mode:
         if tracing:
@@ -336,9 +448,9 @@ class FabProject(FabNode):
         node: FabNode
         errors: List[str] = self._Errors
 
-        produce_state: Fab_ProduceState = Fab_ProduceState(Path("/tmp"), self.Shops)
-        if step_directory is None:
-            step_directory = Path("/tmp")
+        produce_state: Fab_ProduceState = Fab_ProduceState(workspace, self.Shops)
+        produce_state.Scheduler = self._Scheduler
+        FabToolController.clearCache()
         previous_constraints: Set[str] = set()
         differences: List[int] = []
         all_nodes: Tuple[FabNode, ...] = self._AllNodes
@@ -391,22 +503,107 @@ class FabProject(FabNode):
             del errors[:]  # Clear *errors*
             for node in all_nodes:
                 node.post_produce1(produce_state)
+            if tracing:
+                print(f"{tracing}Tool changes: "
+                      f"{produce_state.ToolChangesBefore}=>{produce_state.ToolChangesAfter}  "
+                      f"Machine switches: {produce_state.MachineSwitchesBefore}=>"
+                      f"{produce_state.MachineSwitchesAfter}")
+                rapid_saved: float = (
+                    produce_state.RapidDistanceBefore - produce_state.RapidDistanceAfter)
+                print(f"{tracing}Drill rapids: {produce_state.RapidDistanceBefore:.1f}mm=>"
+                      f"{produce_state.RapidDistanceAfter:.1f}mm (saved {rapid_saved:.1f}mm)")
 
             if tracing:
                 print(f"{tracing}Phase 2B: post_produce2(*, '{step_directory}'):")
             del errors[:]  # Clear *errors*
             for node in all_nodes:
                 node.post_produce2(produce_state)
+            if tracing:
+                cache_hits: int
+                cache_misses: int
+                cache_hits, cache_misses = FabToolController.getCacheStatistics()
+                print(f"{tracing}Tool controllers: "
+                      f"{len(produce_state.ToolControllersTable)} unique, "
+                      f"{cache_misses} computed, {cache_hits} cached")
+
+            # Estimate the cycle time of each FabSolid and summarize them in a table:
+            if tracing:
+                print(f"{tracing}{'Solid':<32} {'Cutting':>9} {'Plunging':>9} {'Rapid':>9} "
+                      f"{'Tools':>9} {'Total':>9}")
+            total_cycle_time: Fab_CycleTime = Fab_CycleTime()
+            for node in all_nodes:
+                if isinstance(node, FabSolid):
+                    cycle_time: Fab_CycleTime = node.estimateCycleTime(produce_state)
+                    total_cycle_time = total_cycle_time.add(cycle_time)
+                    if tracing:
+                        print(f"{tracing}{node.Label:<32} {cycle_time.Cutting:9.1f} "
+                              f"{cycle_time.Plunging:9.1f} {cycle_time.Rapid:9.1f} "
+                              f"{cycle_time.ToolChange:9.1f} {cycle_time.Total:9.1f}")
+            if tracing:
+                print(f"{tracing}{'Total (seconds)':<32} {total_cycle_time.Cutting:9.1f} "
+                      f"{total_cycle_time.Plunging:9.1f} {total_cycle_time.Rapid:9.1f} "
+                      f"{total_cycle_time.ToolChange:9.1f} {total_cycle_time.Total:9.1f}")
+
+            # Nest the FabSolid CNC footprints onto stock sheets:
+            if self._Nester is not None:  # pragma: no unit cover
+                solids: List[FabSolid] = [
+                    node for node in all_nodes if isinstance(node, FabSolid)]
+                nests: Dict[Tuple[Tuple[str, ...], float], Tuple[FabSheet, ...]] = (
+                    self._Nester.nestSolids(solids))
+                nest_json: List[Dict[str, Any]] = []
+                material_name: Tuple[str, ...]
+                thickness: float
+                sheets: Tuple[FabSheet, ...]
+                for (material_name, thickness), sheets in nests.items():
+                    sheet: FabSheet
+                    for sheet in sheets:
+                        if tracing:
+                            print(f"{tracing}Sheet[{'.'.join(material_name)}:"
+                                  f"{thickness:.2f}mm:{sheet.Index}]: "
+                                  f"{len(sheet.Placements)} parts "
+                                  f"{100.0 * sheet.Utilization:.1f}% utilization")
+                        sheet_json: Dict[str, Any] = sheet.to_json()
+                        sheet_json["Material"] = list(material_name)
+                        sheet_json["Thickness"] = thickness
+                        nest_json.append(sheet_json)
+                nest_file: IO[str]
+                with open(workspace.getRunPath(f"{self.Label}_nest.json"), "w") as nest_file:
+                    nest_file.write(json.dumps(nest_json, indent=2, sort_keys=True))
 
             if tracing:
                 print(f"{tracing}Phase 2C: post_produce3():")
             for node in reversed(all_nodes):
                 node.post_produce3(produce_state)
 
-        top_json: Dict[str, Any] = self.to_json()
+        # Generate G-code directly for the FabMount's that do not need FreeCAD.  These FabMount's
+        # are marked in the JSON, so FabCNC does not overwrite their `.ngc` files:
+        if self._NativeGCode:  # pragma: no unit cover
+            emitter: FabGCodeEmitter = FabGCodeEmitter()
+            native_count: int = 0
+            freecad_count: int = 0
+            solid: FabSolid
+            for solid in self.getSolids():
+                mount: FabMount
+                for mount in solid.Mounts:
+                    job_name: str = f"{solid.Label}_{mount.Name}"
+                    gcode: Optional[str] = emitter.emitMount(job_name, mount.to_json())
+                    mount.NativeGCode = gcode is not None
+                    if gcode is None:
+                        freecad_count += 1
+                        continue
+                    gcode_file: IO[str]
+                    with open(workspace.getRunPath(f"{job_name}.ngc"), "w") as gcode_file:
+                        gcode_file.write(gcode)
+                    native_count += 1
+            if tracing:
+                print(f"{tracing}Native G-code: {native_count} mounts written, "
+                      f"{freecad_count} mounts need FreeCAD")
+
+        # Stream the JSON one FabNode at a time rather than building it all in memory:
+        json_writer: Fab_JsonWriter = Fab_JsonWriter(0 if self._CompactJson else 2)
         json_file: IO[str]
-        with open(f"/tmp/{self.Label}.json", "w") as json_file:
-            json_file.write(json.dumps(top_json, indent=2, sort_keys=True))
+        with open(workspace.getRunPath(f"{self.Label}.json"), "w") as json_file:
+            json_writer.writeNode(json_file, self)
 
         produce_state.Steps.flush_inactives()
 
@@ -447,6 +644,145 @@ class FabProject(FabNode):
 
         project: FabProject = FabProject.new("TestProject")
         assert project.Label == "TestProject"
+
+        # Estimate the cycle times of an extrude, a pocket and a hole (feeds are in mm/sec):
+        document: FabDocument = FabDocument("TestDocument", project, Path("/tmp/Test.fcstd"))
+        solid: FabSolid = FabSolid(
+            "TestSolid", document, FabMaterial(("Plastic", "HDPE"), "red"), "red")
+        plane: FabPlane = FabPlane(Vector(0.0, 0.0, 0.0), Vector(0.0, 0.0, 1.0))
+        mount: FabMount = solid.mount(
+            "TestMount", plane, 10.0, Vector(1.0, 0.0, 0.0), Vector(0.0, 0.0, 0.0))
+        tool_controller: FabToolController = FabToolController(
+            BitName="5mm Endmill", Cooling="Flood", HorizontalFeed=10.0, HorizontalRapid=100.0,
+            SpindleDirection=True, SpindleSpeed=10000, ToolNumber=1, VerticalFeed=2.0,
+            VerticalRapid=20.0)
+
+        # A 20x10 outline contoured 10mm deep in 4 passes of 3mm:
+        extrude: Fab_Extrude = Fab_Extrude("TestExtrude", mount, FabPolygon(plane, (
+            Vector(0.0, 0.0, 0.0), Vector(20.0, 0.0, 0.0),
+            Vector(20.0, 10.0, 0.0), Vector(0.0, 10.0, 0.0))), 10.0, True)
+        cycle_time: Fab_CycleTime = extrude.estimateCycleTime(tool_controller)
+        assert cycle_time == Fab_CycleTime(
+            Cutting=4 * 60.0 / 10.0, Plunging=10.0 / 2.0,
+            Rapid=2.0 * (10.0 + 10.0) / 20.0), cycle_time
+
+        # An 8mm circular pocket 4mm deep cleared in 2 levels (2mm and 4mm deep):
+        pocket: Fab_Pocket = Fab_Pocket(
+            "TestPocket", mount, FabCircle(plane, Vector(5.0, 5.0, 0.0), 8.0), 4.0)
+        end_mill: FabEndMillBit = FabEndMillBit.getExample()
+        drill: FabDrillBit = FabDrillBit.getExample()
+
+        def new_cnc(name: str, numbered_bits: Tuple[Tuple[int, FabBit], ...]) -> FabCNC:
+            """Return a new test FabCNC with some numbered FabBit's."""
+            axis: str
+            return FabCNC(
+                Name=name, Placement="", Axes=tuple([
+                    FabAxis(Name=f"{axis} Axis", Letter=axis, Linear=True, Range=500.0,
+                            Feed=100.0, Acceleration=0.0, EndSensors=True, Brake=False)
+                    for axis in "XYZ"]),
+                Table=FabTable("TestTable", 100.0, 50.0, 30.0, 4, 10.0, 5.0, 5.0, 10.0, 5.0),
+                Spindle=FabSpindle(Type="ER20", Speed=24000, Reversible=True,
+                                   FloodCooling=True, MistCooling=False),
+                Controller=FabController("TestController", "linuxcnc"),
+                Library=FabLibrary(f"{name}Library", numbered_bits))
+
+        cnc: FabCNC = new_cnc("TestCNC", ((1, end_mill),))
+        shop: FabShop = FabShop(Name="TestShop", Location=FabLocation.getExample(),
+                                Machines=(cnc,))
+        pocket.SelectedShopBit = Fab_ShopBit(-1.0, shop, 0, cnc, 0, end_mill, 1)
+        cycle_time = pocket.estimateCycleTime(tool_controller)
+        area: float = math.pi * 4.0 * 4.0
+        perimeter: float = math.pi * 8.0
+        step_over: float = 0.90 * end_mill.getNumber("Diameter")
+        assert abs(cycle_time.Cutting - 2.0 * (area / step_over + perimeter) / 10.0) < 1.0e-9, (
+            cycle_time)
+        assert abs(cycle_time.Plunging - (2.0 + 4.0) / 2.0) < 1.0e-9, cycle_time
+        assert abs(cycle_time.Rapid - ((10.0 + 2.0) + (10.0 + 4.0)) / 20.0) < 1.0e-9, cycle_time
+
+        # Two 6mm deep holes 50mm apart:
+        join: FabJoin = FabJoin("TestJoin", FabFasten("TestFasten", "M3-0.5", ()),
+                                Vector(0.0, 0.0, 0.0), Vector(0.0, 0.0, -6.0))
+        hole: Fab_Hole = Fab_Hole(
+            "TestHole", mount, Fab_HoleKey("M3-0.5", "close", 6.0, True),
+            (Vector(0.0, 0.0, 0.0), Vector(30.0, 40.0, 0.0)), join, 6.0)
+        cycle_time = hole.estimateCycleTime(tool_controller)
+        assert abs(cycle_time.Plunging - 2.0 * 6.0 / 2.0) < 1.0e-9, cycle_time
+        assert abs(cycle_time.Rapid - (2.0 * (10.0 + 6.0) / 20.0 + 50.0 / 100.0)) < 1.0e-9, (
+            cycle_time)
+        assert cycle_time.Cutting == 0.0, cycle_time
+        hole.ToolControllerIndex = 3
+        assert hole.to_json()["ToolControllerIndex"] == 3, hole.to_json()
+
+        # Schedule 2 copies of the FabSolid's where the extrude uses the end mill on "Mill" and
+        # the pocket uses the drill on "Driller"; only "Both" has both bits:
+        assert project.getSolids() == (solid,), project.getSolids()
+        mill: FabCNC = new_cnc("Mill", ((1, end_mill),))
+        driller: FabCNC = new_cnc("Driller", ((1, drill),))
+        both: FabCNC = new_cnc("Both", ((1, end_mill), (2, drill)))
+        fleet_shop: FabShop = FabShop(
+            Name="Fleet", Location=FabLocation.getExample(), Machines=(mill, driller, both))
+        extrude.SelectedShopBit = Fab_ShopBit(-1.0, fleet_shop, 0, mill, 0, end_mill, 1)
+        pocket.SelectedShopBit = Fab_ShopBit(-1.0, fleet_shop, 0, driller, 1, drill, 1)
+        extrude.ToolControllerIndex = 0
+        pocket.ToolControllerIndex = 0
+        mount.record_operation(extrude)
+        mount.record_operation(pocket)
+        assert solid.Mounts == (mount,), solid.Mounts
+        assert "_NativeGCode" not in mount.to_json(), mount.to_json()
+        mount.NativeGCode = True
+        assert mount.to_json()["_NativeGCode"] is True, mount.to_json()
+        mount.NativeGCode = False
+        mount_cycle_time: Fab_CycleTime
+        mount_cycle_time, _ = mount.estimateCycleTime({0: tool_controller}, (-1, -1, -1))
+        assert mount_cycle_time.ToolChange == 2 * 30.0, mount_cycle_time
+        scheduler: FabFleetScheduler = FabFleetScheduler(FabShops((fleet_shop,)), 60.0)
+        jobs: List[Fab_FleetJob] = scheduler.getJobs(project.getSolids(), 2)
+        job_duration: float = 60.0 + mount_cycle_time.Total
+        assert [(job.Name, job.Durations) for job in jobs] == [
+            ("TestSolid#0.TestMount", (((0, 2), job_duration),)),
+            ("TestSolid#1.TestMount", (((0, 2), job_duration),))], jobs
+        schedule: FabFleetSchedule = scheduler.scheduleSolids(project.getSolids(), 2)
+        assert abs(schedule.Makespan - 2.0 * job_duration) < 1.0e-9, schedule.Makespan
+        assert schedule.getLoads() == {(0, 2): schedule.Makespan}, schedule.getLoads()
+        assert schedule.to_json()["Machines"][0]["Name"] == "Fleet/Both", schedule.to_json()
+        try:
+            FabFleetScheduler(FabShops((FabShop(
+                Name="Split", Location=FabLocation.getExample(), Machines=(mill, driller)),))
+            ).getJobs(project.getSolids())
+            assert False, "FabFleetScheduler.getJobs() did not fail"  # pragma: no unit cover
+        except RuntimeError as error:
+            assert str(error) == (
+                "FabFleetScheduler.getJobs(): No machine has all of the bits "
+                f"{sorted((end_mill.Name, drill.Name))} for TestSolid.TestMount"), str(error)
+
+        # FabProject.run() estimates the cycle times without tracing, so the FabSolid's can be
+        # scheduled right after it:
+        @dataclass
+        class RunSolid(FabSolid):
+            def produce(self) -> None:
+                mount: FabMount = self.mount(
+                    "RunMount", plane, 10.0, Vector(1.0, 0.0, 0.0), Vector(0.0, 0.0, 0.0))
+                mount.extrude("RunExtrude", FabPolygon(plane, (
+                    Vector(0.0, 0.0, 0.0), Vector(20.0, 0.0, 0.0),
+                    Vector(20.0, 10.0, 0.0), Vector(0.0, 10.0, 0.0))), 10.0)
+
+        run_project: FabProject = FabProject.new("RunProject")
+        run_document: FabDocument = FabDocument("RunDocument", run_project, Path("/tmp/Run.fcstd"))
+        RunSolid("RunSolid", run_document, FabMaterial(("Plastic", "HDPE"), "red"), "red")
+        run_shops: FabShops = FabShops((FabShop(
+            Name="Run", Location=FabLocation.getExample(), Machines=(mill,)),))
+        run_project.setShops(run_shops)
+        temporary_directory: str
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            run_project.setWorkspace(FabWorkspace(Path(temporary_directory)))
+            run_project.run()
+        run_scheduler: FabFleetScheduler = FabFleetScheduler(run_shops, 60.0)
+        run_jobs: List[Fab_FleetJob] = run_scheduler.getJobs(run_project.getSolids(), 2)
+        assert len(run_jobs) == 2 and run_jobs[0].Durations[0][1] > 60.0, run_jobs
+        schedule = run_scheduler.scheduleSolids(run_project.getSolids(), 2)
+        assert abs(schedule.Makespan - 2.0 * run_jobs[0].Durations[0][1]) < 1.0e-9, (
+            schedule.Makespan)
+
         shops: FabShops = FabShops.getExample()
         project.setShops(shops)
         assert project.Shops is shops
@@ -22,6 +22,7 @@ This is a package provides classes used to define what machines are available in
 # * Edit move the from line 11 to line 10 in .../Tools/Bit/45degree_chamfer.fctb to fix JSON error.
 # * When setting path to library, be sure to include .../Tools/Library  (one level up does not work)
 
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass, field
 from pathlib import Path as PathFile
 from typeguard import check_argument_types, check_type
@@ -124,9 +125,12 @@ class FabSpindle(object):
     * *Reversible* (bool): True if spindle can be reversed.
     * *FloodCooling* (bool): True if flood cooling is available.
     * *MistCooling* (bool): True if mist coooling is available.
+    * *Power* (float): Spindle power in watts (0.0 means unknown.)  (Default: 0.0)
+    * *Torque* (float): Maximum spindle torque in newton meters (0.0 means unknown.)
+      (Default: 0.0)
 
     Constructor:
-    * FabSpindle("Type", Speed, Reversible, FloodCooling, MistCooling)
+    * FabSpindle("Type", Speed, Reversible, FloodCooling, MistCooling, Power, Torque)
 
     """
 
@@ -135,6 +139,8 @@ class FabSpindle(object):
     Reversible: bool
     FloodCooling: bool
     MistCooling: bool
+    Power: float = 0.0
+    Torque: float = 0.0
 
     # FabSpindle.__post_init__():
     def __post_init__(self) -> None:
@@ -144,6 +150,11 @@ class FabSpindle(object):
         check_type("FabSpindle.Reversible", self.Reversible, bool)
         check_type("FabSpindle.FloodCooling", self.FloodCooling, bool)
         check_type("FabSpindle.MistCooling", self.MistCooling, bool)
+        check_type("FabSpindle.Power", self.Power, float)
+        check_type("FabSpindle.Torque", self.Torque, float)
+        if self.Power < 0.0 or self.Torque < 0.0:
+            raise RuntimeError(
+                f"FabSpindle.__post_init__(): Negative {self.Power=} or {self.Torque=}")
 
     # FabSpindle.example()
     @staticmethod
@@ -164,6 +175,15 @@ class FabSpindle(object):
         assert spindle.Reversible, spindle.Reversible
         assert spindle.FloodCooling, spindle.FloodCooling
         assert not spindle.MistCooling, spindle.MistCooling
+        assert spindle.Power == 0.0 and spindle.Torque == 0.0, (spindle.Power, spindle.Torque)
+        powered_spindle: FabSpindle = FabSpindle("ER20", 24000, False, False, True, 1500.0, 0.6)
+        assert powered_spindle.Power == 1500.0, powered_spindle.Power
+        assert powered_spindle.Torque == 0.6, powered_spindle.Torque
+        try:
+            FabSpindle("ER20", 24000, False, False, True, -1.0)
+            assert False, "RuntimeError not raised"  # pragma: no unit cover
+        except RuntimeError as runtime_error:
+            assert str(runtime_error).startswith("FabSpindle.__post_init__(): Negative")
         if tracing:
             print(f"{tracing}<=FabSpindle._unit_tests()")
 
@@ -355,9 +375,10 @@ class FabCNC(FabMachine):
     * *Spindle* (FabSpindle): The spindle description.
     * *Controller* (FabController): The Controller used by the CNC machine.
     * *Library* (FabLibrary): The library containing all of the tools.
+    * *ToolChangeTime* (float): The seconds needed to change a tool.  (Default: 30.0)
 
     Constructor:
-    * FabCNC("Name", "Placement", Axes, Table, Spindle, Controller)
+    * FabCNC("Name", "Placement", Axes, Table, Spindle, Controller, Library, ToolChangeTime)
 
     """
 
@@ -366,6 +387,7 @@ class FabCNC(FabMachine):
     Spindle: FabSpindle
     Controller: FabController
     Library: FabLibrary
+    ToolChangeTime: float = 30.0
 
     # FabCNC.__post_init__():
     def __post_init__(self) -> None:
@@ -376,6 +398,7 @@ class FabCNC(FabMachine):
         check_type("FabCNC.Spindle", self.Spindle, FabSpindle)
         check_type("FabCNC.Controller", self.Controller, FabController)
         check_type("FabCNC.Library", self.Library, FabLibrary)
+        check_type("FabCNC.ToolChangeTime", self.ToolChangeTime, float)
 
     # FabCNC.getMaximumSpindleSpeed():
     def getMaximumSpindleSpeed(self) -> int:
@@ -874,6 +897,136 @@ class Fab_ShopBit(object):
             print(f"{tracing}<=Fab_ShopBit._unit_tests()")
 
 
+# Fab_ShopBitIndex:
+@dataclass(frozen=True)
+class Fab_ShopBitIndex(object):
+    """Fab_ShopBitIndex: A diameter sorted index of Fab_ShopBit's for one operation kind.
+
+    The FabBit Diameter and Length attributes are strings (e.g. "5mm") that must be parsed
+    each time FabBit.getNumber() is called.  Fab_ShopBitIndex parses them once and keeps the
+    Fab_ShopBit's sorted by diameter so that matching bits can be found with a bisect rather
+    than a linear scan.  All lookups return Fab_ShopBit's in the original priority order.
+
+    Attributes:
+    * *ShopBits* (Tuple[Fab_ShopBit, ...]): The Fab_ShopBit's in priority order.
+
+    Constructor:
+    * Fab_ShopBitIndex(ShopBits)
+
+    """
+
+    ShopBits: Tuple[Fab_ShopBit, ...]
+    _Diameters: Tuple[float, ...] = field(init=False, repr=False, compare=False)
+    _Lengths: Tuple[float, ...] = field(init=False, repr=False, compare=False)
+    _Indices: Tuple[int, ...] = field(init=False, repr=False, compare=False)
+
+    # Fab_ShopBitIndex.__post_init__():
+    def __post_init__(self) -> None:
+        """Finish initializing Fab_ShopBitIndex."""
+        check_type("Fab_ShopBitIndex.ShopBits", self.ShopBits, Tuple[Fab_ShopBit, ...])
+        entries: List[Tuple[float, int, float]] = []
+        index: int
+        shop_bit: Fab_ShopBit
+        for index, shop_bit in enumerate(self.ShopBits):
+            bit: FabBit = shop_bit.Bit
+            diameter: float = float(bit.getNumber("Diameter"))
+            length: float = float(bit.getNumber("Length"))
+            entries.append((diameter, index, length))
+        entries.sort()
+        object.__setattr__(self, "_Diameters", tuple([entry[0] for entry in entries]))
+        object.__setattr__(self, "_Indices", tuple([entry[1] for entry in entries]))
+        object.__setattr__(self, "_Lengths", tuple([entry[2] for entry in entries]))
+
+    # Fab_ShopBitIndex._select():
+    def _select(self, low: int, high: int, depth: float) -> Tuple[Fab_ShopBit, ...]:
+        """Return the Fab_ShopBit's in [low, high) that reach *depth* in priority order."""
+        lengths: Tuple[float, ...] = self._Lengths
+        indices: Tuple[int, ...] = self._Indices
+        selected: List[int] = [
+            indices[position] for position in range(low, high) if depth <= lengths[position]]
+        selected.sort()
+        shop_bits: Tuple[Fab_ShopBit, ...] = self.ShopBits
+        return tuple([shop_bits[index] for index in selected])
+
+    # Fab_ShopBitIndex.lookupExact():
+    def lookupExact(self, diameter: float, depth: float,
+                    tolerance: float = 0.0001) -> Tuple[Fab_ShopBit, ...]:
+        """Return the Fab_ShopBit's that match a diameter and are long enough.
+
+        Arguments:
+        * *diameter* (float): The desired bit diameter in millimeters.
+        * *depth* (float): The minimum bit length in millimeters.
+        * *tolerance* (float):
+          The maximum allowed diameter difference in millimeters.  (Default: 0.0001)
+
+        Returns:
+        * (Tuple[Fab_ShopBit, ...]): The matching Fab_ShopBit's in priority order.
+
+        """
+        diameters: Tuple[float, ...] = self._Diameters
+        low: int = bisect_right(diameters, diameter - tolerance)
+        high: int = bisect_left(diameters, diameter + tolerance)
+        return self._select(low, high, depth)
+
+    # Fab_ShopBitIndex.lookupMaximum():
+    def lookupMaximum(self, maximum_diameter: float, depth: float) -> Tuple[Fab_ShopBit, ...]:
+        """Return the Fab_ShopBit's that do not exceed a diameter and are long enough.
+
+        Arguments:
+        * *maximum_diameter* (float): The maximum bit diameter in millimeters.
+        * *depth* (float): The minimum bit length in millimeters.
+
+        Returns:
+        * (Tuple[Fab_ShopBit, ...]): The matching Fab_ShopBit's in priority order.
+
+        """
+        high: int = bisect_right(self._Diameters, maximum_diameter)
+        return self._select(0, high, depth)
+
+    # Fab_ShopBitIndex._unit_tests():
+    @staticmethod
+    def _unit_tests(tracing: str = "") -> None:
+        """Run Fab_ShopBitIndex unit tests."""
+        if tracing:
+            print(f"{tracing}=>Fab_ShopBitIndex._unit_tests()")
+
+        shops: FabShops = FabShops.getExample()
+        empty_index: Fab_ShopBitIndex = Fab_ShopBitIndex(())
+        assert empty_index.lookupExact(3.0, 1.0) == ()
+        assert empty_index.lookupMaximum(3.0, 1.0) == ()
+
+        shop_bits: Tuple[Fab_ShopBit, ...]
+        shop_bit_index: Fab_ShopBitIndex
+        for shop_bits, shop_bit_index in (
+                (shops.ContourShopBits, shops.ContourShopBitIndex),
+                (shops.DrillShopBits, shops.DrillShopBitIndex),
+                (shops.PocketShopBits, shops.PocketShopBitIndex)):
+            assert shop_bit_index.ShopBits == shop_bits
+            diameters: List[float] = sorted(set(
+                [float(shop_bit.Bit.getNumber("Diameter")) for shop_bit in shop_bits]))
+            depths: List[float] = [0.0, 5.0, 10.0, 25.0, 50.0, 1000.0]
+            diameter: float
+            depth: float
+            for diameter in diameters + [0.5, 987654321.0]:
+                for depth in depths:
+                    # Compare against a linear scan:
+                    exact: Tuple[Fab_ShopBit, ...] = tuple([
+                        shop_bit for shop_bit in shop_bits
+                        if depth <= shop_bit.Bit.getNumber("Length") and
+                        abs(diameter - shop_bit.Bit.getNumber("Diameter")) < 0.0001])
+                    maximum: Tuple[Fab_ShopBit, ...] = tuple([
+                        shop_bit for shop_bit in shop_bits
+                        if depth <= shop_bit.Bit.getNumber("Length") and
+                        shop_bit.Bit.getNumber("Diameter") <= diameter])
+                    assert shop_bit_index.lookupExact(diameter, depth) == exact, (
+                        diameter, depth)
+                    assert shop_bit_index.lookupMaximum(diameter, depth) == maximum, (
+                        diameter, depth)
+
+        if tracing:
+            print(f"{tracing}<=Fab_ShopBitIndex._unit_tests()")
+
+
 # FabShops:
 @dataclass
 class FabShops(object):
@@ -893,6 +1046,9 @@ class FabShops(object):
     * *DrillShipBits (Tuple[Fab_ShopBit, ...]):
       A tuple of Fab_ShopBit's suitable for exterior drilling.
     * *PocketShopBits: (Tuple[Fab_ShopBit, ...]): A tuple of Fab_ShopBit's suitable for pocketing.
+    * *ContourShopBitIndex* (Fab_ShopBitIndex): A diameter index of ContourShopBits.
+    * *DrillShopBitIndex* (Fab_ShopBitIndex): A diameter index of DrillShopBits.
+    * *PocketShopBitIndex* (Fab_ShopBitIndex): A diameter index of PocketShopBits.
 
     Constructor:
     * FabShops(Shops)
@@ -902,11 +1058,15 @@ class FabShops(object):
     tracing: str = ""  # TODO(remove)
     ShopMachines: Tuple[Tuple[FabShop, FabMachine], ...] = field(init=False, repr=False)
     AllShopBits: Tuple[Fab_ShopBit, ...] = field(init=False, repr=False)
+    ContourShopBits: Tuple[Fab_ShopBit, ...] = field(init=False, repr=False)
     CounterSinkShopBits: Tuple[Fab_ShopBit, ...] = field(init=False, repr=False)
     DrillShopBits: Tuple[Fab_ShopBit, ...] = field(init=False, repr=False)
     LowerChamferShopBits: Tuple[Fab_ShopBit, ...] = field(init=False, repr=False)
     PocketShopBits: Tuple[Fab_ShopBit, ...] = field(init=False, repr=False)
     UpperChamferShopBits: Tuple[Fab_ShopBit, ...] = field(init=False, repr=False)
+    ContourShopBitIndex: Fab_ShopBitIndex = field(init=False, repr=False)
+    DrillShopBitIndex: Fab_ShopBitIndex = field(init=False, repr=False)
+    PocketShopBitIndex: Fab_ShopBitIndex = field(init=False, repr=False)
 
     # FabShops.__post_init__():
     def __post_init__(self) -> None:
@@ -968,6 +1128,11 @@ class FabShops(object):
         self.LowerChamferShopBits = tuple(sorted(lower_chamfer_shop_bits))
         self.PocketShopBits = tuple(sorted(pocket_shop_bits))
         self.UpperChamferShopBits = tuple(sorted(upper_chamfer_shop_bits))
+
+        # Index the bits searched by diameter and length:
+        self.ContourShopBitIndex = Fab_ShopBitIndex(self.ContourShopBits)
+        self.DrillShopBitIndex = Fab_ShopBitIndex(self.DrillShopBits)
+        self.PocketShopBitIndex = Fab_ShopBitIndex(self.PocketShopBits)
         if tracing:
             print(f"{tracing}<=FabShops.__post_init__()")
 
@@ -1024,6 +1189,7 @@ def main(tracing: str = "") -> None:
     FabShops._unit_tests(tracing=next_tracing)
     FabTable._unit_tests(tracing=next_tracing)
     Fab_ShopBit._unit_tests(tracing=next_tracing)
+    Fab_ShopBitIndex._unit_tests(tracing=next_tracing)
     if tracing:
         print("=>FabShops.main()")
 
@@ -4,6 +4,11 @@
 This module defines the following user facing classes:
 * FabSolid: A 3D solid part that corresponds to a STEP file.
 * FabMount: A CNC-like work plane on which other operations are performed.
+* FabNester: Nests FabSolid CNC footprints onto FabStock sheets as FabSheet's.
+* FabFleetScheduler: Plans FabMount's of many FabSolid's onto FabShops machine queues.
+* Fab_OperationScheduler: The original greedy Fab_ShopBit selection for mount operations.
+* Fab_ToolChangeScheduler: A Fab_OperationScheduler that minimizes tool changes.
+* Fab_PointOrder: A rapid travel minimizing drill point order.
 
 There are internal classes that represent operations such as extrude, pocket, drill, etc.
 This internal classes are managed by FabMount methods.
@@ -17,15 +22,18 @@ from enum import IntEnum, auto
 from dataclasses import dataclass, field
 from pathlib import Path as PathFile
 from typeguard import check_argument_types, check_type
-from typing import Any, cast, Dict, Generator, IO, List, Optional, Sequence, Tuple, Union
+from typing import (
+    Any, cast, ClassVar, Dict, Generator, IO, List, Optional, Sequence, Set, Tuple, Union
+)
 
 import cadquery as cq  # type: ignore
 from cadquery import Vector  # type: ignore
+import numpy as np  # type: ignore
 
 # import Part  # type: ignore
 
 from FabGeometries import (
-    FabCircle, FabGeometry, Fab_GeometryContext, FabGeometryInfo, FabPlane, Fab_Query
+    FabCircle, FabGeometry, Fab_GeometryContext, FabGeometryInfo, FabPlane, FabPolygon, Fab_Query
 )
 from FabJoins import FabFasten, FabJoin
 from FabNodes import FabBox, FabNode, Fab_Prefix, Fab_ProduceState
@@ -34,7 +42,7 @@ from FabNodes import FabBox, FabNode, Fab_Prefix, Fab_ProduceState
 from FabToolBits import FabDrillBit, FabEndMillBit, FabVBit
 from FabToolTemplates import FabBit
 from FabUtilities import FabColor, FabMaterial, FabToolController
-from FabShops import Fab_ShopBit, FabShops
+from FabShops import Fab_ShopBit, FabCNC, FabMachine, FabShop, FabShops
 
 # The *_suppress_stdout* function is based on code from:
 #   [I/O Redirect](https://stackoverflow.com/questions/4675728/redirect-stdout-to-a-file-in-python)
@@ -174,6 +182,531 @@ class FabStock(object):
             print(f"{tracing}<=FabStock._unit_tests()")
 
 
+# FabNestPart:
+@dataclass(frozen=True)
+class FabNestPart(object):
+    """FabNestPart: A rectangular footprint to be nested onto a sheet.
+
+    Attributes:
+    * *Name* (str): The part name.
+    * *DX* (float): The footprint size in X (millimeters).
+    * *DY* (float): The footprint size in Y (millimeters).
+    * *Area* (float):
+      The actual part area used for utilization.  (Default: 0.0, which selects DX * DY.)
+    * *Angle* (float):
+      The angle in degrees that the part outline must be rotated by to fit in the footprint.
+      (Default: 0.0)
+
+    Constructor:
+    * FabNestPart(Name, DX, DY, Area, Angle)
+    * FabNestPart.fromOutline(Name, Outline)
+
+    """
+
+    Name: str
+    DX: float
+    DY: float
+    Area: float = 0.0
+    Angle: float = 0.0
+
+    # FabNestPart.__post_init__():
+    def __post_init__(self) -> None:
+        """Finish initializing FabNestPart."""
+        check_type("FabNestPart.Name", self.Name, str)
+        check_type("FabNestPart.DX", self.DX, float)
+        check_type("FabNestPart.DY", self.DY, float)
+        check_type("FabNestPart.Area", self.Area, float)
+        check_type("FabNestPart.Angle", self.Angle, float)
+        if self.DX <= 0.0 or self.DY <= 0.0:
+            raise RuntimeError(
+                f"FabNestPart.__post_init__(): {self.Name} has a non-positive size "
+                f"({self.DX}, {self.DY})")
+        if self.Area <= 0.0:
+            object.__setattr__(self, "Area", self.DX * self.DY)
+
+    # FabNestPart.fromOutline():
+    @staticmethod
+    def fromOutline(name: str, outline: Sequence[Tuple[float, float]]) -> "FabNestPart":
+        """Return the FabNestPart with the minimum area rectangle around an outline.
+
+        The convex hull of *outline* is computed and every hull edge is tried as a rectangle
+        side (i.e. rotating calipers.)  The part area is the outline (shoelace) area.
+        """
+        points: Any = np.array(outline, dtype=float).reshape(-1, 2)
+        if len(points) < 3:
+            raise RuntimeError(
+                f"FabNestPart.fromOutline(): {name} outline has fewer than 3 points")
+
+        # Compute the convex hull using Andrew's monotone chain:
+        def cross(o: Tuple[float, float], a: Tuple[float, float],
+                  b: Tuple[float, float]) -> float:
+            return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+
+        sorted_points: List[Tuple[float, float]] = sorted(
+            set((float(x), float(y)) for x, y in points))
+        lower: List[Tuple[float, float]] = []
+        upper: List[Tuple[float, float]] = []
+        point: Tuple[float, float]
+        for point in sorted_points:
+            while len(lower) >= 2 and cross(lower[-2], lower[-1], point) <= 0.0:
+                lower.pop()
+            lower.append(point)
+        for point in reversed(sorted_points):
+            while len(upper) >= 2 and cross(upper[-2], upper[-1], point) <= 0.0:
+                upper.pop()
+            upper.append(point)
+        hull: Any = np.array(lower[:-1] + upper[:-1])
+
+        # Try each hull edge direction and keep the smallest rectangle:
+        edges: Any = np.roll(hull, -1, axis=0) - hull
+        angles: Any = np.arctan2(edges[:, 1], edges[:, 0]) % (math.pi / 2.0)
+        best: Tuple[float, float, float, float] = (math.inf, 0.0, 0.0, 0.0)
+        angle: float
+        for angle in np.unique(np.round(angles, 12)):
+            cosine: float = math.cos(-angle)
+            sine: float = math.sin(-angle)
+            rotated_x: Any = hull[:, 0] * cosine - hull[:, 1] * sine
+            rotated_y: Any = hull[:, 0] * sine + hull[:, 1] * cosine
+            dx: float = float(rotated_x.max() - rotated_x.min())
+            dy: float = float(rotated_y.max() - rotated_y.min())
+            if dx * dy < best[0] - 1.0e-9:
+                best = (dx * dy, dx, dy, -math.degrees(angle))
+
+        # Compute the outline area using the shoelace formula:
+        xs: Any = points[:, 0]
+        ys: Any = points[:, 1]
+        area: float = 0.5 * abs(float(np.dot(xs, np.roll(ys, -1)) - np.dot(ys, np.roll(xs, -1))))
+        return FabNestPart(name, best[1], best[2], area, best[3])
+
+
+# FabNestPlacement:
+@dataclass(frozen=True)
+class FabNestPlacement(object):
+    """FabNestPlacement: Where a FabNestPart is placed on a FabSheet.
+
+    Attributes:
+    * *Part* (FabNestPart): The placed part.
+    * *X* (float): The X coordinate of the lower left footprint corner on the sheet.
+    * *Y* (float): The Y coordinate of the lower left footprint corner on the sheet.
+    * *Rotated* (bool): True if the footprint was rotated by 90 degrees to fit.
+
+    Computed Attributes:
+    * *DX* (float): The placed footprint size in X.
+    * *DY* (float): The placed footprint size in Y.
+
+    Constructor:
+    * FabNestPlacement(Part, X, Y, Rotated)
+
+    """
+
+    Part: FabNestPart
+    X: float
+    Y: float
+    Rotated: bool
+
+    # FabNestPlacement.DX():
+    @property
+    def DX(self) -> float:
+        """Return the placed footprint size in X."""
+        return self.Part.DY if self.Rotated else self.Part.DX
+
+    # FabNestPlacement.DY():
+    @property
+    def DY(self) -> float:
+        """Return the placed footprint size in Y."""
+        return self.Part.DX if self.Rotated else self.Part.DY
+
+    # FabNestPlacement.to_json():
+    def to_json(self) -> Dict[str, Any]:
+        """Return a JSON representation of a FabNestPlacement."""
+        part: FabNestPart = self.Part
+        angle: float = part.Angle + (90.0 if self.Rotated else 0.0)
+        return {
+            "Name": part.Name,
+            "X": round(self.X, 3),
+            "Y": round(self.Y, 3),
+            "DX": round(self.DX, 3),
+            "DY": round(self.DY, 3),
+            "Angle": round(angle, 3),
+        }
+
+
+# FabSheet:
+@dataclass
+class FabSheet(object):
+    """FabSheet: A single stock sheet with nested parts on it.
+
+    Attributes:
+    * *Index* (int): The sheet index starting from 0.
+    * *DX* (float): The sheet size in X.
+    * *DY* (float): The sheet size in Y.
+    * *Placements* (List[FabNestPlacement]): The parts placed on the sheet.
+    * *Utilization* (float): The fraction of the sheet area covered by parts.
+
+    Constructor:
+    * FabSheet(Index, DX, DY)
+
+    """
+
+    Index: int
+    DX: float
+    DY: float
+    Placements: List[FabNestPlacement] = field(init=False)
+    _FreeRectangles: List[Tuple[float, float, float, float]] = field(init=False, repr=False)
+
+    # FabSheet.__post_init__():
+    def __post_init__(self) -> None:
+        """Finish initializing FabSheet."""
+        check_type("FabSheet.Index", self.Index, int)
+        check_type("FabSheet.DX", self.DX, float)
+        check_type("FabSheet.DY", self.DY, float)
+        self.Placements = []
+        self._FreeRectangles = []
+
+    # FabSheet.Utilization():
+    @property
+    def Utilization(self) -> float:
+        """Return the fraction of the sheet area that is covered by parts."""
+        placement: FabNestPlacement
+        used: float = sum([placement.Part.Area for placement in self.Placements])
+        return used / (self.DX * self.DY)
+
+    # FabSheet.to_json():
+    def to_json(self) -> Dict[str, Any]:
+        """Return a JSON representation of a FabSheet."""
+        placement: FabNestPlacement
+        return {
+            "Index": self.Index,
+            "DX": round(self.DX, 3),
+            "DY": round(self.DY, 3),
+            "Utilization": round(self.Utilization, 4),
+            "Placements": [placement.to_json() for placement in self.Placements],
+        }
+
+
+# FabNester:
+@dataclass
+class FabNester(object):
+    """FabNester: Nests many part footprints onto standard stock sheets.
+
+    The footprints are packed using the MaxRects algorithm with the best short side fit
+    heuristic.  The parts are placed largest first and a new sheet is opened whenever a part
+    does not fit onto any of the currently open sheets.  Each footprint is padded on every side
+    by the FabStock *StockMinimumCut* plus half of *Spacing*, so that the contour operations have
+    room to cut between adjacent parts.  When *Polygonal* is True, each FabSolid uses its
+    extrude outline rotated to its minimum area rectangle instead of its *CNCBox*.
+
+    Attributes:
+    * *Stock* (FabStock): The stock that the sheets are cut from.
+    * *SheetDX* (float): The sheet size in X.
+    * *SheetDY* (float): The sheet size in Y.
+    * *Spacing* (float): Extra spacing between adjacent parts.  (Default: 0.0)
+    * *AllowRotation* (bool): True to allow parts to be rotated by 90 degrees.  (Default: True)
+    * *Polygonal* (bool): True to use extrude outlines when available.  (Default: False)
+
+    Constructor:
+    * FabNester(Stock, SheetDX, SheetDY, Spacing, AllowRotation, Polygonal)
+
+    """
+
+    Stock: FabStock
+    SheetDX: float
+    SheetDY: float
+    Spacing: float = 0.0
+    AllowRotation: bool = True
+    Polygonal: bool = False
+
+    # FabNester.__post_init__():
+    def __post_init__(self) -> None:
+        """Finish initializing FabNester."""
+        check_type("FabNester.Stock", self.Stock, FabStock)
+        check_type("FabNester.SheetDX", self.SheetDX, float)
+        check_type("FabNester.SheetDY", self.SheetDY, float)
+        check_type("FabNester.Spacing", self.Spacing, float)
+        check_type("FabNester.AllowRotation", self.AllowRotation, bool)
+        check_type("FabNester.Polygonal", self.Polygonal, bool)
+
+    # FabNester._newSheet():
+    def _newSheet(self, index: int) -> FabSheet:
+        """Return a new empty FabSheet."""
+        sheet: FabSheet = FabSheet(index, self.SheetDX, self.SheetDY)
+        sheet._FreeRectangles.append((0.0, 0.0, self.SheetDX, self.SheetDY))
+        return sheet
+
+    # FabNester._findPosition():
+    def _findPosition(self, sheet: FabSheet, dx: float,
+                      dy: float) -> Optional[Tuple[float, float, float, bool]]:
+        """Return the best short side fit (score, x, y, rotated) for a padded footprint."""
+        best: Optional[Tuple[float, float, float, bool]] = None
+        best_score: Tuple[float, float] = (math.inf, math.inf)
+        orientations: List[Tuple[float, float, bool]] = [(dx, dy, False)]
+        if self.AllowRotation and abs(dx - dy) > 1.0e-9:
+            orientations.append((dy, dx, True))
+        free_x: float
+        free_y: float
+        free_dx: float
+        free_dy: float
+        for free_x, free_y, free_dx, free_dy in sheet._FreeRectangles:
+            width: float
+            height: float
+            rotated: bool
+            for width, height, rotated in orientations:
+                if width <= free_dx + 1.0e-9 and height <= free_dy + 1.0e-9:
+                    leftover_x: float = free_dx - width
+                    leftover_y: float = free_dy - height
+                    score: Tuple[float, float] = (
+                        min(leftover_x, leftover_y), max(leftover_x, leftover_y))
+                    if score < best_score:
+                        best_score = score
+                        best = (score[0], free_x, free_y, rotated)
+        return best
+
+    # FabNester._place():
+    @staticmethod
+    def _place(sheet: FabSheet, x: float, y: float, dx: float, dy: float) -> None:
+        """Remove a used rectangle from the FabSheet free rectangles."""
+        epsilon: float = 1.0e-9
+        split: List[Tuple[float, float, float, float]] = []
+        free: Tuple[float, float, float, float]
+        for free in sheet._FreeRectangles:
+            free_x, free_y, free_dx, free_dy = free
+            if (x >= free_x + free_dx - epsilon or x + dx <= free_x + epsilon or
+                    y >= free_y + free_dy - epsilon or y + dy <= free_y + epsilon):
+                split.append(free)  # No overlap.
+                continue
+            if x > free_x + epsilon:  # Left piece:
+                split.append((free_x, free_y, x - free_x, free_dy))
+            if x + dx < free_x + free_dx - epsilon:  # Right piece:
+                split.append((x + dx, free_y, free_x + free_dx - x - dx, free_dy))
+            if y > free_y + epsilon:  # Bottom piece:
+                split.append((free_x, free_y, free_dx, y - free_y))
+            if y + dy < free_y + free_dy - epsilon:  # Top piece:
+                split.append((free_x, y + dy, free_dx, free_y + free_dy - y - dy))
+
+        # Prune free rectangles that are contained by another free rectangle:
+        pruned: List[Tuple[float, float, float, float]] = []
+        index: int
+        for index, free in enumerate(split):
+            contained: bool = False
+            other_index: int
+            other: Tuple[float, float, float, float]
+            for other_index, other in enumerate(split):
+                if index != other_index and (
+                        other[0] <= free[0] + epsilon and other[1] <= free[1] + epsilon and
+                        free[0] + free[2] <= other[0] + other[2] + epsilon and
+                        free[1] + free[3] <= other[1] + other[3] + epsilon and
+                        (free != other or other_index < index)):
+                    contained = True
+                    break
+            if not contained:
+                pruned.append(free)
+        sheet._FreeRectangles = pruned
+
+    # FabNester.nest():
+    def nest(self, parts: Sequence[FabNestPart], tracing: str = "") -> Tuple[FabSheet, ...]:
+        """Nest some FabNestPart's onto as few FabSheet's as possible."""
+        if tracing:
+            print(f"{tracing}=>FabNester.nest(*{len(parts)})")
+        padding: float = self.Stock.StockMinimumCut + self.Spacing / 2.0
+        part: FabNestPart
+        ordered_parts: List[FabNestPart] = sorted(
+            parts, key=lambda part: (-max(part.DX, part.DY), -part.DX * part.DY, part.Name))
+        sheets: List[FabSheet] = []
+        for part in ordered_parts:
+            padded_dx: float = part.DX + 2.0 * padding
+            padded_dy: float = part.DY + 2.0 * padding
+            position: Optional[Tuple[float, float, float, bool]] = None
+            sheet: FabSheet
+            for sheet in sheets:
+                position = self._findPosition(sheet, padded_dx, padded_dy)
+                if position is not None:
+                    break
+            if position is None:
+                sheet = self._newSheet(len(sheets))
+                position = self._findPosition(sheet, padded_dx, padded_dy)
+                if position is None:
+                    raise RuntimeError(
+                        f"FabNester.nest(): {part.Name} ({part.DX:.1f} x {part.DY:.1f}) "
+                        f"does not fit on a {self.SheetDX:.1f} x {self.SheetDY:.1f} sheet")
+                sheets.append(sheet)
+            _, x, y, rotated = position
+            if rotated:
+                padded_dx, padded_dy = padded_dy, padded_dx
+            FabNester._place(sheet, x, y, padded_dx, padded_dy)
+            sheet.Placements.append(FabNestPlacement(part, x + padding, y + padding, rotated))
+            if tracing:
+                print(f"{tracing}{part.Name}: sheet {sheet.Index} at ({x:.1f}, {y:.1f})")
+        if tracing:
+            print(f"{tracing}<=FabNester.nest(*{len(parts)})=>{len(sheets)} sheets")
+        return tuple(sheets)
+
+    # FabNester.nestSolids():
+    def nestSolids(self, solids: Sequence["FabSolid"], tracing: str = ""
+                   ) -> Dict[Tuple[Tuple[str, ...], float], Tuple[FabSheet, ...]]:
+        """Nest the CNC footprints of some FabSolid's grouped by material and thickness.
+
+        FabSolid's without a *CNCBox* (i.e. not made from an extrude) are skipped.  The
+        thickness is the smallest FabStock thickness that is at least the extrude depth.
+        A RuntimeError is raised when no FabStock thickness is thick enough.
+        """
+        if tracing:
+            print(f"{tracing}=>FabNester.nestSolids(*{len(solids)})")
+        groups: Dict[Tuple[Tuple[str, ...], float], List[FabNestPart]] = {}
+        solid: "FabSolid"
+        for solid in solids:
+            cnc_box: Optional[FabBox] = solid.CNCBox
+            if cnc_box is None:
+                continue  # pragma: no unit cover
+            depth: float = solid.CNCDepth
+            thickness: float = -1.0
+            stock_thickness: float
+            for stock_thickness in self.Stock.StockThicknesses:
+                if stock_thickness >= depth:
+                    thickness = stock_thickness
+                    break
+            if thickness < 0.0:
+                raise RuntimeError(
+                    f"FabNester.nestSolids(): {solid.Label} is {depth:.2f}mm thick, but "
+                    f"FabStock {self.Stock.Name} thicknesses are {self.Stock.StockThicknesses}")
+            part: FabNestPart
+            if self.Polygonal and len(solid.CNCOutline) >= 3:
+                part = FabNestPart.fromOutline(solid.Label, solid.CNCOutline)
+            else:
+                part = FabNestPart(solid.Label, float(cnc_box.DX), float(cnc_box.DY))
+            key: Tuple[Tuple[str, ...], float] = (solid.Material.Name, thickness)
+            if key not in groups:
+                groups[key] = []
+            groups[key].append(part)
+
+        nests: Dict[Tuple[Tuple[str, ...], float], Tuple[FabSheet, ...]] = {}
+        parts: List[FabNestPart]
+        for key, parts in sorted(groups.items()):
+            nests[key] = self.nest(parts)
+        if tracing:
+            print(f"{tracing}<=FabNester.nestSolids(*{len(solids)})=>{len(nests)} groups")
+        return nests
+
+    # FabNester._unit_tests():
+    @staticmethod
+    def _unit_tests(tracing: str = "") -> None:
+        """Run FabNester unit tests."""
+        next_tracing: str = tracing + " " if tracing else ""
+        if tracing:
+            print(f"{tracing}=>FabNester._unit_tests()")
+
+        def check(sheets: Tuple[FabSheet, ...]) -> None:
+            """Verify that no placements overlap or leave their sheet."""
+            sheet: FabSheet
+            for sheet in sheets:
+                placements: List[FabNestPlacement] = sheet.Placements
+                index: int
+                placement: FabNestPlacement
+                for index, placement in enumerate(placements):
+                    assert placement.X >= 0.0 and placement.Y >= 0.0, placement
+                    assert placement.X + placement.DX <= sheet.DX + 1.0e-9, placement
+                    assert placement.Y + placement.DY <= sheet.DY + 1.0e-9, placement
+                    other: FabNestPlacement
+                    for other in placements[index + 1:]:
+                        assert (placement.X + placement.DX <= other.X + 1.0e-9 or
+                                other.X + other.DX <= placement.X + 1.0e-9 or
+                                placement.Y + placement.DY <= other.Y + 1.0e-9 or
+                                other.Y + other.DY <= placement.Y + 1.0e-9), (placement, other)
+
+        no_cut: FabStock = FabStock("NoCut", Vector(1.0, 1.0, 1.0), (3.0, 6.0), 0.0)
+
+        # Four 100x50 parts exactly fill a 200x100 sheet:
+        nester: FabNester = FabNester(no_cut, 200.0, 100.0)
+        index: int
+        parts: List[FabNestPart] = [FabNestPart(f"P{index}", 100.0, 50.0) for index in range(4)]
+        sheets: Tuple[FabSheet, ...] = nester.nest(parts, tracing=next_tracing)
+        assert len(sheets) == 1, sheets
+        assert abs(sheets[0].Utilization - 1.0) < 1.0e-9, sheets[0].Utilization
+        check(sheets)
+
+        # A fifth part opens a second sheet:
+        parts.append(FabNestPart("P4", 100.0, 50.0))
+        sheets = nester.nest(parts)
+        assert len(sheets) == 2, sheets
+        assert len(sheets[0].Placements) == 4 and len(sheets[1].Placements) == 1, sheets
+        assert abs(sheets[1].Utilization - 0.25) < 1.0e-9, sheets[1].Utilization
+        check(sheets)
+
+        # A 50x100 part only fits on a 110x60 sheet when rotated:
+        narrow: FabNester = FabNester(no_cut, 110.0, 60.0)
+        sheets = narrow.nest([FabNestPart("Tall", 50.0, 100.0)])
+        assert sheets[0].Placements[0].Rotated, sheets[0].Placements
+        assert sheets[0].to_json()["Placements"][0]["Angle"] == 90.0
+        fixed: FabNester = FabNester(no_cut, 110.0, 60.0, AllowRotation=False)
+        try:
+            fixed.nest([FabNestPart("Tall", 50.0, 100.0)])
+            assert False, "Tall part should not fit"  # pragma: no unit cover
+        except RuntimeError as runtime_error:
+            assert "does not fit" in str(runtime_error), str(runtime_error)
+
+        # Mixed sizes with a minimum cut margin:
+        margin: FabStock = FabStock("Margin", Vector(1.0, 1.0, 1.0), (3.0,), 2.0)
+        mixed: FabNester = FabNester(margin, 300.0, 200.0, Spacing=2.0)
+        sizes: Tuple[Tuple[float, float], ...] = (
+            (120.0, 80.0), (60.0, 60.0), (90.0, 30.0), (40.0, 150.0), (70.0, 45.0),
+            (25.0, 25.0), (110.0, 35.0), (55.0, 85.0))
+        dx: float
+        dy: float
+        parts = [FabNestPart(f"M{index}", dx, dy) for index, (dx, dy) in enumerate(sizes)]
+        sheets = mixed.nest(parts)
+        check(sheets)
+        placement: FabNestPlacement
+        placed: List[str] = sorted(
+            [placement.Part.Name for sheet in sheets for placement in sheet.Placements])
+        assert placed == sorted([part.Name for part in parts]), placed
+        assert len(sheets) == 1, [len(sheet.Placements) for sheet in sheets]
+
+        # A square rotated by 30 degrees has a minimum rectangle the size of the square:
+        radians: float = math.radians(30.0)
+        cosine: float = math.cos(radians)
+        sine: float = math.sin(radians)
+        square: List[Tuple[float, float]] = [
+            (x * cosine - y * sine, x * sine + y * cosine)
+            for x, y in ((0.0, 0.0), (40.0, 0.0), (40.0, 20.0), (0.0, 20.0))]
+        part: FabNestPart = FabNestPart.fromOutline("Square", square)
+        assert abs(part.DX * part.DY - 800.0) < 1.0e-6, (part.DX, part.DY)
+        assert abs(part.Area - 800.0) < 1.0e-6, part.Area
+        assert abs(abs(part.Angle) % 90.0 - 30.0) < 1.0e-6 or (
+            abs(abs(part.Angle) % 90.0 - 60.0) < 1.0e-6), part.Angle
+        triangle: FabNestPart = FabNestPart.fromOutline(
+            "Triangle", ((0.0, 0.0), (30.0, 0.0), (0.0, 40.0)))
+        assert abs(triangle.Area - 600.0) < 1.0e-6, triangle.Area
+        assert triangle.DX * triangle.DY <= 1200.0 + 1.0e-6, triangle
+
+        # FabNester.nestSolids() only reads these FabSolid attributes, so a FabSolid can be
+        # stood in for without building a FabProject:
+        @dataclass
+        class NestSolid(object):
+            Label: str
+            Material: FabMaterial
+            CNCBox: Optional[FabBox]
+            CNCDepth: float
+            CNCOutline: Tuple[Tuple[float, float], ...] = ()
+
+        # Nest a 10mm thick FabSolid; it fails when no FabStock thickness is thick enough:
+        nest_box: FabBox = FabBox()
+        nest_box.enclose((Vector(0.0, 0.0, 0.0), Vector(20.0, 10.0, 10.0)))
+        nest_solids: Sequence[FabSolid] = cast(Sequence[FabSolid], (
+            NestSolid("NestSolid", FabMaterial(("Plastic", "HDPE"), "red"), nest_box, 10.0),))
+        try:
+            FabNester(no_cut, 100.0, 100.0).nestSolids(nest_solids)
+            assert False, "FabNester.nestSolids() did not fail"  # pragma: no unit cover
+        except RuntimeError as runtime_error:
+            assert "NestSolid is 10.00mm thick" in str(runtime_error), str(runtime_error)
+        thick: FabStock = FabStock("Thick", Vector(1.0, 1.0, 1.0), (6.0, 12.0), 0.0)
+        nests: Dict[Tuple[Tuple[str, ...], float], Tuple[FabSheet, ...]] = (
+            FabNester(thick, 100.0, 100.0).nestSolids(nest_solids))
+        assert tuple(nests.keys()) == ((("Plastic", "HDPE"), 12.0),), nests
+        assert len(nests[(("Plastic", "HDPE"), 12.0)][0].Placements) == 1, nests
+
+        if tracing:
+            print(f"{tracing}<=FabNester._unit_tests()")
+
+
 # Fab_OperationOrder:
 class Fab_OperationOrder(IntEnum):
     """ OperationOrder: A enumeration that specifies the desired order of operations."""
@@ -312,6 +845,91 @@ class Fab_OperationKey:
             print(f"{tracing}<=Fab_OperationKey._unitTests()")
 
 
+# Fab_CycleTime:
+@dataclass(frozen=True)
+class Fab_CycleTime(object):
+    """Fab_CycleTime: An estimated machining cycle time broken down by activity.
+
+    All feeds (i.e. FabToolController feeds and rapids) are in millimeters per second, which
+    is what FabToolController documents and FabCNC.getHorizontalRapidFeed() returns.
+
+    Attributes:
+    * *Cutting* (float): Seconds spent feeding horizontally through material.
+    * *Plunging* (float): Seconds spent feeding vertically into material.
+    * *Rapid* (float): Seconds spent in rapid moves.
+    * *ToolChange* (float): Seconds spent changing tools.
+    * *Total* (float): The sum of all of the above.  (Computed)
+
+    Constructor:
+    * Fab_CycleTime(Cutting, Plunging, Rapid, ToolChange)
+
+    """
+
+    Cutting: float = 0.0
+    Plunging: float = 0.0
+    Rapid: float = 0.0
+    ToolChange: float = 0.0
+
+    # Fab_CycleTime.__post_init__():
+    def __post_init__(self) -> None:
+        """Finish initializing Fab_CycleTime."""
+        check_type("Fab_CycleTime.Cutting", self.Cutting, float)
+        check_type("Fab_CycleTime.Plunging", self.Plunging, float)
+        check_type("Fab_CycleTime.Rapid", self.Rapid, float)
+        check_type("Fab_CycleTime.ToolChange", self.ToolChange, float)
+
+    # Fab_CycleTime.Total():
+    @property
+    def Total(self) -> float:
+        """Return the total cycle time in seconds."""
+        return self.Cutting + self.Plunging + self.Rapid + self.ToolChange
+
+    # Fab_CycleTime.add():
+    def add(self, other: "Fab_CycleTime") -> "Fab_CycleTime":
+        """Return the sum of two Fab_CycleTime's."""
+        return Fab_CycleTime(
+            self.Cutting + other.Cutting, self.Plunging + other.Plunging,
+            self.Rapid + other.Rapid, self.ToolChange + other.ToolChange)
+
+    # Fab_CycleTime.feedTime():
+    @staticmethod
+    def feedTime(distance: float, feed: float) -> float:
+        """Return the seconds needed to move *distance* millimeters at *feed* mm/sec."""
+        return distance / feed if feed > 0.0 else 0.0
+
+    # Fab_CycleTime.to_json():
+    def to_json(self) -> Dict[str, Any]:
+        """Return the Fab_CycleTime as a JSON dictionary."""
+        return {
+            "Cutting": round(self.Cutting, 3),
+            "Plunging": round(self.Plunging, 3),
+            "Rapid": round(self.Rapid, 3),
+            "ToolChange": round(self.ToolChange, 3),
+            "Total": round(self.Total, 3),
+        }
+
+    # Fab_CycleTime._unit_tests():
+    @staticmethod
+    def _unit_tests(tracing: str = "") -> None:
+        """Run unit tests for Fab_CycleTime."""
+        if tracing:
+            print(f"{tracing}=>Fab_CycleTime._unit_tests()")
+
+        zero: Fab_CycleTime = Fab_CycleTime()
+        assert zero.Total == 0.0
+        cycle_time: Fab_CycleTime = Fab_CycleTime(1.0, 2.0, 3.0, 4.0)
+        assert cycle_time.Total == 10.0
+        assert zero.add(cycle_time) == cycle_time
+        assert cycle_time.add(cycle_time) == Fab_CycleTime(2.0, 4.0, 6.0, 8.0)
+        assert Fab_CycleTime.feedTime(100.0, 10.0) == 10.0
+        assert Fab_CycleTime.feedTime(100.0, 0.0) == 0.0
+        assert cycle_time.to_json() == {
+            "Cutting": 1.0, "Plunging": 2.0, "Rapid": 3.0, "ToolChange": 4.0, "Total": 10.0}
+
+        if tracing:
+            print(f"{tracing}<=Fab_CycleTime._unit_tests()")
+
+
 # Fab_Operation:
 @dataclass(order=True)
 class Fab_Operation(object):
@@ -344,6 +962,8 @@ class Fab_Operation(object):
       The final selected Fab_ShopBit for the operation.
     * *Debug* (bool):
       If True, the resulting operation is made visible; otherwise, it is left not made visible.
+    * *CycleTime* (Optional[Fab_CycleTime]):
+      The estimated cycle time filled in by FabMount.estimateCycleTime().  (Default: None)
 
     Constructor:
     * Fab_Operation("Name", Mount)
@@ -364,6 +984,7 @@ class Fab_Operation(object):
     InitialOperationKey: Optional[Fab_OperationKey] = field(init=False, repr=False, compare=False)
     SelectedShopBit: Optional[Fab_ShopBit] = field(init=False, repr=False, compare=False)
     Debug: bool = field(init=False, repr=False)
+    CycleTime: Optional[Fab_CycleTime] = field(init=False, repr=False, compare=False)
 
     # Fab_Operation.__post_init__():
     def __post_init__(self) -> None:
@@ -382,6 +1003,7 @@ class Fab_Operation(object):
         self.InitialOperationKey = None
         self.SelectedShopBit = None
         self.Debug = False
+        self.CycleTime = None
 
     # Fab_Operation.get_tool_controller():
     # def get_tool_controller(self) -> FabToolController:
@@ -501,7 +1123,7 @@ class Fab_Operation(object):
         return tuple(hashes)
 
     # Fab_Operation.setShopBits():
-    def setShopBits(self, shop_bits: List[Fab_ShopBit]) -> None:
+    def setShopBits(self, shop_bits: Sequence[Fab_ShopBit]) -> None:
         """Set the Fab_Operation ShopBits attribute."""
         self.ShopBits = tuple(shop_bits)
 
@@ -544,8 +1166,15 @@ class Fab_Operation(object):
         if self.ToolController:
             tool_controller_json: Dict[str, Any] = self.ToolController.to_json()
             json_dict["ToolController"] = tool_controller_json
+        if self.CycleTime:
+            json_dict["CycleTime"] = self.CycleTime.to_json()
         return json_dict
 
+    # Fab_Operation.estimateCycleTime():
+    def estimateCycleTime(self, tool_controller: FabToolController) -> Fab_CycleTime:
+        """Return the estimated Fab_CycleTime for a Fab_Operation (excluding tool changes.)"""
+        return Fab_CycleTime()  # pragma: no unit cover
+
 
 # Fab_Extrude:
 @dataclass(order=True)
@@ -578,6 +1207,7 @@ class Fab_Extrude(Fab_Operation):
     _StartDepth: float = field(init=False, repr=False, compare=False)
     _StepDown: float = field(init=False, repr=False, compare=False)
     _FinalDepth: float = field(init=False, repr=False, compare=False)
+    _CNCContour: Dict[str, Any] = field(init=False, repr=False, compare=False)
 
     # Fab_Extrude.__post_init__():
     def __post_init__(self) -> None:
@@ -587,6 +1217,7 @@ class Fab_Extrude(Fab_Operation):
                    Union[FabGeometry, Tuple[FabGeometry, ...]])
         check_type("Fab_Extrude.Depth", self._Depth, float)
         check_type("Fab_Extrude.Contour", self._Contour, bool)
+        self._CNCContour = {}
 
         # Type check self._Geometry and convert into self._Geometries:
         geometries: List[FabGeometry] = []
@@ -704,32 +1335,20 @@ class Fab_Extrude(Fab_Operation):
             print(f"{tracing}")
             print(f"{tracing}{self.Name=} {maximum_diameter=} {depth=}")
 
-        # Search *drill_shop_bits* and fill in *matching_shop_bits*:
+        # Search the contour bit index and fill in *matching_shop_bits*:
         shops: FabShops = produce_state.Shops
-        contour_shop_bits: Tuple[Fab_ShopBit, ...] = shops.ContourShopBits
-        assert len(contour_shop_bits) > 0
+        assert len(shops.ContourShopBits) > 0
+        matching_shop_bits: Tuple[Fab_ShopBit, ...] = (
+            shops.ContourShopBitIndex.lookupMaximum(maximum_diameter, depth))
         shop_bit: Fab_ShopBit
         allowed_bit_types: Tuple[type, ...] = (FabEndMillBit, FabVBit)  # MillDrill=>FabVBit
-        matching_shop_bits: List[Fab_ShopBit] = []
         index: int
-        for index, shop_bit in enumerate(contour_shop_bits):
+        for index, shop_bit in enumerate(matching_shop_bits):
             contour_bit: FabBit = shop_bit.Bit
             if tracing:
                 print(f"{tracing}EndMill[{index}]: {contour_bit.Name}")
             assert isinstance(contour_bit, allowed_bit_types), (
                 f"FabExtrude.produce1(): {type(contour_bit)} is not one of {allowed_bit_types}")
-            contour_bit_length: Union[float, int] = contour_bit.getNumber("Length")
-            contour_bit_diameter: Union[float, int] = contour_bit.getNumber("Diameter")
-            length_ok: bool = depth <= contour_bit_length
-            diameter_ok: bool = contour_bit_diameter <= maximum_diameter
-            if tracing:
-                print(f"{tracing}{depth=} {contour_bit_length}")
-                print(f"{tracing}{maximum_diameter=} {contour_bit_diameter=}")
-                print(f"{tracing}{length_ok=} {diameter_ok=}")
-            if length_ok and diameter_ok:
-                if tracing:
-                    print(f"{tracing}Match!")
-                matching_shop_bits.append(shop_bit)
         assert len(matching_shop_bits) > 0
         # For now, fail horribly if there are no *matching_shop_bits*:
         # assert len(matching_shop_bits) > 0
@@ -791,6 +1410,31 @@ class Fab_Extrude(Fab_Operation):
             cnc_box: FabBox = rotated_xy_geometry.Box
             cnc_box.enclose((cnc_geometry.Box,))
             mount.Solid.CNCBox = cnc_box
+            mount.Solid.CNCDepth = self.Depth
+            if isinstance(rotated_xy_geometry, FabPolygon):
+                corner: Union[Vector, Tuple[Vector, Union[int, float]]]
+                corner_points: List[Vector] = [
+                    corner[0] if isinstance(corner, tuple) else corner
+                    for corner in rotated_xy_geometry.ProjectedCorners]
+                mount.Solid.CNCOutline = tuple([
+                    (float(point.x), float(point.y)) for point in corner_points])
+
+        # Record the CNC contour for native G-code generation (see FabGCodes):
+        if isinstance(cnc_geometry, FabCircle):
+            cnc_center: Vector = cnc_geometry.Center
+            self._CNCContour = {
+                "Kind": "Circle",
+                "Center": [cnc_center.x, cnc_center.y],
+                "Diameter": cnc_geometry.Diameter,
+            }
+        elif isinstance(cnc_geometry, FabPolygon):
+            apex: Vector
+            radius: float
+            self._CNCContour = {
+                "Kind": "Polygon",
+                "Corners": [[apex.x, apex.y, float(radius)]
+                            for apex, radius in cnc_geometry.ProjectedCorners],
+            }
 
         cnc_prefix: Fab_Prefix = self.Prefix
         cnc_prefix_text: str = cnc_prefix.to_string()
@@ -859,6 +1503,19 @@ class Fab_Extrude(Fab_Operation):
         if tracing:
             print(f"{tracing}<=Fab_Extrude.post_produce2('{self.Name}')")
 
+    # Fab_Extrude.estimateCycleTime():
+    def estimateCycleTime(self, tool_controller: FabToolController) -> Fab_CycleTime:
+        """Return the estimated Fab_CycleTime for a Fab_Extrude contour."""
+        perimeter: float = self._Geometries[0].GeometryInfo.Perimeter
+        depth: float = self._Depth
+        passes: int = max(1, int(math.ceil(depth / self._StepDown - 1.0e-9)))
+        clearance_height: float = 10.0  # Matches _ClearanceHeight in to_json()
+        return Fab_CycleTime(
+            Cutting=Fab_CycleTime.feedTime(perimeter * passes, tool_controller.HorizontalFeed),
+            Plunging=Fab_CycleTime.feedTime(depth, tool_controller.VerticalFeed),
+            Rapid=Fab_CycleTime.feedTime(
+                2.0 * (clearance_height + depth), tool_controller.VerticalRapid))
+
     # Fab_Extrude.to_json():
     def to_json(self) -> Dict[str, Any]:
         """Return JSON dictionary for Fab_Extrude."""
@@ -866,6 +1523,8 @@ class Fab_Extrude(Fab_Operation):
         direction_modes: Tuple[str, ...] = ("CCW", "CW")
         side_modes: Tuple[str, ...] = ("Inside", "Outside")
         json_dict: Dict[str, Any] = super().to_json()
+        if self._CNCContour:
+            json_dict["CNCContour"] = self._CNCContour
         json_dict["StepFile"] = self._StepFile
         json_dict["_Active"] = self.Active
         json_dict["_ClearanceHeight"] = 10.0  # self._StartDepth + 10.0  # TODO: Fix
@@ -983,29 +1642,17 @@ class Fab_Pocket(Fab_Operation):
             print(f"{tracing}")
             print(f"{tracing}{self.Name=} {maximum_diameter=} {depth=}")
 
-        # Search *drill_shop_bits* and fill in *matching_shop_bits*:
+        # Search the pocket bit index and fill in *matching_shop_bits*:
         shops: FabShops = produce_state.Shops
-        pocket_shop_bits: Tuple[Fab_ShopBit, ...] = shops.PocketShopBits
+        matching_shop_bits: Tuple[Fab_ShopBit, ...] = (
+            shops.PocketShopBitIndex.lookupMaximum(maximum_diameter, depth))
         pocket_shop_bit: Fab_ShopBit
-        matching_shop_bits: List[Fab_ShopBit] = []
         index: int
-        for index, pocket_shop_bit in enumerate(pocket_shop_bits):
+        for index, pocket_shop_bit in enumerate(matching_shop_bits):
             end_mill_bit: FabBit = pocket_shop_bit.Bit
             if tracing:
                 print(f"{tracing}EndMill[{index}]: {end_mill_bit.Name}")
             assert isinstance(end_mill_bit, FabEndMillBit)
-            end_mill_bit_length: Union[float, int] = end_mill_bit.getNumber("Length")
-            end_mill_bit_diameter: Union[float, int] = end_mill_bit.getNumber("Diameter")
-            length_ok: bool = depth <= end_mill_bit_length
-            diameter_ok: bool = end_mill_bit_diameter <= maximum_diameter
-            if tracing:
-                print(f"{tracing}{depth=} {end_mill_bit_length}")
-                print(f"{tracing}{maximum_diameter=} {end_mill_bit_diameter=}")
-                print(f"{tracing}{length_ok=} {diameter_ok=}")
-            if length_ok and diameter_ok:
-                if tracing:
-                    print(f"{tracing}Match!")
-                matching_shop_bits.append(pocket_shop_bit)
 
         # For now, fail horribly if there are no *matching_shop_bits*:
         # assert len(matching_shop_bits) > 0
@@ -1088,13 +1735,9 @@ class Fab_Pocket(Fab_Operation):
         # Step 1c: Extrude *bottom_path* and save it to a STEP file:
         top_pocket_query.extrude(self._Depth, tracing=next_tracing)
 
-        # Step 1d: Subtract the *top_pocket* from *solid_query*:
-        # TODO: Use the CadQuery *cut* operation instead of *subtract*:
-        solid_query: Any = solid_context.Query
-        assert isinstance(solid_query, Fab_Query), solid_query
-        if tracing:
-            solid_query.show("Pocket Main Before Subtract", tracing)
-        solid_query.subtract(top_pocket_query, tracing=next_tracing)
+        # Step 1d: Queue *top_pocket_query* for subtraction from the solid.  All of the pockets
+        # of a FabMount are subtracted with a single boolean cut by FabMount.flush_pockets():
+        mount._PocketQueries.append(top_pocket_query)
 
         # Step 2: Write out *bottom_assembly* out to a STEP file.
         # Step 2a: Create *bottom_context* at the bottom of the pocket:
@@ -1159,6 +1802,38 @@ class Fab_Pocket(Fab_Operation):
         if tracing:
             print(f"{tracing}<=Fab_Pocket.post_produce2('{self.Name}')")
 
+    # Fab_Pocket.estimateCycleTime():
+    def estimateCycleTime(self, tool_controller: FabToolController) -> Fab_CycleTime:
+        """Return the estimated Fab_CycleTime for a Fab_Pocket.
+
+        The first geometry is the pocket outline and any remaining geometries are islands.
+        Each step down level rapids down to the safe height, plunges to the level depth,
+        clears the area with a zig-zag at the to_json() step over, follows all of the
+        perimeters, and rapids back up.
+
+        """
+        geometries: Tuple[FabGeometry, ...] = cast(Tuple[FabGeometry, ...], self._Geometries)
+        infos: List[FabGeometryInfo] = [geometry.GeometryInfo for geometry in geometries]
+        area: float = max(0.0, infos[0].Area - sum([info.Area for info in infos[1:]]))
+        perimeter: float = sum([info.Perimeter for info in infos])
+        selected_shop_bit: Optional[Fab_ShopBit] = self.SelectedShopBit
+        assert isinstance(selected_shop_bit, Fab_ShopBit), selected_shop_bit
+        diameter: float = float(selected_shop_bit.Bit.getNumber("Diameter"))
+        step_over: float = 0.90 * diameter  # Matches _StepOver in to_json()
+        depth: float = self._Depth
+        levels: int = max(1, int(math.ceil(depth / self._StepDown - 1.0e-9)))
+        level_depths: List[float] = [
+            min(depth, level * self._StepDown) for level in range(1, levels + 1)]
+        safe_height: float = 5.0  # Matches _SafeHeight in to_json()
+        return Fab_CycleTime(
+            Cutting=Fab_CycleTime.feedTime(
+                levels * (area / step_over + perimeter), tool_controller.HorizontalFeed),
+            Plunging=sum([Fab_CycleTime.feedTime(level_depth, tool_controller.VerticalFeed)
+                          for level_depth in level_depths]),
+            Rapid=sum([Fab_CycleTime.feedTime(
+                2.0 * safe_height + level_depth, tool_controller.VerticalRapid)
+                for level_depth in level_depths]))
+
     # Fab_Pocket.to_json():
     def to_json(self) -> Dict[str, Any]:
         """Return JSON dictionary for Fab_Extrude."""
@@ -1253,6 +1928,240 @@ class Fab_HoleKey(object):
             print(f"{tracing}<=Fab_HoleKey._unit_tests()")
 
 
+# Fab_PointOrder:
+@dataclass(frozen=True)
+class Fab_PointOrder(object):
+    """Fab_PointOrder: A rapid travel minimizing visit order for a set of coplanar points.
+
+    The drill points of a Fab_Hole are collected in whatever order the joins were found,
+    which causes the tool path to zig-zag across the part.  Fab_PointOrder computes a
+    shorter open path through the points.  Grid patterns are ordered in a serpentine
+    (row by row, alternating direction) order.  All other patterns are ordered via nearest
+    neighbor followed by 2-opt improvement.  The resulting order is never longer than
+    the original order.
+
+    Attributes:
+    * *Points* (Tuple[Vector, ...]): The points to order.
+    * *Normal* (Vector): The normal of the plane that contains the points.
+    * *Order* (Tuple[int, ...]): The indices of *Points* in visit order.  (Computed)
+    * *Method* (str): One of "original", "serpentine", or "nearest_2opt".  (Computed)
+    * *Before* (float): The rapid travel distance using the original order.  (Computed)
+    * *After* (float): The rapid travel distance using *Order*.  (Computed)
+
+    Constructor:
+    * Fab_PointOrder(Points, Normal)
+
+    """
+
+    Points: Tuple[Vector, ...]
+    Normal: Vector
+    Order: Tuple[int, ...] = field(init=False)
+    Method: str = field(init=False)
+    Before: float = field(init=False)
+    After: float = field(init=False)
+
+    # Fab_PointOrder.__post_init__():
+    def __post_init__(self) -> None:
+        """Finish initializing Fab_PointOrder."""
+        check_type("Fab_PointOrder.Points", self.Points, Tuple[Vector, ...])
+        check_type("Fab_PointOrder.Normal", self.Normal, Vector)
+        size: int = len(self.Points)
+        coordinates: Any = np.array(
+            [(point.x, point.y, point.z) for point in self.Points], dtype=float).reshape(size, 3)
+        original: Tuple[int, ...] = tuple(range(size))
+        before: float = Fab_PointOrder._pathLength(coordinates, original)
+        candidates: List[Tuple[float, int, str, Tuple[int, ...]]] = [
+            (before, 0, "original", original)]
+        if size > 2:
+            # Try serpentine rows along both in-plane axes:
+            serpentine: Tuple[int, ...]
+            grid: bool
+            is_grid: bool = False
+            swap: bool
+            for swap in (False, True):
+                serpentine, grid = self._serpentine(coordinates, swap)
+                is_grid = is_grid or grid
+                candidates.append((Fab_PointOrder._pathLength(coordinates, serpentine),
+                                   1, "serpentine", serpentine))
+            if not is_grid:
+                improved: Tuple[int, ...] = Fab_PointOrder._twoOpt(
+                    coordinates, Fab_PointOrder._nearestNeighbor(coordinates, candidates[1][3][0]))
+                candidates.append((Fab_PointOrder._pathLength(coordinates, improved),
+                                   2, "nearest_2opt", improved))
+        after: float
+        method: str
+        order: Tuple[int, ...]
+        after, _, method, order = min(candidates)
+        object.__setattr__(self, "Order", order)
+        object.__setattr__(self, "Method", method)
+        object.__setattr__(self, "Before", before)
+        object.__setattr__(self, "After", after)
+
+    # Fab_PointOrder.OrderedPoints():
+    @property
+    def OrderedPoints(self) -> Tuple[Vector, ...]:
+        """Return the points in visit order."""
+        points: Tuple[Vector, ...] = self.Points
+        return tuple([points[index] for index in self.Order])
+
+    # Fab_PointOrder._pathLength():
+    @staticmethod
+    def _pathLength(coordinates: Any, order: Sequence[int]) -> float:
+        """Return the open path length visiting *coordinates* in *order*."""
+        if len(order) < 2:
+            return 0.0
+        ordered: Any = coordinates[list(order)]
+        return float(np.linalg.norm(ordered[1:] - ordered[:-1], axis=1).sum())
+
+    # Fab_PointOrder._serpentine():
+    def _serpentine(self, coordinates: Any, swap: bool) -> Tuple[Tuple[int, ...], bool]:
+        """Return a serpentine order and whether the points form a full grid.
+
+        Rows run along the first in-plane axis, or along the second when *swap* is True.
+
+        """
+        # Compute in-plane *u_axis* and *v_axis* from the plane normal:
+        normal: Any = np.array((self.Normal.x, self.Normal.y, self.Normal.z), dtype=float)
+        normal = normal / np.linalg.norm(normal)
+        helper: Any = np.array((1.0, 0.0, 0.0) if abs(normal[0]) < 0.9 else (0.0, 1.0, 0.0))
+        u_axis: Any = np.cross(normal, helper)
+        u_axis = u_axis / np.linalg.norm(u_axis)
+        v_axis: Any = np.cross(normal, u_axis)
+        if swap:
+            u_axis, v_axis = v_axis, u_axis
+        us: List[float] = (coordinates @ u_axis).tolist()
+        vs: List[float] = (coordinates @ v_axis).tolist()
+
+        # Bucket the points into rows and columns with a 1 micron tolerance:
+        resolution: float = 0.001
+        rows: Dict[int, List[int]] = {}
+        index: int
+        for index, v in enumerate(vs):
+            rows.setdefault(round(v / resolution), []).append(index)
+        row_columns: List[Tuple[int, ...]] = []
+        order: List[int] = []
+        row_index: int
+        row_key: int
+        for row_index, row_key in enumerate(sorted(rows.keys())):
+            row: List[int] = sorted(rows[row_key], key=lambda index: us[index])
+            row_columns.append(tuple([round(us[index] / resolution) for index in row]))
+            order.extend(row if row_index % 2 == 0 else reversed(row))
+        is_grid: bool = len(rows) > 1 and all(
+            [columns == row_columns[0] for columns in row_columns])
+        return tuple(order), is_grid
+
+    # Fab_PointOrder._nearestNeighbor():
+    @staticmethod
+    def _nearestNeighbor(coordinates: Any, start: int) -> Tuple[int, ...]:
+        """Return a nearest neighbor order beginning at *start*."""
+        size: int = len(coordinates)
+        visited: Any = np.zeros(size, dtype=bool)
+        order: List[int] = [start]
+        visited[start] = True
+        current: int = start
+        while len(order) < size:
+            distances: Any = np.linalg.norm(coordinates - coordinates[current], axis=1)
+            distances[visited] = np.inf
+            current = int(np.argmin(distances))
+            visited[current] = True
+            order.append(current)
+        return tuple(order)
+
+    # Fab_PointOrder._twoOpt():
+    @staticmethod
+    def _twoOpt(coordinates: Any, order: Tuple[int, ...],
+                maximum_passes: int = 20) -> Tuple[int, ...]:
+        """Return *order* improved by open path 2-opt segment reversals."""
+        path: List[int] = list(order)
+        size: int = len(path)
+        epsilon: float = 1.0e-9
+        for _ in range(maximum_passes):
+            improved: bool = False
+            first: int
+            for first in range(size - 1):
+                # Consider reversing path[first:last+1] for every *last* > *first*:
+                points: Any = coordinates[path]
+                lasts: Any = np.arange(first + 1, size)
+                ends: Any = points[lasts]
+                # Gain from the edge entering the segment (none when *first* is 0):
+                delta: Any = np.zeros(len(lasts))
+                if first > 0:
+                    before: Any = points[first - 1]
+                    delta += (np.linalg.norm(ends - before, axis=1) -
+                              np.linalg.norm(points[first] - before))
+                # Gain from the edge leaving the segment (none when *last* is the end):
+                inner: Any = lasts < size - 1
+                afters: Any = points[lasts[inner] + 1]
+                delta[inner] += (np.linalg.norm(afters - points[first], axis=1) -
+                                 np.linalg.norm(afters - ends[inner], axis=1))
+                best: int = int(np.argmin(delta))
+                if delta[best] < -epsilon:
+                    last: int = int(lasts[best])
+                    path[first:last + 1] = reversed(path[first:last + 1])
+                    improved = True
+            if not improved:
+                break
+        return tuple(path)
+
+    # Fab_PointOrder._unit_tests():
+    @staticmethod
+    def _unit_tests(tracing: str = "") -> None:
+        """Run unit tests for Fab_PointOrder."""
+        if tracing:
+            print(f"{tracing}=>Fab_PointOrder._unit_tests()")
+
+        z_axis: Vector = Vector(0.0, 0.0, 1.0)
+
+        def check(points: List[Vector], normal: Vector,
+                  method: str, after: Optional[float] = None) -> Fab_PointOrder:
+            """Verify a Fab_PointOrder."""
+            point_order: Fab_PointOrder = Fab_PointOrder(tuple(points), normal)
+            assert sorted(point_order.Order) == list(range(len(points))), point_order.Order
+            assert point_order.Method == method, (point_order.Method, method)
+            assert point_order.After <= point_order.Before + 1.0e-9
+            if after is not None:
+                assert abs(point_order.After - after) < 1.0e-6, (point_order.After, after)
+            assert len(point_order.OrderedPoints) == len(points)
+            return point_order
+
+        # Trivial cases:
+        check([], z_axis, "original", 0.0)
+        check([Vector(1.0, 2.0, 3.0)], z_axis, "original", 0.0)
+        check([Vector(0.0, 0.0, 0.0), Vector(3.0, 4.0, 0.0)], z_axis, "original", 5.0)
+
+        # A shuffled 6x4 grid (10mm x 5mm pitch) is ordered as a serpentine down the short
+        # columns.  Use a fixed multiplicative shuffle so that the test is repeatable:
+        grid: List[Vector] = [
+            Vector(10.0 * (index % 6), 5.0 * (index // 6), 2.0) for index in range(24)]
+        shuffled: List[Vector] = [grid[(index * 7) % 24] for index in range(24)]
+        check(shuffled, z_axis, "serpentine", 6 * 3 * 5.0 + 5 * 10.0)
+
+        # The same grid in a plane with a Y axis normal:
+        y_grid: List[Vector] = [Vector(point.x, -3.0, point.y) for point in shuffled]
+        check(y_grid, Vector(0.0, 1.0, 0.0), "serpentine", 6 * 3 * 5.0 + 5 * 10.0)
+
+        # Shuffled points on a line are visited end to end:
+        line: List[Vector] = [Vector(float((index * 5) % 11), 0.0, 0.0) for index in range(11)]
+        check(line, z_axis, "serpentine", 10.0)
+
+        # Points on a circle are not a grid; 2-opt untangles them:
+        circle: List[Vector] = [
+            Vector(math.cos(2.0 * math.pi * ((index * 5) % 12) / 12.0),
+                   math.sin(2.0 * math.pi * ((index * 5) % 12) / 12.0), 0.0)
+            for index in range(12)]
+        circle_order: Fab_PointOrder = check(circle, z_axis, "nearest_2opt")
+        perimeter: float = 12.0 * 2.0 * math.sin(math.pi / 12.0)
+        assert abs(circle_order.After - (perimeter - 2.0 * math.sin(math.pi / 12.0))) < 1.0e-6
+
+        # Already ordered points stay in the original order:
+        ordered: List[Vector] = [Vector(0.0, 0.0, 0.0), Vector(1.0, 0.0, 0.0),
+                                 Vector(2.0, 0.0, 0.0), Vector(4.0, 0.0, 0.0)]
+        check(ordered, z_axis, "original", 4.0)
+
+        if tracing:
+            print(f"{tracing}<=Fab_PointOrder._unit_tests()")
+
+
 # Fab_Hole:
 @dataclass
 class Fab_Hole(Fab_Operation):
@@ -1270,6 +2179,7 @@ class Fab_Hole(Fab_Operation):
     Computed Attributes:
     * HolesCount (int): The number of complatible holes.
     * StartDepth (float): The starting depth in millimeters from the mount plane.
+    * CNCCenters (Tuple[Tuple[float, float], ...]): The hole X/Y centers in CNC coordinates.
 
     Constructor:
     * Fab_Hole("Name", Mount, Key, Centers, Join, Depth)
@@ -1282,6 +2192,7 @@ class Fab_Hole(Fab_Operation):
     HolesCount: int = field(init=False, repr=False)  # Number of holes in this operation
     StartDepth: float = field(init=False, repr=False)
     StepFile: str = field(init=False, repr=False)
+    CNCCenters: Tuple[Tuple[float, float], ...] = field(init=False, repr=False)
 
     # Fab_Hole.__post_init__():
     def __post_init__(self) -> None:
@@ -1295,6 +2206,7 @@ class Fab_Hole(Fab_Operation):
         self.HolesCount = 0
         self.StartDepth = 0.0
         self.StepFile = ""
+        self.CNCCenters = ()
 
     # Fab_Hole.get_kind():
     def get_kind(self) -> str:
@@ -1343,21 +2255,24 @@ class Fab_Hole(Fab_Operation):
         # TODO: Extend *depth* to deal with through holes.
         diameter: float = self.Join.Fasten.get_diameter(kind)
 
-        # Search *drill_shop_bits* and fill in *matching_shop_bits*:
+        # Search the drill bit index and fill in *matching_shop_bits*:
         shops: FabShops = produce_state.Shops
-        matching_shop_bits: List[Fab_ShopBit] = []
-        drill_shop_bits: Tuple[Fab_ShopBit, ...] = shops.DrillShopBits
+        matching_shop_bits: Tuple[Fab_ShopBit, ...] = (
+            shops.DrillShopBitIndex.lookupExact(diameter, depth, 0.0001))  # mm
         drill_shop_bit: Fab_ShopBit
-        for drill_shop_bit in drill_shop_bits:
-            drill_bit: FabBit = drill_shop_bit.Bit
-            assert isinstance(drill_bit, FabDrillBit)
-            drill_bit_length: Union[float, int] = drill_bit.getNumber("Length")
-            drill_bit_diameter: Union[float, int] = drill_bit.getNumber("Diameter")
-            if depth <= drill_bit_length and abs(diameter - drill_bit_diameter) < 0.0001:  # mm
-                matching_shop_bits.append(drill_shop_bit)
+        for drill_shop_bit in matching_shop_bits:
+            assert isinstance(drill_shop_bit.Bit, FabDrillBit)
 
         # If there is least one drill bit, use it; otherwise, convert everything FabPocket's:
         if matching_shop_bits:
+            # Reorder *Centers* to minimize rapid travel before the STEP file and JSON exist:
+            point_order: Fab_PointOrder = Fab_PointOrder(self.Centers, self.Mount.Normal)
+            self.Centers = point_order.OrderedPoints
+            produce_state.RapidDistanceBefore += point_order.Before
+            produce_state.RapidDistanceAfter += point_order.After
+            if tracing:
+                print(f"{tracing}{point_order.Method}: "
+                      f"rapid {point_order.Before:.3f}mm=>{point_order.After:.3f}mm")
             self.setShopBits(matching_shop_bits)
             expanded_operations.append(self)
         else:
@@ -1425,20 +2340,24 @@ class Fab_Hole(Fab_Operation):
             step_base_name: str = f"{prefix_text}__{self.Name}_holes"
             cnc_path: PathFile = produce_state.Steps.activate(step_base_name, self.getHash())
             self.StepFile: str = str(cnc_path)
-            if not cnc_path.exists():
-                # Create *cnc_circles*:
-                orient_angle: float = mount.OrientAngle
-                orient_translate: Vector = mount.OrientTranslate
-                cnc_circles: List[FabCircle] = []
-                cnc_circle: FabCircle
-                for solid_center in self.Centers:
-                    solid_circle = FabCircle(solid_plane, solid_center, diameter)
-                    projected_circle = solid_circle.projectToPlane(
-                        solid_plane, tracing=next_tracing)
-                    _, cnc_circle = projected_circle.xyPlaneReorient(
-                        orient_angle, orient_translate, tracing=next_tracing)
-                    cnc_circles.append(cnc_circle)
 
+            # Create *cnc_circles* (also used for native G-code generation, see FabGCodes):
+            orient_angle: float = mount.OrientAngle
+            orient_translate: Vector = mount.OrientTranslate
+            cnc_circles: List[FabCircle] = []
+            cnc_circle: FabCircle
+            for solid_center in self.Centers:
+                solid_circle = FabCircle(solid_plane, solid_center, diameter)
+                projected_circle = solid_circle.projectToPlane(
+                    solid_plane, tracing=next_tracing)
+                _, cnc_circle = projected_circle.xyPlaneReorient(
+                    orient_angle, orient_translate, tracing=next_tracing)
+                cnc_circles.append(cnc_circle)
+            self.CNCCenters = tuple([
+                (cnc_circle.Center.x, cnc_circle.Center.y) for cnc_circle in cnc_circles])
+            self.HolesCount = len(cnc_circles)
+
+            if not cnc_path.exists():
                 # Compute the X/Y bounding rectangle:
                 max_cnc_x = 0.0  # mypy requires that min/max_cnc_x/y be initialized.  Why?
                 min_cnc_x = 0.0  # TODO: Add back `: float`.
@@ -1513,6 +2432,21 @@ class Fab_Hole(Fab_Operation):
         if tracing:
             print(f"{tracing}<=Fab_Hole({self.Name}).post_produce2()")
 
+    # Fab_Hole.estimateCycleTime():
+    def estimateCycleTime(self, tool_controller: FabToolController) -> Fab_CycleTime:
+        """Return the estimated Fab_CycleTime for drilling all of the Fab_Hole centers."""
+        centers: Tuple[Vector, ...] = self.Centers
+        depth: float = self.Depth
+        safe_height: float = 5.0  # Matches _SafeHeight in to_json()
+        coordinates: Any = np.array(
+            [(center.x, center.y, center.z) for center in centers], dtype=float).reshape(-1, 3)
+        travel: float = Fab_PointOrder._pathLength(coordinates, range(len(centers)))
+        return Fab_CycleTime(
+            Plunging=len(centers) * Fab_CycleTime.feedTime(depth, tool_controller.VerticalFeed),
+            Rapid=(len(centers) * Fab_CycleTime.feedTime(
+                   2.0 * safe_height + depth, tool_controller.VerticalRapid) +
+                   Fab_CycleTime.feedTime(travel, tool_controller.HorizontalRapid)))
+
     # Fab_Hole.to_json():
     def to_json(self) -> Dict[str, Any]:
         """Return the FabHole JSON."""
@@ -1520,8 +2454,10 @@ class Fab_Hole(Fab_Operation):
         extra_offset_modes: Tuple[str, ...] = ("2x Drill Tip", "Drill Tip", "None")
         json_dict: Dict[str, Any] = super().to_json()
         json_dict["HolesCount"] = self.HolesCount
+        if self.CNCCenters:
+            json_dict["CNCCenters"] = [list(center) for center in self.CNCCenters]
         json_dict["StepFile"] = self.StepFile
-        json_dict["ToolControllerIndex"] = 1  # TODO Fix
+        json_dict["ToolControllerIndex"] = self.ToolControllerIndex
         json_dict["_Active"] = True
         json_dict["_ClearanceHeight"] = 10.0  # self.StartDepth + 10.0  # TODO: Fix
         json_dict["_CoolantMode"] = "Flood"  # TODO: Fix
@@ -1535,6 +2471,458 @@ class Fab_Hole(Fab_Operation):
         return json_dict
 
 
+# Fab_JoinIndex:
+@dataclass
+class Fab_JoinIndex(object):
+    """Fab_JoinIndex: A private uniform grid spatial index over FabJoin segments.
+
+    Every FabJoin segment (i.e. *Start* to *End*) is enclosed by an axis aligned bounding box
+    that is recorded into each uniform grid cell it overlaps.  A query with a FabBox only
+    visits the grid cells that overlap the FabBox and returns the indices of the FabJoin's
+    whose bounding boxes overlap the FabBox.  Since FabBox.intersect() rejects any segment
+    whose bounding box does not overlap the FabBox, the returned indices are always a superset
+    of the FabJoin's that can intersect the FabBox.
+
+    Attributes:
+    * *Joins* (Tuple[FabJoin, ...]): The indexed FabJoin's.
+
+    Constructor:
+    * Fab_JoinIndex(Joins)
+
+    """
+
+    Joins: Tuple[FabJoin, ...]
+    _Bounds: List[Tuple[float, float, float, float, float, float]] = field(
+        init=False, repr=False)
+    _Origin: Tuple[float, float, float] = field(init=False, repr=False)
+    _CellSize: float = field(init=False, repr=False)
+    _Counts: Tuple[int, int, int] = field(init=False, repr=False)
+    _Grid: Dict[Tuple[int, int, int], List[int]] = field(init=False, repr=False)
+    _Cached: ClassVar[Optional["Fab_JoinIndex"]] = None  # Most recently used Fab_JoinIndex
+
+    # Fab_JoinIndex.__post_init__():
+    def __post_init__(self) -> None:
+        """Build the Fab_JoinIndex grid."""
+        check_type("Fab_JoinIndex.Joins", self.Joins, Tuple[FabJoin, ...])
+
+        # Compute the bounding box of each join segment and of all of them together:
+        bounds: List[Tuple[float, float, float, float, float, float]] = []
+        join: FabJoin
+        for join in self.Joins:
+            start: Vector = join.Start
+            end: Vector = join.End
+            bounds.append((
+                min(start.x, end.x), min(start.y, end.y), min(start.z, end.z),
+                max(start.x, end.x), max(start.y, end.y), max(start.z, end.z)))
+        self._Bounds = bounds
+        self._Grid = {}
+        if not bounds:
+            self._Origin = (0.0, 0.0, 0.0)
+            self._CellSize = 1.0
+            self._Counts = (0, 0, 0)
+            return
+        minimums: Tuple[float, float, float] = (
+            min(bound[0] for bound in bounds),
+            min(bound[1] for bound in bounds),
+            min(bound[2] for bound in bounds))
+        maximums: Tuple[float, float, float] = (
+            max(bound[3] for bound in bounds),
+            max(bound[4] for bound in bounds),
+            max(bound[5] for bound in bounds))
+
+        # Size the cells so that there are roughly as many cells as joins:
+        extent: float = max(maximum - minimum for minimum, maximum in zip(minimums, maximums))
+        divisions: int = max(1, int(round(len(bounds) ** (1.0 / 3.0))))
+        cell_size: float = extent / float(divisions) if extent > 0.0 else 1.0
+        self._Origin = minimums
+        self._CellSize = cell_size
+        self._Counts = cast(Tuple[int, int, int], tuple(
+            int((maximum - minimum) / cell_size) + 1
+            for minimum, maximum in zip(minimums, maximums)))
+
+        # Record each join index in every cell its bounding box overlaps:
+        grid: Dict[Tuple[int, int, int], List[int]] = self._Grid
+        index: int
+        bound: Tuple[float, float, float, float, float, float]
+        for index, bound in enumerate(bounds):
+            for i in self._cellRange(0, bound[0], bound[3]):
+                for j in self._cellRange(1, bound[1], bound[4]):
+                    for k in self._cellRange(2, bound[2], bound[5]):
+                        key: Tuple[int, int, int] = (i, j, k)
+                        if key not in grid:
+                            grid[key] = []
+                        grid[key].append(index)
+
+    # Fab_JoinIndex._cellRange():
+    def _cellRange(self, axis: int, minimum: float, maximum: float) -> range:
+        """Return the range of grid cells along an axis that overlap minimum to maximum."""
+        origin: float = self._Origin[axis]
+        cell_size: float = self._CellSize
+        count: int = self._Counts[axis]
+        low: int = max(0, int(math.floor((minimum - origin) / cell_size)))
+        high: int = min(count - 1, int(math.floor((maximum - origin) / cell_size)))
+        return range(low, high + 1)
+
+    # Fab_JoinIndex.lookup():
+    @staticmethod
+    def lookup(joins: Sequence[FabJoin]) -> "Fab_JoinIndex":
+        """Return a Fab_JoinIndex for some joins, reusing the previous one when possible.
+
+        The same tuple of FabJoin's is normally drilled into every FabMount of every FabSolid,
+        so the most recently built Fab_JoinIndex is reused when *joins* is that same tuple.
+        A list of FabJoin's can be modified afterwards and always gets a new Fab_JoinIndex.
+        """
+        cached: Optional[Fab_JoinIndex] = Fab_JoinIndex._Cached
+        if isinstance(joins, tuple):
+            if cached is not None and cached.Joins is joins:
+                return cached
+            cached = Fab_JoinIndex(joins)
+            Fab_JoinIndex._Cached = cached
+            return cached
+        return Fab_JoinIndex(tuple(joins))
+
+    # Fab_JoinIndex.query():
+    def query(self, box: FabBox) -> Tuple[int, ...]:
+        """Return the sorted indices of the FabJoin's whose bounding boxes overlap a FabBox."""
+        x_min: float = box.XMin
+        y_min: float = box.YMin
+        z_min: float = box.ZMin
+        x_max: float = box.XMax
+        y_max: float = box.YMax
+        z_max: float = box.ZMax
+        grid: Dict[Tuple[int, int, int], List[int]] = self._Grid
+        bounds: List[Tuple[float, float, float, float, float, float]] = self._Bounds
+        candidates: Set[int] = set()
+        for i in self._cellRange(0, x_min, x_max):
+            for j in self._cellRange(1, y_min, y_max):
+                for k in self._cellRange(2, z_min, z_max):
+                    candidates.update(grid.get((i, j, k), ()))
+        index: int
+        return tuple(sorted(
+            index for index in candidates
+            if bounds[index][0] <= x_max and x_min <= bounds[index][3] and
+            bounds[index][1] <= y_max and y_min <= bounds[index][4] and
+            bounds[index][2] <= z_max and z_min <= bounds[index][5]))
+
+    # Fab_JoinIndex._unit_tests():
+    @staticmethod
+    def _unit_tests(tracing: str = "") -> None:
+        """Run unit tests for Fab_JoinIndex."""
+        if tracing:
+            print(f"{tracing}=>Fab_JoinIndex._unit_tests()")
+
+        fasten: FabFasten = FabFasten("Test", "#4-40", ())
+
+        # Create a 10x10 grid of vertical joins spaced 10mm apart:
+        joins: List[FabJoin] = []
+        segments: List[Tuple[Vector, Vector]] = []
+        x: int
+        y: int
+        for x in range(10):
+            for y in range(10):
+                start: Vector = Vector(10.0 * x, 10.0 * y, 5.0)
+                end: Vector = Vector(10.0 * x, 10.0 * y, -5.0)
+                joins.append(FabJoin(f"Join{x}_{y}", fasten, start, end))
+                segments.append((start, end))
+        joins_tuple: Tuple[FabJoin, ...] = tuple(joins)
+        join_index: Fab_JoinIndex = Fab_JoinIndex.lookup(joins_tuple)
+        assert Fab_JoinIndex.lookup(joins_tuple) is join_index
+        assert Fab_JoinIndex.lookup(joins) is not join_index
+
+        def check(bsw: Vector, tne: Vector, exact: bool = True) -> None:
+            """Verify that the index query matches a brute force FabBox.intersect() scan."""
+            box: FabBox = FabBox()
+            box.enclose((bsw, tne))
+            index: int
+            start: Vector
+            end: Vector
+            brute_force: Tuple[int, ...] = tuple(
+                index for index, (start, end) in enumerate(segments)
+                if box.intersect(start, end)[0])
+            candidates: Tuple[int, ...] = join_index.query(box)
+            assert set(brute_force) <= set(candidates), (brute_force, candidates)
+            assert candidates == brute_force or not exact, (brute_force, candidates)
+
+        check(Vector(-1.0, -1.0, -1.0), Vector(1.0, 1.0, 1.0))  # One corner join
+        check(Vector(15.0, 15.0, -1.0), Vector(35.0, 45.0, 1.0))  # A 2x3 block of joins
+        # Joins that only touch the box are candidates, but do not intersect:
+        check(Vector(10.0, 10.0, 5.0), Vector(20.0, 20.0, 6.0), exact=False)
+        check(Vector(-50.0, -50.0, -1.0), Vector(200.0, 200.0, 1.0))  # Everything
+        check(Vector(-50.0, -50.0, 6.0), Vector(200.0, 200.0, 7.0))  # Above everything
+        check(Vector(101.0, 101.0, -1.0), Vector(200.0, 200.0, 1.0))  # Outside the grid
+        check(Vector(1.0, 1.0, -1.0), Vector(9.0, 9.0, 1.0))  # Between joins
+
+        # An empty index returns nothing:
+        empty_box: FabBox = FabBox()
+        empty_box.enclose((Vector(-1.0, -1.0, -1.0), Vector(1.0, 1.0, 1.0)))
+        assert Fab_JoinIndex(()).query(empty_box) == ()
+
+        if tracing:
+            print(f"{tracing}<=Fab_JoinIndex._unit_tests()")
+
+
+# Fab_OperationScheduler:
+@dataclass
+class Fab_OperationScheduler(object):
+    """Fab_OperationScheduler: Selects a tool for each FabMount operation.
+
+    Each operation of a FabMount can usually be performed by more than one Fab_ShopBit.
+    A scheduler decides both which Fab_ShopBit is used for each operation and the order
+    in which the operations are performed.  The scheduler works on plain tool keys of the
+    form (ShopIndex, MachineIndex, ToolNumber) so that it is independent of the actual
+    Fab_ShopBit's.
+
+    The operations are passed in sorted by Fab_OperationKey and are grouped into blocks of
+    identical (MountFence, OperationOrder).  A scheduler may only reorder operations within
+    a block; blocks are always performed in order so that fences and operation precedence
+    (e.g. center drill before drill) are preserved.
+
+    This base class is the original greedy sweep: operations are kept in sorted order and
+    the first tool on the current machine is selected, then the first tool in the current
+    shop, then the first tool anywhere.  Sub-classes override schedule() to do better.
+
+    Constructor:
+    * Fab_OperationScheduler()
+
+    """
+
+    # Fab_OperationScheduler.schedule():
+    def schedule(self, blocks: Sequence[Tuple[int, int]],
+                 choices: Sequence[Sequence[Tuple[int, int, int]]],
+                 start: Tuple[int, int, int]) -> List[Tuple[int, int]]:
+        """Return an operation schedule.
+
+        Arguments:
+        * *blocks* (Sequence[Tuple[int, int]]):
+          The (MountFence, OperationOrder) for each operation in sorted order.
+        * *choices* (Sequence[Sequence[Tuple[int, int, int]]]):
+          The (ShopIndex, MachineIndex, ToolNumber) tool keys that can perform each operation
+          in priority order.
+        * *start* (Tuple[int, int, int]):
+          The tool key that is current before the first operation.  The tool number is -1
+          when no tool is loaded.
+
+        Returns:
+        * (List[Tuple[int, int]]):
+          A list of (operation index, choice index) pairs in the order to be performed.
+
+        """
+        current_shop_index: int = start[0]
+        current_machine_index: int = start[1]
+        schedule: List[Tuple[int, int]] = []
+        operation_index: int
+        operation_choices: Sequence[Tuple[int, int, int]]
+        for operation_index, operation_choices in enumerate(choices):
+            same_machine_index: int = -1
+            same_shop_index: int = -1
+            other_shop_index: int = -1
+            choice_index: int
+            tool_key: Tuple[int, int, int]
+            for choice_index, tool_key in enumerate(operation_choices):
+                if tool_key[0] == current_shop_index:
+                    if tool_key[1] == current_machine_index:
+                        same_machine_index = choice_index
+                        break  # This is the one to use, no need to look any further.
+                    elif same_shop_index < 0:
+                        same_shop_index = choice_index
+                elif other_shop_index < 0:
+                    other_shop_index = choice_index
+            selected_index: int = same_machine_index
+            if selected_index < 0:
+                selected_index = same_shop_index if same_shop_index >= 0 else other_shop_index
+            if selected_index < 0:
+                raise RuntimeError(
+                    "Fab_OperationScheduler.schedule(): No matching shop bit found.")
+            current_shop_index, current_machine_index, _ = operation_choices[selected_index]
+            schedule.append((operation_index, selected_index))
+        return schedule
+
+    # Fab_OperationScheduler.countChanges():
+    @staticmethod
+    def countChanges(tool_keys: Sequence[Tuple[int, int, int]],
+                     start: Tuple[int, int, int]) -> Tuple[int, int]:
+        """Return the (tool changes, machine switches) needed to use a tool key sequence."""
+        tool_changes: int = 0
+        machine_switches: int = 0
+        previous: Tuple[int, int, int] = start
+        tool_key: Tuple[int, int, int]
+        for tool_key in tool_keys:
+            if tool_key != previous:
+                tool_changes += 1
+            if tool_key[:2] != previous[:2]:
+                machine_switches += 1
+            previous = tool_key
+        return (tool_changes, machine_switches)
+
+    # Fab_OperationScheduler._unit_tests():
+    @staticmethod
+    def _unit_tests(tracing: str = "") -> None:
+        """Run unit tests for Fab_OperationScheduler and Fab_ToolChangeScheduler."""
+        if tracing:
+            print(f"{tracing}=>Fab_OperationScheduler._unit_tests()")
+
+        greedy: Fab_OperationScheduler = Fab_OperationScheduler()
+        minimizer: Fab_OperationScheduler = Fab_ToolChangeScheduler()
+        start: Tuple[int, int, int] = (0, 0, -1)
+        t1: Tuple[int, int, int] = (0, 0, 1)
+        t2: Tuple[int, int, int] = (0, 0, 2)
+        t3: Tuple[int, int, int] = (0, 1, 3)
+
+        def check(scheduler: Fab_OperationScheduler, blocks: List[Tuple[int, int]],
+                  choices: List[List[Tuple[int, int, int]]],
+                  start: Tuple[int, int, int], desired_order: Tuple[int, ...],
+                  desired_changes: Tuple[int, int]) -> None:
+            """Verify that a schedule has the desired order and change counts."""
+            schedule: List[Tuple[int, int]] = scheduler.schedule(blocks, choices, start)
+            order: Tuple[int, ...] = tuple([pair[0] for pair in schedule])
+            assert order == desired_order, (order, desired_order)
+            tool_keys: List[Tuple[int, int, int]] = [
+                choices[operation_index][choice_index]
+                for operation_index, choice_index in schedule]
+            changes: Tuple[int, int] = Fab_OperationScheduler.countChanges(tool_keys, start)
+            assert changes == desired_changes, (changes, desired_changes)
+
+        # Change counting:
+        assert Fab_OperationScheduler.countChanges([], start) == (0, 0)
+        assert Fab_OperationScheduler.countChanges([t1, t1, t2, t3, t1], start) == (4, 2)
+
+        # Pick the tool that covers the most operations in a block:
+        blocks: List[Tuple[int, int]] = [(0, 1), (0, 1), (0, 2)]
+        choices: List[List[Tuple[int, int, int]]] = [[t1, t2], [t2], [t1, t2]]
+        check(greedy, blocks, choices, start, (0, 1, 2), (3, 0))
+        check(minimizer, blocks, choices, start, (0, 1, 2), (1, 0))
+
+        # Reorder within a block:
+        blocks = [(0, 1), (0, 1), (0, 1)]
+        choices = [[t1], [t2], [t1]]
+        check(greedy, blocks, choices, start, (0, 1, 2), (3, 0))
+        check(minimizer, blocks, choices, start, (0, 2, 1), (2, 0))
+
+        # Never reorder across blocks (operation order or fences):
+        blocks = [(0, 1), (0, 2), (1, 1)]
+        choices = [[t2], [t1], [t2]]
+        check(minimizer, blocks, choices, start, (0, 1, 2), (3, 0))
+
+        # Look ahead to later blocks to break coverage ties:
+        blocks = [(0, 1), (1, 1)]
+        choices = [[t1, t2], [t2]]
+        check(greedy, blocks, choices, start, (0, 1), (2, 0))
+        check(minimizer, blocks, choices, start, (0, 1), (1, 0))
+
+        # Avoid machine switches before avoiding tool changes:
+        blocks = [(0, 1), (0, 1)]
+        choices = [[t3, t1], [t3, t2]]
+        check(minimizer, blocks, choices, (0, 0, 5), (0, 1), (2, 0))
+        check(greedy, [(0, 1)], [[t3]], start, (0,), (1, 1))
+
+        # Operations without a shop bit are an error:
+        for scheduler in (greedy, minimizer):
+            try:
+                scheduler.schedule([(0, 1)], [[]], start)
+                assert False, "RuntimeError not raised"  # pragma: no unit cover
+            except RuntimeError as error:
+                assert "No matching shop bit found" in str(error), str(error)
+
+        if tracing:
+            print(f"{tracing}<=Fab_OperationScheduler._unit_tests()")
+
+
+# Fab_ToolChangeScheduler:
+@dataclass
+class Fab_ToolChangeScheduler(Fab_OperationScheduler):
+    """Fab_ToolChangeScheduler: A scheduler that minimizes machine switches and tool changes.
+
+    Blocks of operations with identical (MountFence, OperationOrder) are visited in order.
+    Within a block, every operation that can use the current tool is performed first.
+    When no remaining operation can use the current tool, a new tool is selected by
+    (in order of importance):
+    1. Least machine disruption (same machine, then same shop, then another shop.)
+    2. The most remaining operations in the block that can use the tool.
+    3. The most operations in later blocks that can use the tool.
+    4. The best bit priority.
+
+    Constructor:
+    * Fab_ToolChangeScheduler()
+
+    """
+
+    # Fab_ToolChangeScheduler.schedule():
+    def schedule(self, blocks: Sequence[Tuple[int, int]],
+                 choices: Sequence[Sequence[Tuple[int, int, int]]],
+                 start: Tuple[int, int, int]) -> List[Tuple[int, int]]:
+        """Return an operation schedule that minimizes tool changes.
+
+        See Fab_OperationScheduler.schedule() for the arguments and result.
+
+        """
+        operation_index: int
+        operation_choices: Sequence[Tuple[int, int, int]]
+        for operation_index, operation_choices in enumerate(choices):
+            if not operation_choices:
+                raise RuntimeError(
+                    "Fab_ToolChangeScheduler.schedule(): No matching shop bit found.")
+
+        # Find the [low, high) operation ranges for each block:
+        ranges: List[Tuple[int, int]] = []
+        low: int = 0
+        index: int
+        for index in range(1, len(blocks) + 1):
+            if index == len(blocks) or blocks[index] != blocks[low]:
+                ranges.append((low, index))
+                low = index
+
+        # Count the operations in all later blocks that can use each tool key:
+        later_counts: List[Dict[Tuple[int, int, int], int]] = []
+        counts: Dict[Tuple[int, int, int], int] = {}
+        high: int
+        tool_key: Tuple[int, int, int]
+        for low, high in reversed(ranges):
+            later_counts.append(dict(counts))
+            for index in range(low, high):
+                for tool_key in set(choices[index]):
+                    counts[tool_key] = counts.get(tool_key, 0) + 1
+        later_counts.reverse()
+
+        def disruption(tool_key: Tuple[int, int, int]) -> int:
+            """Return 0 for the same machine, 1 for the same shop, and 2 otherwise."""
+            if tool_key[0] != current[0]:
+                return 2
+            return 0 if tool_key[1] == current[1] else 1
+
+        current: Tuple[int, int, int] = start
+        schedule: List[Tuple[int, int]] = []
+        block_index: int
+        for block_index, (low, high) in enumerate(ranges):
+            remaining: List[int] = list(range(low, high))
+            while remaining:
+                # Perform everything that can use the *current* tool:
+                unused: List[int] = []
+                for index in remaining:
+                    if current in choices[index]:
+                        schedule.append((index, list(choices[index]).index(current)))
+                    else:
+                        unused.append(index)
+                remaining = unused
+                if not remaining:
+                    break
+
+                # Select the next tool:
+                coverage: Dict[Tuple[int, int, int], int] = {}
+                best_rank: Dict[Tuple[int, int, int], int] = {}
+                for index in remaining:
+                    rank: int
+                    for rank, tool_key in enumerate(choices[index]):
+                        if tool_key not in best_rank or rank < best_rank[tool_key]:
+                            best_rank[tool_key] = rank
+                    for tool_key in set(choices[index]):
+                        coverage[tool_key] = coverage.get(tool_key, 0) + 1
+                later: Dict[Tuple[int, int, int], int] = later_counts[block_index]
+                current = min(coverage, key=lambda tool_key: (
+                    disruption(tool_key), -coverage[tool_key],
+                    -later.get(tool_key, 0), best_rank[tool_key], tool_key))
+        return schedule
+
+
 # FabMount:
 @dataclass
 class FabMount(object):
@@ -1571,6 +2959,8 @@ class FabMount(object):
       The amount the part is translated to get the origin to match CNC origin.
       This translation is applied after the mount plane has been rotated to be parallel with
       CNC XY plane.
+    * NativeGCode (bool):
+      True when FabProject.run() wrote the FabMount G-code itself, so FabCNC skips its job.
 
     The orient vector is used to ensure that a part is properly oriented on a CNC machine
     prior to machining.  Is specifies two points called *OrientStart* and *OrientEnd*.
@@ -1591,6 +2981,8 @@ class FabMount(object):
     _CNCOrient: Optional[Vector]
     _Query: Fab_Query
     _Operations: List[Fab_Operation] = field(init=False, repr=False)
+    _PocketQueries: List[Fab_Query] = field(init=False, repr=False)  # Pending pocket cuts
+    _CycleTime: Optional[Fab_CycleTime] = field(init=False, repr=False)
     _Fence: int = field(init=False, repr=False)  # Used to group operations
     _Copy: Vector = field(init=False, repr=False)  # Used for making private copies of Vector's
     _Tracing: str = field(init=False, repr=False)
@@ -1599,6 +2991,7 @@ class FabMount(object):
     _GuiDatumPlane: Any = field(init=False, repr=False)  # TODO: Remove
     _Plane: FabPlane = field(init=False, repr=False)
     Prefix: Optional[Fab_Prefix] = field(init=False, repr=False)
+    NativeGCode: bool = field(init=False, repr=False)
     _OrientAngle: float = field(init=False, repr=False)
     _OrientTranslate: Vector = field(init=False, repr=False)
 
@@ -1628,6 +3021,8 @@ class FabMount(object):
         self._Contact = self._Contact + copy
         self._Normal = self._Normal + copy
         self._Operations = []
+        self._PocketQueries = []
+        self._CycleTime = None
         # Vector metheds like to modify Vector contents; force copies beforehand:
         self._Fence = 0
         self._Plane: FabPlane = FabPlane(self._Contact, self._Normal)  # , tracing=next_tracing)
@@ -1635,6 +3030,7 @@ class FabMount(object):
         self._AppDatumPlane = None
         self._GuiDatumPlane = None
         self.Prefix = None
+        self.NativeGCode = False
 
         # Compute the *rotate* angle needed to orient the plane along the +X axis:
         plane: FabPlane = self._Plane
@@ -1797,14 +3193,45 @@ class FabMount(object):
 
         # The goal here is to minimize the number of times that a part needs to be moved between
         # shops and machines.  Each time the part has to visit another machine is annoying.
-        same_machine_operations: List[Fab_Operation] = []
+        # After that, the goal is to minimize the number of tool changes.
 
-        # Now the *expanded_operations* need to select a specific Fab_ShopBit.  The preference
-        # is to always select one from the current shop and machine.  Failing that, a machine
-        # in the same shop is preferred.  Failing that, any machine from any shop that can do
-        # the operation is selected.  *expanded_mounts* is filled with one or more copies of
+        # Now the *expanded_operations* need to select a specific Fab_ShopBit.  This is done by
+        # a Fab_OperationScheduler that is allowed to reorder operations within a fence and
+        # operation order group.  *expanded_mounts* is filled with one or more copies of
         # the current FabMount (i.e. *self*), where each individual FabMount has Fab_ShopBit's
         # are on the same machine.
+        scheduler: Any = produce_state.Scheduler
+        if not isinstance(scheduler, Fab_OperationScheduler):
+            scheduler = Fab_ToolChangeScheduler()
+        operation_keys: List[Fab_OperationKey] = [
+            operation.getInitialOperationKey() for operation in expanded_operations]
+        blocks: List[Tuple[int, int]] = [
+            (operation_key.MountFence, int(operation_key.OperationOrder))
+            for operation_key in operation_keys]
+        choices: List[Tuple[Tuple[int, int, int], ...]] = [
+            tuple([(shop_bit.ShopIndex, shop_bit.MachineIndex, shop_bit.ToolNumber)
+                   for shop_bit in operation.ShopBits])
+            for operation in expanded_operations]
+        start: Tuple[int, int, int] = (
+            produce_state.CurrentShopIndex, produce_state.CurrentMachineIndex,
+            produce_state.CurrentToolNumber)
+
+        # Compare the schedule against the original greedy schedule:
+        greedy_schedule: List[Tuple[int, int]] = (
+            Fab_OperationScheduler().schedule(blocks, choices, start))
+        schedule: List[Tuple[int, int]] = scheduler.schedule(blocks, choices, start)
+        before_changes: Tuple[int, int] = Fab_OperationScheduler.countChanges(
+            [choices[index][choice] for index, choice in greedy_schedule], start)
+        after_changes: Tuple[int, int] = Fab_OperationScheduler.countChanges(
+            [choices[index][choice] for index, choice in schedule], start)
+        produce_state.ToolChangesBefore += before_changes[0]
+        produce_state.MachineSwitchesBefore += before_changes[1]
+        produce_state.ToolChangesAfter += after_changes[0]
+        produce_state.MachineSwitchesAfter += after_changes[1]
+        if tracing:
+            print(f"{tracing}{type(scheduler).__name__}: "
+                  f"tool changes {before_changes[0]}=>{after_changes[0]}, "
+                  f"machine switches {before_changes[1]}=>{after_changes[1]}")
 
         # Helper function to create a copy of *self* that contains *operations*:
         def flush_operations(
@@ -1823,55 +3250,47 @@ class FabMount(object):
                 new_mount._Operations = copied_operations
                 expanded_mounts.append(new_mount)
 
-        # Sweep across *expanded_operations*:
+        # Sweep across *schedule*, starting a new FabMount for each machine switch:
+        same_machine_operations: List[Fab_Operation] = []
         current_shop_index: int = produce_state.CurrentShopIndex
         current_machine_index: int = produce_state.CurrentMachineIndex
-        for operation in expanded_operations:
-            same_machine_shop_bit: Optional[Fab_ShopBit] = None
-            same_shop_bit: Optional[Fab_ShopBit] = None
-            other_shop_bit: Optional[Fab_ShopBit] = None
-
-            # Sweep across *shop_bits* to select the closest to the current machine.
-            shop_bits: Tuple[Fab_ShopBit, ...] = operation.ShopBits
-            for shop_bit in shop_bits:
-                if shop_bit.ShopIndex == current_shop_index:
-                    if shop_bit.MachineIndex == current_machine_index:
-                        if same_machine_shop_bit is None:
-                            same_machine_shop_bit = shop_bit
-                            break  # This is the one to use, no need to look any further.
-                    else:  # pragma: no unit cover
-                        if same_shop_bit is None:
-                            same_shop_bit = shop_bit
-                elif other_shop_bit is None:  # pragma: no unit cover
-                    other_shop_bit = shop_bit
-
-            # Now decide if a machine switch happened:
-            if same_machine_shop_bit is not None:
-                operation.selectShopBit(same_machine_shop_bit)
-                same_machine_operations.append(operation)
-            else:  # pragma: no unit cover
-                if same_shop_bit is not None:  # pragma: no unit cover
-                    operation.selectShopBit(same_shop_bit)
-                    current_machine_index = same_shop_bit.ShopIndex
-                elif other_shop_bit is not None:  # pragma: no unit cover
-                    operation.selectShopBit(other_shop_bit)
-                    current_shop_index = other_shop_bit.ShopIndex
-                    current_machine_index = other_shop_bit.MachineIndex
-                else:  # pragma: no unit cover
-                    raise RuntimeError("FabMount.post_produce1(): No matching shop bit found.")
-                # Create operation here:
+        current_tool_number: int = produce_state.CurrentToolNumber
+        index: int
+        choice: int
+        for index, choice in schedule:
+            operation = expanded_operations[index]
+            shop_bit: Fab_ShopBit = operation.ShopBits[choice]
+            operation.selectShopBit(shop_bit)
+            if (shop_bit.ShopIndex, shop_bit.MachineIndex) != (
+                    current_shop_index, current_machine_index):  # pragma: no unit cover
                 flush_operations(same_machine_operations, expanded_mounts)
-                same_machine_operations = [operation]
+                current_shop_index = shop_bit.ShopIndex
+                current_machine_index = shop_bit.MachineIndex
+            current_tool_number = shop_bit.ToolNumber
+            same_machine_operations.append(operation)
 
         # Wrap up *expanded_operations*:
         flush_operations(same_machine_operations, expanded_mounts)
         produce_state.CurrentShopIndex = current_shop_index
         produce_state.CurrentMachineIndex = current_machine_index
+        produce_state.CurrentToolNumber = current_tool_number
 
         if tracing:
             print(f"{tracing}=>FabMount.post_produce1('{self.Name}'): "
                   f"|{before_operations_size}| => |{len(expanded_operations)}|")
 
+    # FabMount.flush_pockets():
+    def flush_pockets(self, tracing: str = "") -> None:
+        """Subtract all pending pocket tool bodies from the solid with one boolean cut."""
+        pocket_queries: List[Fab_Query] = self._PocketQueries
+        if pocket_queries:
+            if tracing:
+                print(f"{tracing}<=>FabMount.flush_pockets('{self.Name}'): "
+                      f"|{len(pocket_queries)}|")
+            solid_query: Fab_Query = self._GeometryContext.Query
+            solid_query.subtract_batch(pocket_queries)
+            self._PocketQueries = []
+
     # FabMount.post_produce2():
     def post_produce2(self, produce_state: Fab_ProduceState, tracing: str = "") -> None:
         """Perform FabMount phase 1 post production."""
@@ -1902,21 +3321,76 @@ class FabMount(object):
             assert isinstance(query, Fab_Query), query
             query.copy_workplane(plane, tracing=next_tracing)
 
-            # Process each *operation* in *operations*:
+            # Process each *operation* in *operations*.  Pocket cuts are queued up and
+            # subtracted in one batch before any other kind of operation modifies the solid:
             operation_index: int = 0
             operation: Fab_Operation
             for operation in operations:
                 if tracing:
                     print(f"{tracing}Operation[{operation.Name}]:")
+                if not isinstance(operation, Fab_Pocket):
+                    self.flush_pockets(tracing=next_tracing)
                 produce_state.OperationIndex = operation_index
                 operation.post_produce2(produce_state, tracing=next_tracing)
                 operation_index += 1
+            self.flush_pockets(tracing=next_tracing)
 
         # Install the FabMount (i.e. *self*) and *datum_plane* into *model_file* prior
         # to recursively performing the *operations*:
         if tracing:
             print(f"{tracing}<=FabMount.produce('{self.Name}')")
 
+    # FabMount.CycleTime():
+    @property
+    def CycleTime(self) -> Optional[Fab_CycleTime]:
+        """Return the FabMount estimated Fab_CycleTime (None until estimated.)"""
+        return self._CycleTime
+
+    # FabMount.estimateCycleTime():
+    def estimateCycleTime(self, tool_controllers: Dict[int, FabToolController],
+                          current_tool: Tuple[int, int, int],
+                          tracing: str = "") -> Tuple[Fab_CycleTime, Tuple[int, int, int]]:
+        """Estimate the cycle time of each FabMount operation after post_produce2().
+
+        Arguments:
+        * *tool_controllers* (Dict[int, FabToolController]):
+          A table that maps a ToolControllerIndex to its FabToolController.
+        * *current_tool* (Tuple[int, int, int]):
+          The (ShopIndex, MachineIndex, ToolNumber) that is loaded before the first operation.
+
+        Returns:
+        * (Fab_CycleTime): The total Fab_CycleTime for the FabMount.
+        * (Tuple[int, int, int]): The tool key that is loaded after the last operation.
+
+        """
+        if tracing:
+            print(f"{tracing}=>FabMount({self.Name}).estimateCycleTime(*, {current_tool})")
+        total: Fab_CycleTime = Fab_CycleTime()
+        operation: Fab_Operation
+        for operation in self._Operations:
+            shop_bit: Optional[Fab_ShopBit] = operation.SelectedShopBit
+            if operation.ToolControllerIndex < 0 or shop_bit is None:
+                continue  # Nothing is machined for this operation.
+            tool_controller: FabToolController = (
+                tool_controllers[operation.ToolControllerIndex])
+            cycle_time: Fab_CycleTime = operation.estimateCycleTime(tool_controller)
+            tool_key: Tuple[int, int, int] = (
+                shop_bit.ShopIndex, shop_bit.MachineIndex, shop_bit.ToolNumber)
+            if tool_key != current_tool:
+                machine: FabMachine = shop_bit.Machine
+                tool_change_time: float = (
+                    machine.ToolChangeTime if isinstance(machine, FabCNC) else 0.0)
+                cycle_time = cycle_time.add(Fab_CycleTime(ToolChange=tool_change_time))
+                current_tool = tool_key
+            operation.CycleTime = cycle_time
+            total = total.add(cycle_time)
+            if tracing:
+                print(f"{tracing}{operation.Name}: {cycle_time.Total:.1f}s")
+        self._CycleTime = total
+        if tracing:
+            print(f"{tracing}<=FabMount({self.Name}).estimateCycleTime()=>{total.Total:.1f}s")
+        return total, current_tool
+
     # FabMount.to_json():
     def to_json(self) -> Dict[str, Any]:
         """Return FabMount JSON structure."""
@@ -1943,6 +3417,10 @@ class FabMount(object):
             "_OrientStart": [orient_start.x, orient_start.y, orient_start.z],
             "children": json_operations,
         }
+        if self._CycleTime:
+            json_dict["CycleTime"] = self._CycleTime.to_json()
+        if self.NativeGCode:
+            json_dict["_NativeGCode"] = True
         return json_dict
 
     # FabMount.extrude():
@@ -2062,44 +3540,55 @@ class FabMount(object):
         hole_name: str
         hole_key: Fab_HoleKey
         join_index: int  # Used for forcing individual drill operations (see below):
-        for join_index, join in enumerate(joins):
-            assert isinstance(join, FabJoin), f"{type(join)} is not a FabJoin"
-            fasten: FabFasten = join.Fasten
 
+        # Only visit the *mount_normal* aligned *joins* whose bounding boxes overlap *solid*:
+        joins_index: Fab_JoinIndex = Fab_JoinIndex.lookup(joins)
+        aligned_indices: List[int] = []
+        for join_index in joins_index.query(solid):
+            join = joins[join_index]
+            assert isinstance(join, FabJoin), f"{type(join)} is not a FabJoin"
             if join.normal_aligned(mount_normal):
+                aligned_indices.append(join_index)
+
+        # Intersect all of the aligned join segments with *solid* in one vectorized batch:
+        intersects: Any
+        trimmed_starts_array: Any
+        trimmed_ends_array: Any
+        intersects, trimmed_starts_array, trimmed_ends_array = solid.intersect_segments(
+            [joins[join_index].Start for join_index in aligned_indices],
+            [joins[join_index].End for join_index in aligned_indices])
+
+        aligned_index: int
+        for aligned_index, join_index in enumerate(aligned_indices):
+            if intersects[aligned_index]:
+                join = joins[join_index]
+                fasten: FabFasten = join.Fasten
                 join_start: Vector = join.Start
-                join_end: Vector = join.End
-                # if tracing:
-                #     print(f"{tracing}>>>>>>>>{join.Name} "
-                #            f"aligns {solid.Name}: {join_start}=>{join_end}")
-                intersect: bool
-                trimmed_start: Vector
-                trimmed_end: Vector
-                intersect, trimmed_start, trimmed_end = solid.intersect(join_start, join_end)
-                if intersect:
-                    trimmed_length: float = (trimmed_start - trimmed_end).Length
-                    trimmed_depth: float = min(trimmed_length, mount_depth)
-                    if tracing:
-                        print(f"{tracing}>>>>>>>>>>>>>>>>{join.Name} intesects {solid.Label}")
-                        # print(f"{tracing}{solid.Name} Box: {solid.TNE} : {solid.BSW}")
-                        # print(f"{tracing}Join:    {join_start} => {join_end}")
-                        # nprint(f"{tracing}Trimmed: {trimmed_start} => {trimmed_end}")
-                        # print(f"{tracing}Mount - Depth: {mount_start} {trimmed_depth}")
-                    is_top: bool = close(join_start, trimmed_start)
-                    # TODO: figure out *kind*:
-                    kind: str = "close"  # or "thread", or "loose"
-                    if tracing:
-                        print(f"{tracing}{mount_depth=} {trimmed_depth=}")
-                    assert trimmed_depth > 0.0, trimmed_depth
-                    # unique: int = -1 if mount_z_aligned else join_index
-                    hole_name = f"{joins_name}_{join_index}"
-                    hole_key = Fab_HoleKey(fasten.ThreadName, kind, trimmed_depth, is_top)
-
-                    # Compatible *trimmed_start*'s are collected in *hole_groups*:
-                    if hole_key not in hole_groups:
-                        hole_groups[hole_key] = []
-                    hole_info = (join, join_index, trimmed_start, hole_name)
-                    hole_groups[hole_key].append(hole_info)
+                trimmed_start: Vector = Vector(*trimmed_starts_array[aligned_index].tolist())
+                trimmed_end: Vector = Vector(*trimmed_ends_array[aligned_index].tolist())
+                trimmed_length: float = (trimmed_start - trimmed_end).Length
+                trimmed_depth: float = min(trimmed_length, mount_depth)
+                if tracing:
+                    print(f"{tracing}>>>>>>>>>>>>>>>>{join.Name} intesects {solid.Label}")
+                    # print(f"{tracing}{solid.Name} Box: {solid.TNE} : {solid.BSW}")
+                    # print(f"{tracing}Join:    {join_start} => {join.End}")
+                    # nprint(f"{tracing}Trimmed: {trimmed_start} => {trimmed_end}")
+                    # print(f"{tracing}Mount - Depth: {mount_start} {trimmed_depth}")
+                is_top: bool = close(join_start, trimmed_start)
+                # TODO: figure out *kind*:
+                kind: str = "close"  # or "thread", or "loose"
+                if tracing:
+                    print(f"{tracing}{mount_depth=} {trimmed_depth=}")
+                assert trimmed_depth > 0.0, trimmed_depth
+                # unique: int = -1 if mount_z_aligned else join_index
+                hole_name = f"{joins_name}_{join_index}"
+                hole_key = Fab_HoleKey(fasten.ThreadName, kind, trimmed_depth, is_top)
+
+                # Compatible *trimmed_start*'s are collected in *hole_groups*:
+                if hole_key not in hole_groups:
+                    hole_groups[hole_key] = []
+                hole_info = (join, join_index, trimmed_start, hole_name)
+                hole_groups[hole_key].append(hole_info)
 
         # Create *grouped_holes* where each *group_hole* has the same *key*.
         grouped_holes: List[Fab_Hole] = []
@@ -2138,6 +3627,9 @@ class FabSolid(FabNode):
     * *Color* (str): The color to use.
     * *CNCBox* (Optional[FabBox]):
       The FabBox the encloses the initial FabSolid extrusion.  (Default: None)
+    * *CNCDepth* (float): The depth of the initial FabSolid extrusion.  (Default: 0.0)
+    * *CNCOutline* (Tuple[Tuple[float, float], ...]):
+      The X/Y corners of the initial FabSolid extrusion outline.  (Default: ())
 
     Constructor:
     * FabSolid("Name", Parent, Material, Color)
@@ -2154,6 +3646,9 @@ class FabSolid(FabNode):
     _StepFile: Optional[PathFile] = field(init=False, repr=False)
     _Color: Optional[Tuple[float, ...]] = field(init=False, repr=False)
     _CNCBox: Optional[FabBox] = field(init=False, repr=False)
+    _CNCDepth: float = field(init=False, repr=False)
+    _CNCOutline: Tuple[Tuple[float, float], ...] = field(init=False, repr=False)
+    _CycleTime: Optional[Fab_CycleTime] = field(init=False, repr=False)
     Prefix: Fab_Prefix = field(init=False, repr=False)
     MountOperationPrefixes: Dict[str, Dict[str, Fab_Prefix]] = field(init=False, repr=False)
 
@@ -2180,6 +3675,9 @@ class FabSolid(FabNode):
         self._StepFile = None
         self._Color = None
         self._CNCBox = None
+        self._CNCDepth = 0.0
+        self._CNCOutline = ()
+        self._CycleTime = None
         # See FabSolid.lookup_prefix() for an explanation of MountOperationPrefixes.
         self.MountOperationPrefixes = {}
 
@@ -2301,25 +3799,80 @@ class FabSolid(FabNode):
         assert self._CNCBox is None, "CNCBox is already set"
         self._CNCBox = cnc_box
 
+    # FabSolid.CNCDepth:
+    @property
+    def CNCDepth(self) -> float:  # pragma: no unit cover
+        """Return the depth of the initial extrusion."""
+        return self._CNCDepth
+
+    @CNCDepth.setter
+    def CNCDepth(self, cnc_depth: float) -> None:  # pragma: no unit cover
+        """Set the CNC depth for FabSolid."""
+        self._CNCDepth = cnc_depth
+
+    # FabSolid.CNCOutline:
+    @property
+    def CNCOutline(self) -> Tuple[Tuple[float, float], ...]:  # pragma: no unit cover
+        """Return the X/Y outline corners of the initial extrusion."""
+        return self._CNCOutline
+
+    @CNCOutline.setter
+    def CNCOutline(
+            self, cnc_outline: Tuple[Tuple[float, float], ...]) -> None:  # pragma: no unit cover
+        """Set the CNC outline for FabSolid."""
+        self._CNCOutline = cnc_outline
+
+    # FabSolid.Mounts:
+    @property
+    def Mounts(self) -> Tuple[FabMount, ...]:
+        """Return the FabMount's that have operations."""
+        mount: FabMount
+        return tuple([mount for mount in self._Mounts if len(mount._Operations) > 0])
+
     # FabSolid.to_json():
-    def to_json(self) -> Dict[str, Any]:
+    def to_json(self, children: bool = True) -> Dict[str, Any]:
         """Return FabProject JSON structure."""
-        json_dict: Dict[str, Any] = super().to_json()
+        json_dict: Dict[str, Any] = super().to_json(children)
         json_dict["Kind"] = "Solid"
         if self._StepFile:
             json_dict["StepFile"] = str(self._StepFile)
         if self._Color:
             json_dict["_Color"] = self._Color  # pragma: no unit cover
-        json_mounts: List[Any] = []
-        name: str
         mount: FabMount
-        for mount in self._Mounts:
-            # Skip mount if it has no operations.
-            if len(mount._Operations) > 0:
-                json_mounts.append(mount.to_json())
-        json_dict["children"] = json_mounts
+        json_dict["children"] = [mount.to_json() for mount in self.Mounts]
+        if self._CycleTime:
+            json_dict["CycleTime"] = self._CycleTime.to_json()
         return json_dict
 
+    # FabSolid.CycleTime():
+    @property
+    def CycleTime(self) -> Optional[Fab_CycleTime]:
+        """Return the FabSolid estimated Fab_CycleTime (None until estimated.)"""
+        return self._CycleTime
+
+    # FabSolid.estimateCycleTime():
+    def estimateCycleTime(
+            self, produce_state: Fab_ProduceState, tracing: str = "") -> Fab_CycleTime:
+        """Estimate the FabSolid cycle time after post_produce2() across all mounts."""
+        next_tracing: str = tracing + " " if tracing else ""
+        if tracing:
+            print(f"{tracing}=>FabSolid({self.Label}).estimateCycleTime()")
+        tool_controllers: Dict[int, FabToolController] = {
+            index: tool_controller
+            for tool_controller, index in produce_state.ToolControllersTable.items()}
+        current_tool: Tuple[int, int, int] = (0, 0, -1)
+        total: Fab_CycleTime = Fab_CycleTime()
+        mount: FabMount
+        for mount in self._Mounts:
+            mount_cycle_time: Fab_CycleTime
+            mount_cycle_time, current_tool = mount.estimateCycleTime(
+                tool_controllers, current_tool, tracing=next_tracing)
+            total = total.add(mount_cycle_time)
+        self._CycleTime = total
+        if tracing:
+            print(f"{tracing}<=FabSolid({self.Label}).estimateCycleTime()=>{total.Total:.1f}s")
+        return total
+
     # FabSolid.set_body():
     def set_body(self, body: Any) -> None:
         """Set the BodyBase of a FabSolid."""
@@ -2348,9 +3901,10 @@ class FabSolid(FabNode):
         if tracing:
             print(f"{tracing}=>FabSolid.post_produce1({self.Label})")
 
-        # Reset the preferred shop and machine.
+        # Reset the preferred shop and machine.  The current tool is carried across mounts.
         produce_state.CurrentShopIndex = 0
         produce_state.CurrentMachineIndex = 0
+        produce_state.CurrentToolNumber = -1
 
         # Expand the operations for each *mount*:
         mount: FabMount
@@ -2545,6 +4099,385 @@ class FabSolid(FabNode):
             print(f"{tracing}<=>FabSolid._unit_tests()")
 
 
+# Fab_FleetJob:
+@dataclass(frozen=True)
+class Fab_FleetJob(object):
+    """Fab_FleetJob: One FabMount (or other unit of work) to be run on one machine.
+
+    Attributes:
+    * *Name* (str): The job name.
+    * *Chain* (str):
+      The chain name.  Jobs with the same chain (e.g. the mounts of one FabSolid copy) are run
+      one after another in *Step* order.
+    * *Step* (int): The order of the job within its chain.
+    * *Durations* (Tuple[Tuple[Tuple[int, int], float], ...]):
+      The ((ShopIndex, MachineIndex), seconds) for each machine that can run the job.
+
+    Constructor:
+    * Fab_FleetJob(Name, Chain, Step, Durations)
+
+    """
+
+    Name: str
+    Chain: str
+    Step: int
+    Durations: Tuple[Tuple[Tuple[int, int], float], ...]
+
+    # Fab_FleetJob.__post_init__():
+    def __post_init__(self) -> None:
+        """Finish initializing Fab_FleetJob."""
+        check_type("Fab_FleetJob.Name", self.Name, str)
+        check_type("Fab_FleetJob.Chain", self.Chain, str)
+        check_type("Fab_FleetJob.Step", self.Step, int)
+        check_type("Fab_FleetJob.Durations", self.Durations,
+                   Tuple[Tuple[Tuple[int, int], float], ...])
+        if not self.Durations:
+            raise RuntimeError(f"Fab_FleetJob.__post_init__(): {self.Name} has no machines")
+
+    # Fab_FleetJob.MinimumDuration():
+    @property
+    def MinimumDuration(self) -> float:
+        """Return the shortest duration over all of the machines."""
+        duration: float
+        return min([duration for _, duration in self.Durations])
+
+
+# Fab_FleetAssignment:
+@dataclass(frozen=True)
+class Fab_FleetAssignment(object):
+    """Fab_FleetAssignment: A Fab_FleetJob assigned to a machine.
+
+    Attributes:
+    * *Job* (Fab_FleetJob): The assigned job.
+    * *Machine* (Tuple[int, int]): The (ShopIndex, MachineIndex) of the machine.
+    * *Start* (float): The start time in seconds.
+    * *Finish* (float): The finish time in seconds.
+
+    """
+
+    Job: Fab_FleetJob
+    Machine: Tuple[int, int]
+    Start: float
+    Finish: float
+
+    # Fab_FleetAssignment.to_json():
+    def to_json(self) -> Dict[str, Any]:
+        """Return a JSON representation of a Fab_FleetAssignment."""
+        return {
+            "Name": self.Job.Name,
+            "Chain": self.Job.Chain,
+            "Start": round(self.Start, 1),
+            "Finish": round(self.Finish, 1),
+        }
+
+
+# FabFleetSchedule:
+@dataclass
+class FabFleetSchedule(object):
+    """FabFleetSchedule: The per-machine job queues produced by FabFleetScheduler.
+
+    Attributes:
+    * *Queues* (Dict[Tuple[int, int], List[Fab_FleetAssignment]]):
+      The time ordered Fab_FleetAssignment's for each (ShopIndex, MachineIndex).
+    * *MachineNames* (Dict[Tuple[int, int], str]):
+      The "Shop/Machine" name for each (ShopIndex, MachineIndex).
+    * *Makespan* (float): The time in seconds when the last job finishes.
+
+    Constructor:
+    * FabFleetSchedule(Queues, MachineNames)
+
+    """
+
+    Queues: Dict[Tuple[int, int], List[Fab_FleetAssignment]]
+    MachineNames: Dict[Tuple[int, int], str]
+
+    # FabFleetSchedule.Makespan():
+    @property
+    def Makespan(self) -> float:
+        """Return the time when the last job finishes."""
+        queue: List[Fab_FleetAssignment]
+        return max([queue[-1].Finish for queue in self.Queues.values() if queue], default=0.0)
+
+    # FabFleetSchedule.getLoads():
+    def getLoads(self) -> Dict[Tuple[int, int], float]:
+        """Return the total busy seconds for each machine."""
+        machine: Tuple[int, int]
+        queue: List[Fab_FleetAssignment]
+        assignment: Fab_FleetAssignment
+        return {machine: sum([assignment.Finish - assignment.Start for assignment in queue])
+                for machine, queue in self.Queues.items()}
+
+    # FabFleetSchedule.to_json():
+    def to_json(self) -> Dict[str, Any]:
+        """Return a JSON representation of a FabFleetSchedule."""
+        loads: Dict[Tuple[int, int], float] = self.getLoads()
+        machine: Tuple[int, int]
+        queue: List[Fab_FleetAssignment]
+        assignment: Fab_FleetAssignment
+        return {
+            "Makespan": round(self.Makespan, 1),
+            "Machines": [{
+                "Name": self.MachineNames.get(machine, str(machine)),
+                "Load": round(loads[machine], 1),
+                "Queue": [assignment.to_json() for assignment in queue],
+            } for machine, queue in sorted(self.Queues.items())],
+        }
+
+
+# FabFleetScheduler:
+@dataclass
+class FabFleetScheduler(object):
+    """FabFleetScheduler: Plans batch production of many FabSolid's across FabShops machines.
+
+    Each FabMount of each FabSolid copy becomes a Fab_FleetJob.  A FabMount can run on its own
+    machine or on any other machine that holds all of the bits (by name) that the FabMount
+    operations selected.  Its duration on a machine is the estimated cutting, plunging and rapid
+    time, plus the machine *ToolChangeTime* for each tool change, plus *SetupTime*.  The mounts
+    of one FabSolid copy are run in order.  The jobs are list scheduled: the ready job with the
+    most remaining chain work (i.e. longest processing time first) is assigned to the machine
+    where it would finish earliest.  This is a greedy heuristic that keeps the makespan low;
+    it does not search for an optimal schedule.
+
+    Attributes:
+    * *Shops* (FabShops): The FabShops with the machines to use.
+    * *SetupTime* (float): The seconds to fixture a part for each mount.  (Default: 0.0)
+
+    Constructor:
+    * FabFleetScheduler(Shops, SetupTime)
+
+    """
+
+    Shops: FabShops
+    SetupTime: float = 0.0
+
+    # FabFleetScheduler.__post_init__():
+    def __post_init__(self) -> None:
+        """Finish initializing FabFleetScheduler."""
+        check_type("FabFleetScheduler.Shops", self.Shops, FabShops)
+        check_type("FabFleetScheduler.SetupTime", self.SetupTime, float)
+
+    # FabFleetScheduler.schedule():
+    @staticmethod
+    def schedule(jobs: Sequence[Fab_FleetJob],
+                 tracing: str = "") -> Dict[Tuple[int, int], List[Fab_FleetAssignment]]:
+        """Return per-machine queues of Fab_FleetAssignment's for some Fab_FleetJob's."""
+        if tracing:
+            print(f"{tracing}=>FabFleetScheduler.schedule(*{len(jobs)})")
+
+        # Group the jobs into chains and compute the remaining work from each job onward:
+        chains: Dict[str, List[Fab_FleetJob]] = {}
+        job: Fab_FleetJob
+        for job in jobs:
+            if job.Chain not in chains:
+                chains[job.Chain] = []
+            chains[job.Chain].append(job)
+        chain: List[Fab_FleetJob]
+        remaining: Dict[int, float] = {}
+        for chain in chains.values():
+            chain.sort(key=lambda job: job.Step)
+            tail: float = 0.0
+            for job in reversed(chain):
+                tail += job.MinimumDuration
+                remaining[id(job)] = tail
+
+        queues: Dict[Tuple[int, int], List[Fab_FleetAssignment]] = {}
+        machine_free: Dict[Tuple[int, int], float] = {}
+        chain_free: Dict[str, float] = {name: 0.0 for name in chains}
+        chain_next: Dict[str, int] = {name: 0 for name in chains}
+        ready: List[str] = sorted(chains.keys())
+        while ready:
+            # Pick the ready job with the most remaining work (ties by name):
+            name: str = min(ready, key=lambda name: (
+                -remaining[id(chains[name][chain_next[name]])],
+                -chains[name][chain_next[name]].MinimumDuration, name))
+            job = chains[name][chain_next[name]]
+
+            # Assign it to the machine where it finishes earliest:
+            best: Optional[Tuple[float, Tuple[int, int], float]] = None
+            machine: Tuple[int, int]
+            duration: float
+            for machine, duration in sorted(job.Durations):
+                start: float = max(machine_free.get(machine, 0.0), chain_free[name])
+                finish: float = start + duration
+                if best is None or finish < best[0] - 1.0e-9:
+                    best = (finish, machine, start)
+            assert best is not None
+            finish, machine, start = best
+            if machine not in queues:
+                queues[machine] = []
+            queues[machine].append(Fab_FleetAssignment(job, machine, start, finish))
+            machine_free[machine] = finish
+            chain_free[name] = finish
+            chain_next[name] += 1
+            if chain_next[name] >= len(chains[name]):
+                ready.remove(name)
+            if tracing:
+                print(f"{tracing}{job.Name}: {machine} {start:.1f}-{finish:.1f}")
+
+        if tracing:
+            print(f"{tracing}<=FabFleetScheduler.schedule(*{len(jobs)})")
+        return queues
+
+    # FabFleetScheduler.getJobs():
+    def getJobs(self, solids: Sequence[FabSolid], quantity: int = 1) -> List[Fab_FleetJob]:
+        """Return the Fab_FleetJob's for *quantity* copies of each FabSolid.
+
+        The FabSolid cycle times must already have been estimated (see FabProject.run().)
+        A RuntimeError is raised when no machine holds all of the bits that a FabMount needs.
+        """
+        if quantity < 1:
+            raise RuntimeError(
+                f"FabFleetScheduler.getJobs(): quantity ({quantity}) is not positive")
+
+        # Collect the bit names available on each machine:
+        machine_bits: Dict[Tuple[int, int], Set[str]] = {}
+        machine_tool_change: Dict[Tuple[int, int], float] = {}
+        shop_bit: Fab_ShopBit
+        for shop_bit in self.Shops.AllShopBits:
+            key: Tuple[int, int] = (shop_bit.ShopIndex, shop_bit.MachineIndex)
+            if key not in machine_bits:
+                machine_bits[key] = set()
+                machine_tool_change[key] = (shop_bit.Machine.ToolChangeTime
+                                            if isinstance(shop_bit.Machine, FabCNC) else 0.0)
+            machine_bits[key].add(shop_bit.Bit.Name)
+
+        jobs: List[Fab_FleetJob] = []
+        solid: FabSolid
+        for solid in solids:
+            durations_list: List[Tuple[Tuple[Tuple[int, int], float], ...]] = []
+            mount_names: List[str] = []
+            mount: FabMount
+            for mount in solid._Mounts:
+                if mount.CycleTime is None:
+                    raise RuntimeError(
+                        f"FabFleetScheduler.getJobs(): {solid.Label}.{mount.Name} has no "
+                        "cycle time estimate")
+                bit_names: Set[str] = set()
+                machine_keys: Set[Tuple[int, int]] = set()
+                tool_changes: int = 0
+                machining: float = 0.0
+                operation: Fab_Operation
+                for operation in mount._Operations:
+                    selected: Optional[Fab_ShopBit] = operation.SelectedShopBit
+                    cycle_time: Optional[Fab_CycleTime] = operation.CycleTime
+                    if selected is None or cycle_time is None:
+                        continue
+                    bit_names.add(selected.Bit.Name)
+                    machine_keys.add((selected.ShopIndex, selected.MachineIndex))
+                    machining += cycle_time.Cutting + cycle_time.Plunging + cycle_time.Rapid
+                    tool_changes += 1 if cycle_time.ToolChange > 0.0 else 0
+                if not machine_keys:
+                    continue  # Nothing is machined in this mount.
+                machine: Tuple[int, int]
+                bits: Set[str]
+                durations: Tuple[Tuple[Tuple[int, int], float], ...] = tuple([
+                    (machine, self.SetupTime + machining +
+                     tool_changes * machine_tool_change[machine])
+                    for machine, bits in sorted(machine_bits.items())
+                    if bit_names <= bits])
+                if not durations:
+                    raise RuntimeError(
+                        "FabFleetScheduler.getJobs(): No machine has all of the bits "
+                        f"{sorted(bit_names)} for {solid.Label}.{mount.Name}")
+                durations_list.append(durations)
+                mount_names.append(mount.Name)
+            copy: int
+            for copy in range(quantity):
+                step: int
+                for step, durations in enumerate(durations_list):
+                    jobs.append(Fab_FleetJob(f"{solid.Label}#{copy}.{mount_names[step]}",
+                                             f"{solid.Label}#{copy}", step, durations))
+        return jobs
+
+    # FabFleetScheduler.scheduleSolids():
+    def scheduleSolids(self, solids: Sequence[FabSolid], quantity: int = 1,
+                       tracing: str = "") -> FabFleetSchedule:
+        """Return the FabFleetSchedule to make *quantity* copies of each FabSolid.
+
+        The FabSolid's can come from any number of FabProject's (see FabProject.getSolids().)
+        """
+        next_tracing: str = tracing + " " if tracing else ""
+        if tracing:
+            print(f"{tracing}=>FabFleetScheduler.scheduleSolids(*{len(solids)}, {quantity})")
+        jobs: List[Fab_FleetJob] = self.getJobs(solids, quantity)
+        queues: Dict[Tuple[int, int], List[Fab_FleetAssignment]] = FabFleetScheduler.schedule(
+            jobs, tracing=next_tracing)
+        machine_names: Dict[Tuple[int, int], str] = {}
+        shop_index: int
+        shop: FabShop
+        for shop_index, shop in enumerate(self.Shops.Shops):
+            machine_index: int
+            machine: FabMachine
+            for machine_index, machine in enumerate(shop.Machines):
+                machine_names[(shop_index, machine_index)] = f"{shop.Name}/{machine.Name}"
+        schedule: FabFleetSchedule = FabFleetSchedule(queues, machine_names)
+        if tracing:
+            print(f"{tracing}<=FabFleetScheduler.scheduleSolids()=>{schedule.Makespan:.1f}s")
+        return schedule
+
+    # FabFleetScheduler._unit_tests():
+    @staticmethod
+    def _unit_tests(tracing: str = "") -> None:
+        """Run FabFleetScheduler unit tests."""
+        next_tracing: str = tracing + " " if tracing else ""
+        if tracing:
+            print(f"{tracing}=>FabFleetScheduler._unit_tests()")
+
+        a: Tuple[int, int] = (0, 0)
+        b: Tuple[int, int] = (0, 1)
+
+        # LPT on two identical machines: A gets 7, 4, 3 and B gets 6, 5:
+        duration: float
+        jobs: List[Fab_FleetJob] = [
+            Fab_FleetJob(f"J{int(duration)}", f"C{int(duration)}", 0,
+                         ((a, duration), (b, duration)))
+            for duration in (3.0, 5.0, 7.0, 4.0, 6.0)]
+        queues: Dict[Tuple[int, int], List[Fab_FleetAssignment]] = FabFleetScheduler.schedule(
+            jobs, tracing=next_tracing)
+        assignment: Fab_FleetAssignment
+        assert [assignment.Job.Name for assignment in queues[a]] == ["J7", "J4", "J3"], queues
+        assert [assignment.Job.Name for assignment in queues[b]] == ["J6", "J5"], queues
+        schedule: FabFleetSchedule = FabFleetSchedule(queues, {a: "Shop/A", b: "Shop/B"})
+        assert schedule.Makespan == 14.0, schedule.Makespan
+        assert schedule.getLoads() == {a: 14.0, b: 11.0}, schedule.getLoads()
+        assert schedule.to_json()["Machines"][1]["Name"] == "Shop/B"
+
+        # A chain only runs on A, so the other job goes to B and the chain steps stay in order:
+        jobs = [
+            Fab_FleetJob("X1", "X", 1, ((a, 5.0),)),
+            Fab_FleetJob("X0", "X", 0, ((a, 5.0),)),
+            Fab_FleetJob("Y0", "Y", 0, ((a, 4.0), (b, 4.0))),
+        ]
+        queues = FabFleetScheduler.schedule(jobs)
+        assert [(assignment.Job.Name, assignment.Start) for assignment in queues[a]] == [
+            ("X0", 0.0), ("X1", 5.0)], queues[a]
+        assert [assignment.Job.Name for assignment in queues[b]] == ["Y0"], queues[b]
+
+        # A chain step waits for the previous step even when its machine is idle:
+        jobs = [
+            Fab_FleetJob("P0", "P", 0, ((a, 6.0),)),
+            Fab_FleetJob("P1", "P", 1, ((b, 2.0),)),
+        ]
+        queues = FabFleetScheduler.schedule(jobs)
+        assert queues[b][0].Start == 6.0 and queues[b][0].Finish == 8.0, queues[b]
+
+        # A slower machine is used only when it finishes earlier:
+        jobs = [Fab_FleetJob(f"S{index}", f"S{index}", 0, ((a, 2.0), (b, 5.0)))
+                for index in range(3)]
+        queues = FabFleetScheduler.schedule(jobs)
+        assert len(queues[a]) == 2 and len(queues[b]) == 1, queues
+
+        try:
+            Fab_FleetJob("Empty", "E", 0, ())
+            assert False  # pragma: no unit cover
+        except RuntimeError as runtime_error:
+            assert str(runtime_error) == (
+                "Fab_FleetJob.__post_init__(): Empty has no machines"), str(runtime_error)
+
+        if tracing:
+            print(f"{tracing}<=FabFleetScheduler._unit_tests()")
+
+
 # TODO: Remove
 def visibility_set(element: Any, new_value: bool = True, tracing: str = "") -> None:
     """Set the visibility of an element."""
@@ -2560,11 +4493,17 @@ def main(tracing: str = "") -> None:
     if tracing:
         print(f"{tracing}=>FabSolids.main()")
 
+    Fab_CycleTime._unit_tests(tracing=next_tracing)
+    FabFleetScheduler._unit_tests(tracing=next_tracing)
     Fab_HoleKey._unit_tests(tracing=next_tracing)
+    Fab_JoinIndex._unit_tests(tracing=next_tracing)
     Fab_OperationOrder._unit_tests(tracing=next_tracing)
+    Fab_OperationScheduler._unit_tests(tracing=next_tracing)
+    Fab_PointOrder._unit_tests(tracing=next_tracing)
     Fab_OperationKind._unit_tests(tracing=next_tracing)
     Fab_OperationKey._unitTests(tracing=next_tracing)
     FabStock._unit_tests(tracing=next_tracing)
+    FabNester._unit_tests(tracing=next_tracing)
     FabSolid._unit_tests(tracing=next_tracing)
 
     if tracing:
@@ -15,12 +15,18 @@ The Utility classes are:
 
 # <--------------------------------------- 100 characters ---------------------------------------> #
 
-from dataclasses import dataclass
+import math
+import tempfile
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from pathlib import Path as PathFile
 from typeguard import check_type, check_argument_types
-from typing import Any, ClassVar, Dict, List, Tuple
+from typing import Any, ClassVar, Dict, IO, List, Sequence, Tuple
 
-from FabShops import FabCNC, FabMachine, Fab_ShopBit
-from FabToolBits import FabDrillBit
+from FabShops import FabAxis, FabCNC, FabController, FabLocation, FabMachine, FabShop
+from FabShops import Fab_ShopBit, FabSpindle, FabTable
+from FabToolBits import FabDrillBit, FabEndMillBit
+from FabTools import FabLibrary
 from FabToolTemplates import FabBit
 
 
@@ -224,14 +230,17 @@ class FabMaterial(object):
     Attributes:
     * *Name* (Tuple[str, ...]): A list of material names from generic to specific.
     * *Color* (str): The color name to use.
+    * *Interpolate* (bool):
+      True to linearly interpolate chip loads between table diameters.  (Default: False)
 
     # Constructor:
-    * * FabMaterial(Name, Color)
+    * * FabMaterial(Name, Color, Interpolate)
 
     """
 
     Name: Tuple[str, ...]  # Hierarchical name from generic to specific.
     Color: str  # SVG color name to use.
+    Interpolate: bool = False  # Interpolate chip loads between table diameters.
 
     # By the way the two tables below do no match up very well.
     _InchChipLoadData: ClassVar[Tuple[str, ...]] = (  # IPT == inch per tooth
@@ -263,90 +272,155 @@ class FabMaterial(object):
         "25: 0.04-0.08 0.03-0.07 0.05-0.09 0.03-0.06 0.06-0.12 0.11-0.22",
     )
 
-    _ChipLoadTable: ClassVar[Dict[str, List[Tuple[float, float]]]] = {}
+    # The chip load table is built from the data tables above when the module is imported.
+    # Each material maps to a sorted tuple of diameters and a matching tuple of chip loads.
+    _ChipLoadTable: ClassVar[Dict[str, Tuple[Tuple[float, ...], Tuple[float, ...]]]] = {}
+
+    # Specific cutting energy (i.e. unit power) in joules per cubic millimeter of material removed.
+    # These are typical mid-range values; 1 hp*min/in^3 is approximately 2.73 J/mm^3.
+    _SpecificCuttingEnergyTable: ClassVar[Dict[str, float]] = {
+        "aluminum": 0.7,
+        "plastic": 0.2,
+        "stainless": 3.5,
+        "steel": 2.7,
+        "titanium": 3.5,
+        "wood": 0.1,
+    }
 
     # FabMaterial.__post_init__():
     def __post_init__(self) -> None:
         """Finish initialized FabMaterial."""
-        tracing: str = ""  # Manually set to non-empty string to trace:
-        if tracing:
-            print(f"{tracing}=>FabMaterial.__post_init__()")
-
         check_type("FabMaterial.Name", self.Name, Tuple[str, ...])
         check_type("FabMaterial.Color", self.Color, str)
+        check_type("FabMaterial.Interpolate", self.Interpolate, bool)
+
+    # FabMaterial.loadChipLoadData():
+    @staticmethod
+    def loadChipLoadData(chip_load_data: Sequence[str], tracing: str = "") -> Tuple[str, ...]:
+        """Merge a chip load data table into the FabMaterial chip load table.
+
+        The first line is a header of the form "in: Material1 Material2 ..." (inches per tooth)
+        or "mm: Material1 Material2 ..." (millimeters per tooth.)  Each remaining line is of
+        the form "Diameter: Low-High Low-High ..." where the diameter can be a fraction
+        (e.g. "3/16".)  The chip load for each diameter is the average of the Low/High range.
+        An optional row of the form "energy: Energy1 Energy2 ..." specifies the specific cutting
+        energy of each material in J/mm^3 (see FabMaterial.getSpecificCuttingEnergy().)
+        Blank lines and lines starting with "#" are ignored.
 
-        # Fill in the *chip_load_table* the first time any FabMaterial is created:
-        chip_load_table: Dict[str, List[Tuple[float, float]]] = FabMaterial._ChipLoadTable
-        if len(chip_load_table) == 0:
-            # Iterate over both of the *chip_load_data* tables:
-            convert_chip_load_datas: List[Tuple[float, Tuple[str, ...], bool]] = [
-                (25.4, FabMaterial._InchChipLoadData, True),  # 1 inch = 25.4 mm
-                (1.0, FabMaterial._MmChipLoadData, False),
-            ]
-
-            def words_split(words: str) -> List[str]:
-                """"""
-                word: str
-                return [word for word in words.split(" ") if len(word) > 0]
-
-            convert: float
-            chip_load_data: Tuple[str, ...]
-            initialize: bool
-            for convert, chip_load_data, initialize in convert_chip_load_datas:
-                if tracing:
-                    print(f"{tracing}{convert=} {initialize=}")
-                # Extract the *materials* names:
-                materials: List[str] = [material.lower()
-                                        for material in words_split(chip_load_data[0])]
-                del materials[0]  # Delete "in:" or "mm:"
-                if tracing:
-                    print(f"{tracing}{materials=}")
-                if initialize:
-                    material: str
-                    for material in materials:
-                        chip_load_table[material] = []
-
-                # Iterate through each *row* in *chip_load_table*, extracting *diameter*:
-                row_index: int
-                row: str
-                for row_index, row in enumerate(chip_load_data[1:]):
-                    # Split *row* into *columns* and extract the *diameter*:
-                    columns: List[str] = words_split(row)
-                    diameter_text: str = columns[0].strip(" :")
-                    diameter: float
-                    if '/' in diameter_text:
-                        fraction: List[str] = diameter_text.split("/")
-                        diameter = float(fraction[0]) / float(fraction[1]) * convert
-                    else:
-                        diameter = float(diameter_text) * convert
-                    if tracing:
-                        print(f"{tracing}[{row_index}]: {diameter:.3f} '{columns[1:]}'")
-
-                    # The remaining *columns* are chip-load ranges of the form "#-#".
-                    index: int
-                    low_high: str
-                    for index, low_high in enumerate(columns[1:]):
-                        pair: List[str] = low_high.split("-")
-                        assert len(pair) == 2, pair
-                        low: float = float(pair[0]) * convert
-                        high: float = float(pair[1]) * convert
-                        chip_load: float = (high + low) / 2.0
-                        material = materials[index]
-                        chip_load_table[material].append((diameter, chip_load))
-
-                # Now sort the *chip_load_table* entries:
-                diameter_loads: List[Tuple[float, float]]
-                for diameter_loads in chip_load_table.values():
-                    diameter_loads.sort()
+        Arguments:
+        * *chip_load_data* (Sequence[str]): The lines of the chip load data table.
 
+        Returns:
+        * (Tuple[str, ...]): The lower case material names that were loaded.
+
+        """
+        if tracing:
+            print(f"{tracing}=>FabMaterial.loadChipLoadData(*)")
+
+        def words_split(words: str) -> List[str]:
+            """Return the non-empty words in a line."""
+            word: str
+            return [word for word in words.split(" ") if len(word) > 0]
+
+        line: str
+        lines: List[str] = [line for line in chip_load_data
+                            if line.strip() and not line.strip().startswith("#")]
+        if not lines:
+            raise RuntimeError("FabMaterial.loadChipLoadData(): No header line")
+        header: List[str] = words_split(lines[0])
+        units: str = header[0].strip(" :").lower() if header else ""
+        if units not in ("in", "mm"):
+            raise RuntimeError(
+                f"FabMaterial.loadChipLoadData(): Header '{lines[0]}' does not start with "
+                "'in:' or 'mm:'")
+        convert: float = 25.4 if units == "in" else 1.0  # 1 inch = 25.4 mm
+        material: str
+        materials: List[str] = [material.lower() for material in header[1:]]
         if tracing:
-            print(f"{tracing}{chip_load_table=}")
-            print(f"{tracing}<=FabMaterial.__post_init__()")
+            print(f"{tracing}{convert=} {materials=}")
+
+        # Iterate through each *row* in *chip_load_data*, extracting *diameter*:
+        diameter_loads: Dict[str, List[Tuple[float, float]]] = {
+            material: [] for material in materials}
+        energies: Dict[str, float] = {}
+        row_index: int
+        row: str
+        for row_index, row in enumerate(lines[1:]):
+            # Split *row* into *columns* and extract the *diameter*:
+            columns: List[str] = words_split(row)
+            if len(columns) != len(materials) + 1:
+                raise RuntimeError(
+                    f"FabMaterial.loadChipLoadData(): Row '{row}' has {len(columns) - 1} "
+                    f"chip loads instead of {len(materials)}")
+            diameter_text: str = columns[0].strip(" :")
+            energy_text: str
+            if diameter_text.lower() == "energy":
+                for material, energy_text in zip(materials, columns[1:]):
+                    energies[material] = float(energy_text)
+                continue
+            diameter: float
+            if '/' in diameter_text:
+                fraction: List[str] = diameter_text.split("/")
+                diameter = float(fraction[0]) / float(fraction[1]) * convert
+            else:
+                diameter = float(diameter_text) * convert
+            if tracing:
+                print(f"{tracing}[{row_index}]: {diameter:.3f} '{columns[1:]}'")
+
+            # The remaining *columns* are chip-load ranges of the form "#-#".
+            index: int
+            low_high: str
+            for index, low_high in enumerate(columns[1:]):
+                pair: List[str] = low_high.split("-")
+                if len(pair) != 2:
+                    raise RuntimeError(
+                        f"FabMaterial.loadChipLoadData(): '{low_high}' is not of the form "
+                        "'Low-High'")
+                low: float = float(pair[0]) * convert
+                high: float = float(pair[1]) * convert
+                chip_load: float = (high + low) / 2.0
+                diameter_loads[materials[index]].append((diameter, chip_load))
+
+        # Merge into the *chip_load_table* keeping the entries sorted by diameter:
+        chip_load_table: Dict[str, Tuple[Tuple[float, ...], Tuple[float, ...]]] = (
+            FabMaterial._ChipLoadTable)
+        for material in materials:
+            merged: List[Tuple[float, float]] = diameter_loads[material]
+            if material in chip_load_table:
+                diameters, chip_loads = chip_load_table[material]
+                merged.extend(zip(diameters, chip_loads))
+            merged.sort()
+            chip_load_table[material] = (
+                tuple([diameter for diameter, _ in merged]),
+                tuple([chip_load for _, chip_load in merged]))
+        FabMaterial._SpecificCuttingEnergyTable.update(energies)
+
+        if tracing:
+            print(f"{tracing}<=FabMaterial.loadChipLoadData(*)=>{tuple(materials)}")
+        return tuple(materials)
+
+    # FabMaterial.loadChipLoadFile():
+    @staticmethod
+    def loadChipLoadFile(file_path: PathFile, tracing: str = "") -> Tuple[str, ...]:
+        """Merge a chip load data file into the FabMaterial chip load table.
+
+        See FabMaterial.loadChipLoadData() for the file format.
+        """
+        if tracing:
+            print(f"{tracing}<=>FabMaterial.loadChipLoadFile({str(file_path)})")
+        chip_load_file: IO[str]
+        with open(file_path, "r") as chip_load_file:
+            return FabMaterial.loadChipLoadData(
+                chip_load_file.read().splitlines(), tracing=tracing)
 
     # FabMaterial.getChipLoad():
     def getChipLoad(self, effective_diameter: float, tracing: str = "") -> float:
         """Return FabMatrial chip load.
 
+        The chip load table diameters are searched with a bisect.  Normally the chip load
+        for the next smaller table diameter is returned.  When *Interpolate* is True, the
+        chip load is linearly interpolated between the two surrounding table diameters.
+
         Arguments:
         * *effective_diameter* (float): The effective diameter of the tool bit.
 
@@ -356,27 +430,49 @@ class FabMaterial(object):
         """
         if tracing:
             print(f"{tracing}=>FabMaterial.getChipLoad()")
-        chip_load_table: Dict[str, List[Tuple[float, float]]] = FabMaterial._ChipLoadTable
+        chip_load_table: Dict[str, Tuple[Tuple[float, ...], Tuple[float, ...]]] = (
+            FabMaterial._ChipLoadTable)
         top_material: str = self.Name[0].lower()
         if top_material not in chip_load_table:
             raise RuntimeError(f"FabMaterial.getChipLoad(): '{top_material}' "
                                f"is not one of {tuple(chip_load_table.keys())})")
-        diameter_chip_loads: List[Tuple[float, float]] = chip_load_table[top_material]
-        diameter: float
-        chip_load: float
-        for diameter, chip_load in reversed(diameter_chip_loads):
-            if diameter <= effective_diameter:
-                break
-        else:
+        diameters: Tuple[float, ...]
+        chip_loads: Tuple[float, ...]
+        diameters, chip_loads = chip_load_table[top_material]
+        index: int = bisect_right(diameters, effective_diameter) - 1
+        if index < 0:
             raise RuntimeError(
                 f"FabMaterial.getChipLoad('{top_material}') no chip load found "
                 f"for ({effective_diameter:.5f})"
             )
+        chip_load: float = chip_loads[index]
+        if self.Interpolate and index + 1 < len(diameters):
+            low_diameter: float = diameters[index]
+            high_diameter: float = diameters[index + 1]
+            if high_diameter > low_diameter:
+                fraction: float = (effective_diameter - low_diameter) / (
+                    high_diameter - low_diameter)
+                chip_load += fraction * (chip_loads[index + 1] - chip_load)
 
         if tracing:
             print(f"{tracing}=>FabMaterial.getChipLoad()=>{chip_load:.5f}")
         return chip_load
 
+    # FabMaterial.hasSpecificCuttingEnergy():
+    def hasSpecificCuttingEnergy(self) -> bool:
+        """Return True if the FabMaterial has a specific cutting energy."""
+        return self.Name[0].lower() in FabMaterial._SpecificCuttingEnergyTable
+
+    # FabMaterial.getSpecificCuttingEnergy():
+    def getSpecificCuttingEnergy(self) -> float:
+        """Return the FabMaterial specific cutting energy in joules per cubic millimeter."""
+        energy_table: Dict[str, float] = FabMaterial._SpecificCuttingEnergyTable
+        top_material: str = self.Name[0].lower()
+        if top_material not in energy_table:
+            raise RuntimeError(f"FabMaterial.getSpecificCuttingEnergy(): '{top_material}' "
+                               f"is not one of {tuple(energy_table.keys())})")
+        return energy_table[top_material]
+
     # FabMaterial.getHash():
     def getHash(self) -> Tuple[Any, ...]:
         """Return an immutable hash for a FabMaterial."""
@@ -409,6 +505,62 @@ class FabMaterial(object):
         steel: FabMaterial = FabMaterial(("Steel",), "grey")
         check("aluminum1", aluminum, 3.0, 0.02000)
         check("steel", steel, .5 * 25.4, 0.11303)  # TODO(FIX)
+        assert aluminum.getSpecificCuttingEnergy() == 0.7
+
+        # Interpolation falls between the 3mm (.02) and 3.175mm (1/8in: .0365*25.4/2) entries:
+        smooth: FabMaterial = FabMaterial(("Aluminum", "6061"), "silver", Interpolate=True)
+        check("smooth1", smooth, 3.0, 0.02000)
+        eighth_chip_load: float = (0.0025 + 0.0048) / 2.0 * 25.4
+        check("smooth2", smooth, 3.0875, (0.02000 + eighth_chip_load) / 2.0)
+        check("smooth3", smooth, 100.0, aluminum.getChipLoad(100.0))
+        check("smooth4", aluminum, 3.0875, 0.02000)
+
+        # Load an additional material table from a file and restore the tables afterwards:
+        saved_chip_loads: Dict[str, Tuple[Tuple[float, ...], Tuple[float, ...]]] = dict(
+            FabMaterial._ChipLoadTable)
+        saved_energies: Dict[str, float] = dict(FabMaterial._SpecificCuttingEnergyTable)
+        try:
+            temporary_directory: str
+            with tempfile.TemporaryDirectory() as temporary_directory:
+                chip_load_path: PathFile = PathFile(temporary_directory) / "chip_loads.txt"
+                chip_load_file: IO[str]
+                with open(chip_load_path, "w") as chip_load_file:
+                    chip_load_file.write("# Test data\n"
+                                         "    mm: Delrin    Acetal\n"
+                                         "energy: 0.25      0.30\n"
+                                         "     2: 0.04-0.06 0.04-0.06\n"
+                                         "     4: 0.08-0.10 0.08-0.10\n")
+                loaded: Tuple[str, ...] = FabMaterial.loadChipLoadFile(chip_load_path)
+            assert loaded == ("delrin", "acetal"), loaded
+            delrin: FabMaterial = FabMaterial(("Delrin",), "white", Interpolate=True)
+            check("delrin", delrin, 3.0, 0.07)
+            FabMaterial.loadChipLoadData(["mm: Delrin", "8: 0.20-0.20"])  # Merge with existing
+            check("merged1", delrin, 3.0, 0.07)
+            check("merged2", delrin, 6.0, 0.145)
+            assert delrin.getSpecificCuttingEnergy() == 0.25
+            acetal: FabMaterial = FabMaterial(("Acetal",), "white")
+            assert acetal.getSpecificCuttingEnergy() == 0.30
+            FabMaterial.loadChipLoadData(["mm: Nylon", "2: 0.04-0.06"])  # No cutting energy
+            nylon: FabMaterial = FabMaterial(("Nylon",), "white")
+            assert delrin.hasSpecificCuttingEnergy() and not nylon.hasSpecificCuttingEnergy()
+            try:
+                FabMaterial.loadChipLoadData(["ft: Wood", "1: 1-2"])
+                assert False
+            except RuntimeError as runtime_error:
+                assert "does not start with 'in:' or 'mm:'" in str(runtime_error), (
+                    str(runtime_error))
+            try:
+                FabMaterial.loadChipLoadData(["mm: Wood Plastic", "1: 1-2"])
+                assert False
+            except RuntimeError as runtime_error:
+                assert "has 1 chip loads instead of 2" in str(runtime_error), str(runtime_error)
+        finally:
+            FabMaterial._ChipLoadTable.clear()
+            FabMaterial._ChipLoadTable.update(saved_chip_loads)
+            FabMaterial._SpecificCuttingEnergyTable.clear()
+            FabMaterial._SpecificCuttingEnergyTable.update(saved_energies)
+        assert "delrin" not in FabMaterial._ChipLoadTable
+        assert steel.getSpecificCuttingEnergy() == 2.7
 
         # Do exception tests:
         unobtainium: FabMaterial = FabMaterial(("Unobtainium",), "grey")
@@ -424,11 +576,22 @@ class FabMaterial(object):
         except RuntimeError as runtime_error:
             expected: str = "FabMaterial.getChipLoad('aluminum') no chip load found for (0.10000)"
             assert str(runtime_error) == expected
+        try:
+            unobtainium.getSpecificCuttingEnergy()
+            assert False
+        except RuntimeError as runtime_error:
+            assert str(runtime_error).startswith(
+                "FabMaterial.getSpecificCuttingEnergy(): 'unobtainium' is not one of (")
 
         if tracing:
             print(f"{tracing}<=FabMaterial._unit_tests()")
 
 
+# Build the chip load table once when the module is imported:
+FabMaterial.loadChipLoadData(FabMaterial._InchChipLoadData)
+FabMaterial.loadChipLoadData(FabMaterial._MmChipLoadData)
+
+
 # FabToolController:
 @dataclass(frozen=True)
 class FabToolController(object):
@@ -445,6 +608,11 @@ class FabToolController(object):
     * *VerticalFeed* (float): The material vertical free rate in mm/sec.
     * *VerticalRapid* (float): The vertical rapid feed rate in mm/sec.
 
+    FabToolController's are used as dictionary keys in the ToolControllersTable, so the hash
+    is computed once when the FabToolController is created.  FabToolController.intern() returns
+    a single shared FabToolController for all equal ones, which lets dictionary lookups succeed
+    on object identity without comparing every attribute.
+
     """
 
     BitName: str
@@ -456,6 +624,12 @@ class FabToolController(object):
     ToolNumber: int
     VerticalFeed: float
     VerticalRapid: float
+    _Hash: int = field(init=False, repr=False, compare=False)
+
+    # Shared across all FabToolController's:
+    _Interned: ClassVar[Dict["FabToolController", "FabToolController"]] = {}
+    _ComputeCache: ClassVar[Dict[Tuple[Any, ...], Tuple[Any, ...]]] = {}
+    _CacheHits: ClassVar[List[int]] = [0, 0]  # [hits, misses]
 
     # FabToolController.__post_init__():
     def __post_init__(self) -> None:
@@ -469,6 +643,37 @@ class FabToolController(object):
         check_type("FabToolController.ToolNumber", self.ToolNumber, int)
         check_type("FabToolController.VerticalFeed", self.VerticalFeed, float)
         check_type("FabToolController.VerticalRapid", self.VerticalRapid, float)
+        object.__setattr__(self, "_Hash", hash((
+            self.BitName, self.Cooling, self.HorizontalFeed, self.HorizontalRapid,
+            self.SpindleDirection, self.SpindleSpeed, self.ToolNumber, self.VerticalFeed,
+            self.VerticalRapid)))
+
+    # FabToolController.__hash__():
+    def __hash__(self) -> int:
+        """Return the precomputed FabToolController hash."""
+        return self._Hash
+
+    # FabToolController.intern():
+    @staticmethod
+    def intern(tool_controller: "FabToolController") -> "FabToolController":
+        """Return the shared FabToolController that is equal to a FabToolController."""
+        interned: Dict[FabToolController, FabToolController] = FabToolController._Interned
+        shared: FabToolController = interned.setdefault(tool_controller, tool_controller)
+        return shared
+
+    # FabToolController.getCacheStatistics():
+    @staticmethod
+    def getCacheStatistics() -> Tuple[int, int]:
+        """Return the FabToolController.computeToolController() cache (hits, misses)."""
+        return (FabToolController._CacheHits[0], FabToolController._CacheHits[1])
+
+    # FabToolController.clearCache():
+    @staticmethod
+    def clearCache() -> None:
+        """Clear the FabToolController.computeToolController() cache and interned table."""
+        FabToolController._Interned.clear()
+        FabToolController._ComputeCache.clear()
+        FabToolController._CacheHits[:] = [0, 0]
 
     # FabToolController.to_json():
     def to_json(self) -> Dict[str, Any]:
@@ -492,6 +697,12 @@ class FabToolController(object):
     ) -> Tuple["FabToolController", float]:
         """Return FabToolController for given FabCNC, FabMaterial and Fab_ShopBit.
 
+        The result only depends upon the material, the Fab_ShopBit (which includes its machine)
+        and the desired depth, so it is memoized.  Since Fab_ShopBit's are shared by all of the
+        operations in a FabProject, the key uses the Fab_ShopBit identity and the cache entry
+        keeps the Fab_ShopBit alive so that the identity is never reused.  The returned
+        FabToolController is interned (see FabToolController.intern().)
+
         Arguments:
         * *material* (FabMaterial): The material to use.
         * *shop_bit* (Fab_ShopBit): The Fab_ShopBit to use.
@@ -503,6 +714,27 @@ class FabToolController(object):
 
         """
         assert check_argument_types(), "FabToolController.from"
+        key: Tuple[Any, ...] = (material.Name, material.Interpolate, id(shop_bit), desired_depth)
+        cache: Dict[Tuple[Any, ...], Tuple[Any, ...]] = FabToolController._ComputeCache
+        if key in cache:
+            FabToolController._CacheHits[0] += 1
+            _, cached_tool_controller, cached_depth = cache[key]
+            return (cached_tool_controller, cached_depth)
+        FabToolController._CacheHits[1] += 1
+        tool_controller: FabToolController
+        maximum_depth: float
+        tool_controller, maximum_depth = FabToolController._computeToolController(
+            material, shop_bit, desired_depth)
+        tool_controller = FabToolController.intern(tool_controller)
+        cache[key] = (shop_bit, tool_controller, maximum_depth)
+        return (tool_controller, maximum_depth)
+
+    # FabToolController._computeToolController()
+    @staticmethod
+    def _computeToolController(
+            material: FabMaterial, shop_bit: Fab_ShopBit, desired_depth: float,
+    ) -> Tuple["FabToolController", float]:
+        """Return the uncached FabToolController.computeToolController() result."""
         machine: FabMachine = shop_bit.Machine
         bit: FabBit = shop_bit.Bit
         is_drill: bool = isinstance(bit, FabDrillBit)
@@ -511,20 +743,38 @@ class FabToolController(object):
         flutes: int = 2 if is_drill else int(bit.getNumber("Flutes"))
         chip_load: float = material.getChipLoad(diameter)
 
-        # TODO: Deal with power limits here.
-        # CNC machines do not have inifite spindle power.  For soft materials (e.g. plastic)
-        # the CNC machine will go to maximum speed depth remove a lot of material quickly.
-        # For harder materials the chip load goes down *AND* the power required to cut each
-        # chip goes up.  By the way `diameter / 3.0` is a heuristic.
         assert isinstance(machine, FabCNC)
-        maximum_depth: float = min(cutting_edge_height, desired_depth, diameter / 3.0)
         maximum_spindle_speed: int = machine.getMaximumSpindleSpeed()
         horizontal_rapid: float = machine.getHorizontalRapidFeed()
         vertical_rapid: float = machine.getVerticalRapidFeed()
-
-        # See [Table Feed]
-        # (https://www.machiningdoctor.com/calculators/milling-calculators-2/#table-fead)
-        horizontal_feed: float = min(horizontal_rapid, maximum_spindle_speed * flutes * chip_load)
+        spindle: FabSpindle = machine.Spindle
+        maximum_depth: float
+        spindle_speed: int
+        horizontal_feed: float
+        if (spindle.Power > 0.0 or spindle.Torque > 0.0) and material.hasSpecificCuttingEnergy():
+            # CNC machines do not have infinite spindle power.  For soft materials (e.g. plastic)
+            # the CNC machine can go to maximum speed and depth to remove a lot of material
+            # quickly.  For harder materials the power and torque needed for each chip goes up.
+            # Drills keep the `diameter / 3.0` peck depth heuristic; end mills are limited to
+            # a full diameter slot.  maximizeRemovalRate() works in mm/min, so the mm/sec
+            # horizontal rapid is converted on the way in and the feed on the way out.
+            depth_limit: float = min(
+                cutting_edge_height, desired_depth, diameter / 3.0 if is_drill else diameter)
+            feed_per_minute: float
+            spindle_speed, feed_per_minute, maximum_depth = (
+                FabToolController.maximizeRemovalRate(
+                    diameter, flutes, chip_load, depth_limit,
+                    material.getSpecificCuttingEnergy(), spindle.Power, spindle.Torque,
+                    maximum_spindle_speed, 60.0 * horizontal_rapid, is_drill))
+            horizontal_feed = feed_per_minute / 60.0
+        else:
+            # No spindle power (or material cutting energy) information; use maximum speed and
+            # the `diameter / 3.0` heuristic.
+            maximum_depth = min(cutting_edge_height, desired_depth, diameter / 3.0)
+            spindle_speed = maximum_spindle_speed
+            # See [Table Feed]
+            # (https://www.machiningdoctor.com/calculators/milling-calculators-2/#table-fead)
+            horizontal_feed = min(horizontal_rapid, maximum_spindle_speed * flutes * chip_load)
         vertical_feed: float = horizontal_feed / 4.0  # Heuristic
         tool_controller: FabToolController = FabToolController(
             BitName=bit.Name,
@@ -532,13 +782,71 @@ class FabToolController(object):
             HorizontalFeed=horizontal_feed,
             HorizontalRapid=horizontal_rapid,
             SpindleDirection=True,
-            SpindleSpeed=maximum_spindle_speed,
+            SpindleSpeed=spindle_speed,
             ToolNumber=shop_bit.ToolNumber,
             VerticalFeed=vertical_feed,
             VerticalRapid=vertical_rapid
         )
         return (tool_controller, maximum_depth)
 
+    # FabToolController.maximizeRemovalRate():
+    @staticmethod
+    def maximizeRemovalRate(
+            diameter: float, flutes: int, chip_load: float, maximum_depth: float,
+            specific_energy: float, power: float, torque: float,
+            maximum_speed: int, maximum_feed: float, is_drill: bool) -> Tuple[int, float, float]:
+        """Return the spindle speed, feed and depth of cut that maximize material removal rate.
+
+        The material removal rate (MRR) in mm^3/sec is the cut cross section times the feed.
+        For an end mill the cross section is the depth of cut times the diameter (i.e. a full
+        slot.)  For a drill the cross section is the drill area and does not depend upon depth.
+        The spindle power needed is the specific cutting energy times MRR and the spindle torque
+        needed is the energy per revolution divided by 2*pi radians.  Torque does not depend
+        upon spindle speed, so it limits the end mill depth of cut (or the drill chip load.)
+        Power is proportional to both depth and speed, so the depth is kept as deep as possible
+        and the spindle speed is reduced until the power limit is met.
+
+        Arguments:
+        * *diameter* (float): The tool diameter in millimeters.
+        * *flutes* (int): The number of tool flutes.
+        * *chip_load* (float): The desired chip load in millimeters per tooth.
+        * *maximum_depth* (float): The maximum permitted depth of cut in millimeters.
+        * *specific_energy* (float): The material specific cutting energy in J/mm^3.
+        * *power* (float): The spindle power in watts (0.0 for unlimited.)
+        * *torque* (float): The spindle torque in newton meters (0.0 for unlimited.)
+        * *maximum_speed* (int): The maximum spindle speed in RPM.
+        * *maximum_feed* (float): The maximum feed in mm/min.
+        * *is_drill* (bool): True for a drill and False for an end mill.
+
+        Returns:
+        * (int): The spindle speed in RPM.
+        * (float): The feed in mm/min.
+        * (float): The depth of cut in millimeters.
+
+        """
+        depth: float = maximum_depth
+        drill_area: float = math.pi * diameter * diameter / 4.0
+
+        # Limit the depth of cut (or drill chip load) by spindle *torque*:
+        if torque > 0.0:
+            torque_energy: float = 2.0 * math.pi * torque  # Maximum joules per revolution
+            if is_drill:
+                chip_load = min(
+                    chip_load, torque_energy / (specific_energy * drill_area * flutes))
+            else:
+                depth = min(
+                    depth, torque_energy / (specific_energy * diameter * flutes * chip_load))
+
+        # Limit the spindle speed by the *maximum_feed* and then by spindle *power*:
+        speed: float = min(float(maximum_speed), maximum_feed / (flutes * chip_load))
+        if power > 0.0:
+            section: float = drill_area if is_drill else depth * diameter
+            energy_per_revolution: float = specific_energy * section * flutes * chip_load  # J
+            speed = min(speed, 60.0 * power / energy_per_revolution)
+        spindle_speed: int = max(1, int(speed))
+        feed: float = spindle_speed * flutes * chip_load
+        return (spindle_speed, feed, depth)
+
     # FabToolController._unit_tests()
     @staticmethod
     def _unit_tests(tracing: str = "") -> None:
@@ -609,6 +917,117 @@ class FabToolController(object):
         assert tool_controller2 in tool_controller_table, "Insert failed"
         assert len(tool_controller_table) == 2, "Table is wrong size"
 
+        def removal_check(power: float, torque: float, specific_energy: float,
+                          is_drill: bool, desired: Tuple[int, float, float]) -> None:
+            """Verify FabToolController.maximizeRemovalRate() stays within the limits."""
+            diameter: float = 6.0
+            flutes: int = 2
+            chip_load: float = 0.03
+            speed: int
+            feed: float
+            depth: float
+            speed, feed, depth = FabToolController.maximizeRemovalRate(
+                diameter, flutes, chip_load, 6.0, specific_energy, power, torque,
+                24000, 2000.0, is_drill)
+            assert speed == desired[0], (speed, desired)
+            assert abs(feed - desired[1]) < 1.0e-6, (feed, desired)
+            assert abs(depth - desired[2]) < 1.0e-6, (depth, desired)
+            assert feed <= 2000.0 and speed <= 24000 and depth <= 6.0
+            section: float = math.pi * diameter * diameter / 4.0 if is_drill else depth * diameter
+            removal_rate: float = section * feed / 60.0  # mm^3/sec
+            if power > 0.0:
+                assert specific_energy * removal_rate <= power * (1.0 + 1.0e-6), removal_rate
+            if torque > 0.0:
+                needed_torque: float = (
+                    specific_energy * removal_rate / (2.0 * math.pi * speed / 60.0))
+                assert needed_torque <= torque * (1.0 + 1.0e-6), needed_torque
+
+        # Aluminum on a 1.5kW spindle is spindle speed limited at full depth:
+        removal_check(1500.0, 0.0, 0.7, False, (24000, 1440.0, 6.0))
+        # Steel on a 500W spindle is power limited: 60 * 500 / (2.7 * 6 * 6 * 2 * .03) RPM:
+        removal_check(500.0, 0.0, 2.7, False, (5144, 5144 * 2 * 0.03, 6.0))
+        # A low torque spindle limits the depth of cut: 2 * pi * 0.5 / (2.7 * 6 * 2 * .03):
+        removal_check(0.0, 0.5, 2.7, False, (24000, 1440.0, 2.0 * math.pi * 0.5 / 0.972))
+        # Drills are power limited by their area: 60 * 500 / (2.7 * 9 * pi * 2 * .03):
+        removal_check(500.0, 0.0, 2.7, True, (6549, 6549 * 2 * 0.03, 6.0))
+
+        # Equal FabToolController's intern to the same object:
+        FabToolController.clearCache()
+        assert FabToolController.intern(tool_controller1a) is tool_controller1a
+        assert FabToolController.intern(tool_controller1b) is tool_controller1a
+        assert FabToolController.intern(tool_controller2) is tool_controller2
+        assert hash(tool_controller1a) == hash(tool_controller1b)
+
+        table: Dict[FabToolController, int] = {tool_controller1a: 0}
+        assert table[FabToolController.intern(tool_controller1b)] == 0
+        assert FabToolController.getCacheStatistics() == (0, 0)
+        FabToolController.clearCache()
+        assert FabToolController.intern(tool_controller1b) is tool_controller1b
+
+        # A 200W spindle with 50mm/sec X/Y rapids cutting HDPE with a 5mm 2 flute end mill.
+        # The 3000mm/min rapid permits 3000 / (2 * .075) = 20000 RPM and the full 5mm deep slot
+        # needs .2 * 5 * 5 * 2 * .075 = .75 joules per revolution, so the power limits the
+        # spindle to 60 * 200 / .75 = 16000 RPM and the feed to 16000 * 2 * .075 / 60 mm/sec:
+        end_mill: FabEndMillBit = FabEndMillBit.getExample()
+        axis: str
+        feed: float
+        cnc: FabCNC = FabCNC(
+            Name="TestCNC", Placement="", Axes=tuple([
+                FabAxis(Name=f"{axis} Axis", Letter=axis, Linear=True, Range=500.0,
+                        Feed=feed, Acceleration=0.0, EndSensors=True, Brake=False)
+                for axis, feed in (("X", 50.0), ("Y", 50.0), ("Z", 20.0))]),
+            Table=FabTable("TestTable", 100.0, 50.0, 30.0, 4, 10.0, 5.0, 5.0, 10.0, 5.0),
+            Spindle=FabSpindle(Type="ER20", Speed=24000, Reversible=True, FloodCooling=True,
+                               MistCooling=False, Power=200.0, Torque=0.5),
+            Controller=FabController("TestController", "linuxcnc"),
+            Library=FabLibrary("TestLibrary", ((1, end_mill),)))
+        shop: FabShop = FabShop(
+            Name="TestShop", Location=FabLocation.getExample(), Machines=(cnc,))
+        shop_bit: Fab_ShopBit = Fab_ShopBit(-1.0, shop, 0, cnc, 0, end_mill, 1)
+        hdpe: FabMaterial = FabMaterial(("Plastic", "HDPE"), "red")
+        FabToolController.clearCache()
+        powered_controller: FabToolController
+        powered_depth: float
+        powered_controller, powered_depth = FabToolController.computeToolController(
+            hdpe, shop_bit, 10.0)
+        spindle_speed: float = powered_controller.SpindleSpeed
+        assert 15999 <= spindle_speed <= 16000, powered_controller  # int() truncation
+        assert abs(powered_controller.HorizontalFeed - spindle_speed * 2 * .075 / 60.0) < 1.0e-9
+        assert abs(powered_controller.HorizontalFeed - 40.0) < 0.01, powered_controller
+        assert abs(powered_controller.VerticalFeed - 10.0) < 0.01, powered_controller
+        assert powered_controller.HorizontalRapid == 50.0, powered_controller
+        assert powered_controller.VerticalRapid == 20.0, powered_controller
+        assert powered_depth == 5.0, powered_depth
+        assert FabToolController.getCacheStatistics() == (0, 1)
+
+        # The same (material, shop_bit, depth) is a cache hit and a new depth is a cache miss:
+        cached_controller: FabToolController
+        cached_depth: float
+        cached_controller, cached_depth = FabToolController.computeToolController(
+            hdpe, shop_bit, 10.0)
+        assert cached_controller is powered_controller and cached_depth == powered_depth
+        assert FabToolController.getCacheStatistics() == (1, 1)
+        FabToolController.computeToolController(hdpe, shop_bit, 2.0)
+        assert FabToolController.getCacheStatistics() == (1, 2)
+
+        # A material without a specific cutting energy falls back to the unpowered heuristics:
+        saved_chip_loads: Dict[str, Tuple[Tuple[float, ...], Tuple[float, ...]]] = dict(
+            FabMaterial._ChipLoadTable)
+        try:
+            FabMaterial.loadChipLoadData(["mm: Nylon", "2: 0.04-0.06"])
+            nylon: FabMaterial = FabMaterial(("Nylon",), "white")
+            nylon_controller: FabToolController
+            nylon_depth: float
+            nylon_controller, nylon_depth = FabToolController.computeToolController(
+                nylon, shop_bit, 10.0)
+            assert nylon_controller.SpindleSpeed == 24000, nylon_controller
+            assert abs(nylon_depth - 5.0 / 3.0) < 1.0e-9, nylon_depth
+        finally:
+            FabMaterial._ChipLoadTable.clear()
+            FabMaterial._ChipLoadTable.update(saved_chip_loads)
+        FabToolController.clearCache()
+        assert FabToolController.getCacheStatistics() == (0, 0)
+
         if tracing:
             print(f"{tracing}<=FabToolController._unit_tests()")
 
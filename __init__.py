@@ -237,6 +237,9 @@ Additional Python modules are:
 * [FabJoins](docs/FabJoins.md):
   Classes for defining fastener stacks of screws, bolts, washers, nuts, etc.
 
+* [FabGCodes](docs/FabGCodes.md):
+  Native G-code generation for drilling and simple contours without FreeCAD.
+
 * [Doc](docs/Doc.md):
   A program for reading Python files and generating HTML documentation.
 
@@ -710,8 +713,9 @@ Since Python does not like to have import loops, the modules are ordered from lo
 The higher level modules can import the lower level ones, but not vice versa.  The ordering
 from lowest to highest below:
 
+* FabJsonNodes: (only the private Fab_JsonNodeReader, which FabCNC also imports)
 * FabUtilities: FabColor, FabToolController, FabMaterial
-* FabFabNodes: FabNode, FabBox (and some private classes)
+* FabFabNodes: FabNode, FabBox, FabWorkspace (and some private classes)
 * FabToolTemplates:
   FabShape, FabShapes, FabAttributes, FabBit, FabBitTemplate FabBitTemplates, FabBitTemplatesFactory
 * FabToolBits: FabBallEndBit, ..., FabVBit
@@ -722,6 +726,7 @@ from lowest to highest below:
 * FabJoins: FabJoin, FabFasten, FabWasher, FabNut, FabHead, FabOption
 * FabGeometries: FabPolygon, FabCircle, FabGeometry
 * FabSolids: FabSolid, FabMount, FabStock
+* FabGCodes: FabGCodeEmitter, FabGCodeAnalyzer, FabGCodeAnalysis
 * FabProjects: FabProject, FabDocument, FabAssembly
 
 Note this table will almost certainly become out of date, but it gives a general idea of
@@ -6,11 +6,17 @@
 # specified, the documents are read into FreeCAD for visualization purposes.
 #
 # Usage:
-#     fabcnc.sh [-v|--visual] [-c|-cnc] FAB.json"
+#     fabcnc.sh [-v|--visual] [-c|-cnc] [-i|--incremental] [-j|--jobs N] [-t|--trace LEVEL]
+#         [-o|--output DIR] [--cache DIR] FAB.json"
 #
 # where:
 #     -v|--visual specifies visual mode.
 #     -c|--cnc specifies the CNC mode.
+#     -i|--incremental only regenerates solids that changed since the previous run.
+#     -j|--jobs N runs up to N FreeCAD worker processes, one per document (non-visual only).
+#     -t|--trace LEVEL traces into OUTPUT/cnc.trace (1=document summary, 2=full call tracing).
+#     -o|--output DIR writes the .ngc and debug files into DIR (default: the FAB.json directory).
+#     --cache DIR keeps the shared G-code cache in DIR/ngc_cache (default: /tmp).
 #     FAB.json specifies the JSON file to use.
 #
 # It is further assumed that the required STEP files are in the same directory as the JSON file.
@@ -25,6 +31,10 @@ FLAGS=""
 VISUAL=""
 CNC=""
 JSON=""
+JOBS="1"
+TRACE="0"
+OUTPUT=""
+CACHE="/tmp"
 while [[ $# -gt 0 ]]; do
     case "$1" in
 	-c|--cnc)
@@ -32,6 +42,30 @@ while [[ $# -gt 0 ]]; do
             FLAGS+="c"
 	    shift
 	    ;;
+	-i|--incremental)
+	    FLAGS+="i"
+	    shift
+	    ;;
+	--cache)
+	    CACHE="$2"
+	    shift
+	    shift
+	    ;;
+	-o|--output)
+	    OUTPUT="$2"
+	    shift
+	    shift
+	    ;;
+	-j|--jobs)
+	    JOBS="$2"
+	    shift
+	    shift
+	    ;;
+	-t|--trace)
+	    TRACE="$2"
+	    shift
+	    shift
+	    ;;
 	-v|--visual)
 	    VISUAL="$1"
 	    FLAGS+="v"
@@ -62,6 +96,10 @@ if [[ "${VISUAL}" == "" && "${CNC}" == "" ]]; then
     exit 1
 fi
 
+if [[ "${OUTPUT}" == "" ]]; then
+    OUTPUT="$(dirname -- "${JSON}")"
+fi
+
 # Select which FreeCAD to use:
 FREECAD="freecad"
 if [[ -x "freecad19" ]]; then
@@ -75,6 +113,10 @@ if false; then
     echo "CNC='${CNC}'"
     echo "FLAGS='${FLAGS}'"
     echo "JSON='${JSON}'"
+    echo "JOBS='${JOBS}'"
+    echo "TRACE='${TRACE}'"
+    echo "OUTPUT='${OUTPUT}'"
+    echo "CACHE='${CACHE}'"
     echo "FREECAD='${FREECAD}'"
 fi
 
@@ -91,11 +133,12 @@ if [[ "${VISUAL}" == "" ]]; then
     echo "Non visual mode"
     # echo FLAGS="${FLAGS}" JSON="${JSON}" \
     #    "${FREECAD}" -M "${SCRIPT_DIR}" -c "${SCRIPT_DIR}/FabCNC.py"
-    FLAGS="${FLAGS}" JSON="${JSON}" \
+    FLAGS="${FLAGS}" JSON="${JSON}" JOBS="${JOBS}" TRACE="${TRACE}" OUTPUT="${OUTPUT}" \
+       CACHE="${CACHE}" FREECAD="$(command -v "${FREECAD}")" \
        "${FREECAD}" -M "${SCRIPT_DIR}" -c "${SCRIPT_DIR}/FabCNC.py"
 else
     # Visual_mode:
     echo "Visual mode"
-    FLAGS="${FLAGS}" JSON="${JSON}" \
+    FLAGS="${FLAGS}" JSON="${JSON}" TRACE="${TRACE}" OUTPUT="${OUTPUT}" CACHE="${CACHE}" \
 	   "${FREECAD}" -M "${SCRIPT_DIR}" "${SCRIPT_DIR}/FabCNC.FCMacro"
 fi